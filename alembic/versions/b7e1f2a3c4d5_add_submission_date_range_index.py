@@ -0,0 +1,30 @@
+"""Add composite index for submission date-range queries
+
+Revision ID: b7e1f2a3c4d5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1f2a3c4d5'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves WHERE user_id = ? AND submitted_at BETWEEN ? AND ? ORDER BY submitted_at DESC
+    op.create_index(
+        'idx_submissions_user_submitted_at',
+        'submissions',
+        ['user_id', sa.text('submitted_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_submissions_user_submitted_at', table_name='submissions')
@@ -0,0 +1,70 @@
+"""Add maintained task and user submission aggregate tables
+
+Revision ID: c3d9a1e7b2f4
+Revises: b7e1f2a3c4d5
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9a1e7b2f4'
+down_revision: Union[str, None] = 'b7e1f2a3c4d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_evaluation_stats',
+        sa.Column('task_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('learning_tasks.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('passed_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('scored_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('score_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('max_score', sa.Float(), nullable=True),
+        sa.Column('min_score', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+    
+    op.create_table(
+        'user_progress_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('passed_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('scored_submissions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('score_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('total_execution_time_ms', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+    
+    # Backfill from existing submissions
+    op.execute("""
+        INSERT INTO task_evaluation_stats
+            (task_id, total_submissions, passed_submissions, scored_submissions,
+             score_sum, max_score, min_score)
+        SELECT task_id, COUNT(id), COUNT(*) FILTER (WHERE status = 'PASS'), COUNT(score),
+               COALESCE(SUM(score), 0), MAX(score), MIN(score)
+        FROM submissions
+        GROUP BY task_id
+    """)
+    op.execute("""
+        INSERT INTO user_progress_stats
+            (user_id, total_submissions, passed_submissions, scored_submissions,
+             score_sum, total_execution_time_ms)
+        SELECT user_id, COUNT(id), COUNT(*) FILTER (WHERE status = 'PASS'), COUNT(score),
+               COALESCE(SUM(score), 0), COALESCE(SUM(execution_time_ms), 0)
+        FROM submissions
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_progress_stats')
+    op.drop_table('task_evaluation_stats')
@@ -0,0 +1,37 @@
+"""Extend the submission date index with id for keyset pagination
+
+Revision ID: d5f8b2c6a9e1
+Revises: c3d9a1e7b2f4
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f8b2c6a9e1'
+down_revision: Union[str, None] = 'c3d9a1e7b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves WHERE user_id = ? AND (submitted_at, id) < (?, ?) ORDER BY submitted_at DESC, id DESC
+    # as well as the date-range queries the previous definition served
+    op.drop_index('idx_submissions_user_submitted_at', table_name='submissions')
+    op.create_index(
+        'idx_submissions_user_submitted_at',
+        'submissions',
+        ['user_id', sa.text('submitted_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_submissions_user_submitted_at', table_name='submissions')
+    op.create_index(
+        'idx_submissions_user_submitted_at',
+        'submissions',
+        ['user_id', sa.text('submitted_at DESC')]
+    )
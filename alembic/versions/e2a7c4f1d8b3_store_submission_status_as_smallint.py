@@ -0,0 +1,47 @@
+"""Store submission status as SMALLINT and add a (user_id, status) index
+
+Revision ID: e2a7c4f1d8b3
+Revises: d5f8b2c6a9e1
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c4f1d8b3'
+down_revision: Union[str, None] = 'd5f8b2c6a9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Codes match SubmissionStatus.to_int(): FAIL=0, PASS=1, PARTIAL=2
+    op.execute("ALTER TABLE submissions ALTER COLUMN status DROP DEFAULT")
+    op.execute("""
+        ALTER TABLE submissions ALTER COLUMN status TYPE SMALLINT USING
+            CASE status WHEN 'PASS' THEN 1 WHEN 'PARTIAL' THEN 2 ELSE 0 END
+    """)
+    op.execute("ALTER TABLE submissions ALTER COLUMN status SET DEFAULT 0")
+    op.execute("DROP TYPE IF EXISTS submissionstatus")
+
+    # Serves status-filtered evaluation listings, including the FAIL-only mistake review
+    op.create_index(
+        'idx_submissions_user_status',
+        'submissions',
+        ['user_id', 'status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_submissions_user_status', table_name='submissions')
+
+    postgresql.ENUM('PASS', 'FAIL', 'PARTIAL', name='submissionstatus').create(op.get_bind())
+    op.execute("ALTER TABLE submissions ALTER COLUMN status DROP DEFAULT")
+    op.execute("""
+        ALTER TABLE submissions ALTER COLUMN status TYPE submissionstatus USING
+            (CASE status WHEN 1 THEN 'PASS' WHEN 2 THEN 'PARTIAL' ELSE 'FAIL' END)::submissionstatus
+    """)
+    op.execute("ALTER TABLE submissions ALTER COLUMN status SET DEFAULT 'FAIL'")
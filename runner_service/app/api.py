@@ -178,8 +178,8 @@ async def validate_language(language: str):
 async def validate_code(request: CodeExecutionRequest):
     """Validate code for security violations without executing it."""
     try:
-        from src.domain.entities.code_execution import ProgrammingLanguage
-        from src.domain.services.security_validator import SecurityValidator
+        from src.domain.entities.code_execution import ProgrammingLanguage, Severity
+        from src.domain.services import security_validator
         
         # Convert language
         try:
@@ -191,8 +191,7 @@ async def validate_code(request: CodeExecutionRequest):
             )
         
         # Validate code
-        validator = SecurityValidator()
-        violations = validator.validate_code(request.code, language)
+        violations = await security_validator.validate_code_async(request.code, language)
         
         # Convert violations to response format
         security_violations = [
@@ -205,12 +204,14 @@ async def validate_code(request: CodeExecutionRequest):
             for v in violations
         ]
         
-        is_safe = validator.is_code_safe(request.code, language)
+        # Judge safety from the scan above rather than rescanning the code;
+        # like /execute, only critical violations make code unsafe
+        is_safe = not any(v.severity is Severity.CRITICAL for v in violations)
         
         return {
             "safe": is_safe,
             "violations": security_violations,
-            "blocked_imports": validator.get_blocked_imports(language),
+            "blocked_imports": sorted(security_validator.get_blocked_imports(language)),
             "message": "Code is safe to execute" if is_safe else "Code contains security violations"
         }
         
@@ -4,7 +4,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Tuple
 from uuid import uuid4
 
 # Add project root to path
@@ -96,7 +96,8 @@ except ImportError as e:
             return {}
     
     class ICodeExecutionService:
-        pass
+        def is_language_supported(self, language):
+            return language in self._supported_set
 
 
 logger = logging.getLogger(__name__)
@@ -107,6 +108,9 @@ class CodeExecutionService(ICodeExecutionService):
     
     def __init__(self):
         self.code_runner = SecureCodeRunner()
+        # The runner's languages are fixed once it is built, so cache them here
+        self._supported_languages = tuple(self.code_runner.get_supported_languages())
+        self._supported_language_set = frozenset(self._supported_languages)
     
     async def execute_code(self, request: CodeExecutionRequest) -> CodeExecutionResponse:
         """Execute code using the secure code runner."""
@@ -179,18 +183,19 @@ class CodeExecutionService(ICodeExecutionService):
             created_at=getattr(domain_result, 'created_at', datetime.utcnow())
         )
     
-    def get_supported_languages(self) -> List:
-        """Get list of supported programming languages."""
-        return self.code_runner.get_supported_languages()
+    def get_supported_languages(self) -> Tuple:
+        """Get the cached tuple of supported programming languages."""
+        return self._supported_languages
     
-    def is_language_supported(self, language) -> bool:
-        """Check if a programming language is supported."""
-        return self.code_runner.is_language_supported(language)
+    @property
+    def _supported_set(self) -> FrozenSet:
+        """Supported languages as a cached frozenset."""
+        return self._supported_language_set
     
     def get_language_info(self) -> List[LanguageInfoResponse]:
         """Get detailed information about supported languages."""
         try:
-            supported_languages = self.code_runner.get_supported_languages()
+            supported_languages = self._supported_languages
             language_configs = getattr(self.code_runner, 'language_configs', {})
             
             language_info = []
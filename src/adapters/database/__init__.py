@@ -3,7 +3,7 @@
 from .config import Base, DatabaseManager, get_database_manager, get_db_session
 from .models import (
     User, LearningProfile, LearningPlan, LearningModule, LearningTask,
-    Submission, Evaluation, ProgressTracking
+    Submission, Evaluation, ProgressTracking, TaskEvaluationStats, UserProgressStats
 )
 from .settings import DatabaseSettings
 from .migration_manager import (
@@ -25,6 +25,8 @@ __all__ = [
     "Submission",
     "Evaluation",
     "ProgressTracking",
+    "TaskEvaluationStats",
+    "UserProgressStats",
     "MigrationManager",
     "initialize_database",
     "upgrade_database",
@@ -3,7 +3,7 @@
 import os
 from typing import AsyncGenerator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -34,8 +34,7 @@ class DatabaseManager:
                 self.settings.async_database_url,
                 echo=self.settings.echo_sql,
                 pool_pre_ping=True,
-                pool_recycle=3600,
-                **self._get_engine_kwargs()
+                **self._get_async_engine_kwargs()
             )
         return self._async_engine
     
@@ -47,7 +46,6 @@ class DatabaseManager:
                 self.settings.database_url,
                 echo=self.settings.echo_sql,
                 pool_pre_ping=True,
-                pool_recycle=3600,
                 **self._get_engine_kwargs()
             )
             # Setup SQLite pragma if needed
@@ -80,7 +78,7 @@ class DatabaseManager:
     
     def _get_engine_kwargs(self) -> dict:
         """Get engine-specific configuration."""
-        kwargs = {}
+        kwargs = {"pool_recycle": self.settings.pool_recycle}
         
         # Test environment configuration
         if self.settings.environment == "test":
@@ -88,6 +86,25 @@ class DatabaseManager:
                 "poolclass": StaticPool,
                 "connect_args": {"check_same_thread": False},
             })
+        elif self.settings.is_postgresql:
+            # Repositories share this pool; size it from settings
+            kwargs.update({
+                "pool_size": self.settings.pool_size,
+                "max_overflow": self.settings.max_overflow,
+                "pool_timeout": self.settings.pool_timeout,
+            })
+        
+        return kwargs
+    
+    def _get_async_engine_kwargs(self) -> dict:
+        """Get async engine configuration, including driver statement caching."""
+        kwargs = self._get_engine_kwargs()
+        
+        if self.settings.environment != "test" and self.settings.is_postgresql:
+            # asyncpg keeps this many prepared statements per pooled connection
+            kwargs["connect_args"] = {
+                "prepared_statement_cache_size": self.settings.statement_cache_size
+            }
         
         return kwargs
     
@@ -115,6 +132,15 @@ class DatabaseManager:
             finally:
                 session.close()
     
+    async def health_check(self) -> bool:
+        """Check that a pooled connection can run a trivial query."""
+        try:
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+    
     async def create_tables(self):
         """Create all database tables."""
         async with self.async_engine.begin() as conn:
@@ -11,12 +11,13 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, 
-    String, Text, JSON, CheckConstraint, UniqueConstraint
+    Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, SmallInteger,
+    String, Text, JSON, CheckConstraint, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 from src.adapters.database.config import Base
 from src.domain.value_objects.enums import (
@@ -24,6 +25,23 @@ from src.domain.value_objects.enums import (
 )
 
 
+class SubmissionStatusType(TypeDecorator):
+    """Store SubmissionStatus as its SMALLINT code (see SubmissionStatus.to_int)."""
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return SubmissionStatus(value).to_int()
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return SubmissionStatus.from_int(value)
+
+
 class User(Base):
     """User table for authentication and basic user information."""
     
@@ -311,7 +329,7 @@ class Submission(Base):
     repository_url: Mapped[Optional[str]] = mapped_column(String(500))
     language: Mapped[Optional[str]] = mapped_column(String(50))
     status: Mapped[SubmissionStatus] = mapped_column(
-        Enum(SubmissionStatus), 
+        SubmissionStatusType(), 
         default=SubmissionStatus.FAIL
     )
     score: Mapped[Optional[float]] = mapped_column(Float)
@@ -344,6 +362,9 @@ class Submission(Base):
             "code_content IS NOT NULL OR repository_url IS NOT NULL",
             name="ck_submissions_content_required"
         ),
+        Index("idx_submissions_user_submitted_at", "user_id", text("submitted_at DESC"), text("id DESC")),
+        # Covers every status: mistake reviews filter on FAIL (0)
+        Index("idx_submissions_user_status", "user_id", "status"),
     )
 
 
@@ -431,6 +452,58 @@ class ProgressTracking(Base):
     )
 
 
+class TaskEvaluationStats(Base):
+    """
+    Per-task submission aggregates maintained alongside submission writes.
+    
+    Rows are updated in the same transaction as the submission or evaluation
+    that changes them, so statistics reads are a single primary-key lookup.
+    """
+    
+    __tablename__ = "task_evaluation_stats"
+    
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), 
+        ForeignKey("learning_tasks.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    total_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    passed_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    max_score: Mapped[Optional[float]] = mapped_column(Float)
+    min_score: Mapped[Optional[float]] = mapped_column(Float)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), 
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
+
+class UserProgressStats(Base):
+    """
+    Per-user submission aggregates maintained alongside submission writes.
+    """
+    
+    __tablename__ = "user_progress_stats"
+    
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), 
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    total_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    passed_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_execution_time_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), 
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
+
 # ============================================================================
 # Enriched Learning Content Models
 # ============================================================================
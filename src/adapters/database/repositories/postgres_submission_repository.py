@@ -2,9 +2,12 @@
 PostgreSQL implementation of the SubmissionRepository interface.
 """
 import uuid
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import select, update, delete, func, and_, desc
+from typing import AsyncIterator, Optional, List, Dict, Tuple
+from datetime import datetime, timezone
+from sqlalchemy import (
+    select, update, delete, func, and_, desc, case, tuple_, bindparam, values, column
+)
+from sqlalchemy.dialects.postgresql import distinct_on, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
@@ -12,18 +15,22 @@ from sqlalchemy.exc import IntegrityError
 from src.domain.entities.submission import Submission
 from src.domain.entities.evaluation_result import EvaluationResult
 from src.domain.value_objects.enums import SubmissionStatus
-from src.ports.repositories.submission_repository import SubmissionRepository
+from src.domain.value_objects.submissions_batch import SubmissionsBatch
+from src.ports.repositories.submission_repository import SubmissionRepository, SubmissionCursor
 from src.ports.repositories.base_repository import (
     EntityNotFoundError, RepositoryError
 )
 from src.adapters.database.models import (
     Submission as SubmissionModel,
     Evaluation as EvaluationModel,
-    User, LearningTask as LearningTaskModel
+    User, LearningTask as LearningTaskModel,
+    TaskEvaluationStats as TaskStatsModel,
+    UserProgressStats as UserStatsModel
 )
+from src.adapters.database.repositories.prepared_statements import PreparedStatements
 
 
-class PostgresSubmissionRepository(SubmissionRepository):
+class PostgresSubmissionRepository(PreparedStatements, SubmissionRepository):
     """
     PostgreSQL implementation of the SubmissionRepository interface.
     
@@ -79,11 +86,71 @@ class PostgresSubmissionRepository(SubmissionRepository):
                 submitted_at=submission.submitted_at
             )
             self.session.add(submission_model)
+            
+            # New submissions start unevaluated: counted, not passed, unscored
+            await self._apply_outcome_delta(task_uuid, user_uuid, False, None, 1, submissions=1)
         
         await self.session.commit()
         
         return self._submission_to_domain(submission_model)
     
+    async def save_submissions_bulk(self, submissions: List[Submission]) -> List[Submission]:
+        """
+        Save many submissions with one batched upsert and a single commit.
+        
+        Args:
+            submissions: The submissions to save
+            
+        Returns:
+            List[Submission]: The saved submissions, in input order
+        """
+        if not submissions:
+            return []
+        
+        rows = {}
+        try:
+            for submission in submissions:
+                submission_uuid = uuid.UUID(submission.id)
+                rows[submission_uuid] = {
+                    'id': submission_uuid,
+                    'user_id': uuid.UUID(submission.user_id),
+                    'task_id': uuid.UUID(submission.task_id),
+                    'code_content': submission.code_content,
+                    'repository_url': submission.repository_url,
+                    'submitted_at': submission.submitted_at
+                }
+        except ValueError as e:
+            raise RepositoryError(f"Invalid UUID format: {str(e)}")
+        
+        existing = await self.session.execute(
+            select(SubmissionModel.id).where(SubmissionModel.id.in_(list(rows)))
+        )
+        existing_ids = set(existing.scalars().all())
+        
+        stmt = pg_insert(SubmissionModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SubmissionModel.id],
+            set_={
+                'code_content': stmt.excluded.code_content,
+                'repository_url': stmt.excluded.repository_url,
+                'submitted_at': stmt.excluded.submitted_at
+            }
+        )
+        await self.session.execute(stmt, list(rows.values()))
+        
+        # Count new submissions per (task, user) so each aggregate row is touched once
+        new_counts = {}
+        for submission_uuid, row in rows.items():
+            if submission_uuid not in existing_ids:
+                key = (row['task_id'], row['user_id'])
+                new_counts[key] = new_counts.get(key, 0) + 1
+        for (task_uuid, user_uuid), count in new_counts.items():
+            await self._apply_outcome_delta(task_uuid, user_uuid, False, None, 1, submissions=count)
+        
+        await self.session.commit()
+        
+        return list(submissions)
+    
     async def get_submission(self, submission_id: str) -> Optional[Submission]:
         """
         Retrieve a submission by ID.
@@ -106,6 +173,33 @@ class PostgresSubmissionRepository(SubmissionRepository):
         
         return self._submission_to_domain(submission_model)
     
+    async def get_submissions_bulk(self, submission_ids: List[str]) -> Dict[str, Submission]:
+        """
+        Retrieve many submissions by ID in a single query.
+        
+        Args:
+            submission_ids: Unique identifiers for the submissions
+            
+        Returns:
+            Dict[str, Submission]: Submissions keyed by ID; missing IDs are omitted
+        """
+        submission_uuids = self._parse_uuids(submission_ids)
+        if not submission_uuids:
+            return {}
+        
+        stmt = self._prepared('submissions_bulk', lambda: (
+            select(SubmissionModel)
+            .where(SubmissionModel.id.in_(bindparam('submission_ids', expanding=True)))
+        ))
+        
+        result = await self.session.execute(stmt, {'submission_ids': submission_uuids})
+        submission_models = result.scalars().all()
+        
+        return {
+            str(submission.id): self._submission_to_domain(submission)
+            for submission in submission_models
+        }
+    
     async def get_user_submissions(
         self, 
         user_id: str, 
@@ -128,19 +222,125 @@ class PostgresSubmissionRepository(SubmissionRepository):
         except ValueError:
             return []
         
-        stmt = (
+        stmt = self._prepared('user_submissions', lambda: (
             select(SubmissionModel)
-            .where(SubmissionModel.user_id == user_uuid)
+            .where(SubmissionModel.user_id == bindparam('user_id'))
             .order_by(desc(SubmissionModel.submitted_at))
-            .limit(limit)
-            .offset(offset)
-        )
+            .limit(bindparam('limit'))
+            .offset(bindparam('offset'))
+        ))
         
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            stmt, {'user_id': user_uuid, 'limit': limit, 'offset': offset}
+        )
         submission_models = result.scalars().all()
         
         return [self._submission_to_domain(submission) for submission in submission_models]
     
+    async def get_user_submissions_page(
+        self, 
+        user_id: str, 
+        after: Optional[SubmissionCursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Submission], Optional[SubmissionCursor]]:
+        """
+        Get one page of a user's submissions with keyset pagination, newest first.
+        
+        One extra row is fetched to tell whether another page exists, so the
+        last page comes back with a None cursor.
+        
+        Args:
+            user_id: Unique identifier for the user
+            after: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of submissions to return
+            
+        Returns:
+            Tuple of the page's submissions and the cursor for the next page,
+            or None when there are no more submissions
+        """
+        try:
+            user_uuid = uuid.UUID(user_id)
+            after_uuid = uuid.UUID(after.submission_id) if after is not None else None
+        except ValueError:
+            return [], None
+        
+        params = {'user_id': user_uuid, 'limit': limit + 1}
+        if after is None:
+            stmt = self._prepared('user_submissions_page', lambda: self._page_statement(False))
+        else:
+            stmt = self._prepared('user_submissions_page_after', lambda: self._page_statement(True))
+            params.update(
+                after_submitted_at=self._as_utc(after.submitted_at), after_id=after_uuid
+            )
+        
+        result = await self.session.execute(stmt, params)
+        submission_models = result.scalars().all()
+        
+        submissions = [
+            self._submission_to_domain(submission) for submission in submission_models[:limit]
+        ]
+        
+        next_cursor = None
+        if len(submission_models) > limit and submissions:
+            last = submission_models[limit - 1]
+            next_cursor = SubmissionCursor(last.submitted_at, str(last.id))
+        
+        return submissions, next_cursor
+    
+    @staticmethod
+    def _page_statement(after: bool):
+        """Build the keyset page query, seeking past a cursor when ``after`` is set."""
+        stmt = select(SubmissionModel).where(SubmissionModel.user_id == bindparam('user_id'))
+        
+        if after:
+            stmt = stmt.where(
+                tuple_(SubmissionModel.submitted_at, SubmissionModel.id)
+                < tuple_(
+                    bindparam('after_submitted_at', type_=SubmissionModel.submitted_at.type),
+                    bindparam('after_id', type_=SubmissionModel.id.type)
+                )
+            )
+        
+        return (
+            stmt.order_by(desc(SubmissionModel.submitted_at), desc(SubmissionModel.id))
+            .limit(bindparam('limit'))
+        )
+    
+    async def iter_user_submissions(
+        self, 
+        user_id: str, 
+        batch_size: int = 200
+    ) -> AsyncIterator[Submission]:
+        """
+        Stream all submissions for a user, newest first.
+        
+        Rows are read through a server-side cursor, ``batch_size`` at a time,
+        inside the session's transaction. Exhaust or close the iterator to
+        release the cursor.
+        
+        Args:
+            user_id: Unique identifier for the user
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Submission: The user's submissions
+        """
+        try:
+            user_uuid = uuid.UUID(user_id)
+        except ValueError:
+            return
+        
+        stmt = (
+            select(SubmissionModel)
+            .where(SubmissionModel.user_id == user_uuid)
+            .order_by(desc(SubmissionModel.submitted_at))
+            .execution_options(yield_per=batch_size)
+        )
+        
+        result = await self.session.stream_scalars(stmt)
+        async for submission in result:
+            yield self._submission_to_domain(submission)
+    
     async def get_task_submissions(
         self, 
         task_id: str, 
@@ -181,15 +381,24 @@ class PostgresSubmissionRepository(SubmissionRepository):
         self, 
         user_id: str, 
         start_date: datetime, 
-        end_date: datetime
+        end_date: datetime,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Submission]:
         """
-        Get submissions within a date range for a user.
+        Get submissions within a date range for a user, newest first.
+        
+        Filtering and pagination run in PostgreSQL against the
+        ``idx_submissions_user_submitted_at`` index. The bounds are normalized
+        to UTC once here, so the scan compares ``timestamptz`` values, which
+        are int64 microseconds, with no per-row conversion.
         
         Args:
             user_id: Unique identifier for the user
             start_date: Start of date range (inclusive)
             end_date: End of date range (inclusive)
+            limit: Maximum number of submissions to return (None for all)
+            offset: Number of submissions to skip
             
         Returns:
             List[Submission]: List of submissions within date range
@@ -199,19 +408,28 @@ class PostgresSubmissionRepository(SubmissionRepository):
         except ValueError:
             return []
         
-        stmt = (
+        # LIMIT NULL is no limit in PostgreSQL, so one statement serves both cases
+        stmt = self._prepared('submissions_by_date_range', lambda: (
             select(SubmissionModel)
             .where(
                 and_(
-                    SubmissionModel.user_id == user_uuid,
-                    SubmissionModel.submitted_at >= start_date,
-                    SubmissionModel.submitted_at <= end_date
+                    SubmissionModel.user_id == bindparam('user_id'),
+                    SubmissionModel.submitted_at >= bindparam('start_date'),
+                    SubmissionModel.submitted_at <= bindparam('end_date')
                 )
             )
             .order_by(desc(SubmissionModel.submitted_at))
-        )
-        
-        result = await self.session.execute(stmt)
+            .limit(bindparam('limit'))
+            .offset(bindparam('offset'))
+        ))
+        
+        result = await self.session.execute(stmt, {
+            'user_id': user_uuid,
+            'start_date': self._as_utc(start_date),
+            'end_date': self._as_utc(end_date),
+            'limit': limit,
+            'offset': offset
+        })
         submission_models = result.scalars().all()
         
         return [self._submission_to_domain(submission) for submission in submission_models]
@@ -231,8 +449,26 @@ class PostgresSubmissionRepository(SubmissionRepository):
         except ValueError:
             return False
         
+        submission_model = await self.session.get(SubmissionModel, submission_uuid)
+        if submission_model is None:
+            return False
+        
+        # Read the outcome before the row goes away
+        outcome = (
+            submission_model.task_id,
+            submission_model.user_id,
+            submission_model.status == SubmissionStatus.PASS,
+            submission_model.score
+        )
+        execution_time_ms = submission_model.execution_time_ms or 0
+
         stmt = delete(SubmissionModel).where(SubmissionModel.id == submission_uuid)
         result = await self.session.execute(stmt)
+
+        # Retract after the DELETE so the bounds recompute no longer sees the row
+        await self._apply_outcome_delta(
+            *outcome, -1, submissions=1, execution_time_ms=execution_time_ms
+        )
         await self.session.commit()
         
         return result.rowcount > 0
@@ -280,9 +516,24 @@ class PostgresSubmissionRepository(SubmissionRepository):
             )
             self.session.add(evaluation_model)
         
+        # Capture the outcome being replaced before the submission is updated
+        submission_model = await self.session.get(SubmissionModel, submission_uuid)
+        if submission_model is not None:
+            previous_passed = submission_model.status == SubmissionStatus.PASS
+            previous_score = submission_model.score
+        
         # Update submission with evaluation results
         await self._update_submission_from_evaluation(submission_uuid, evaluation)
         
+        if submission_model is not None:
+            await self._apply_outcome_delta(
+                submission_model.task_id, submission_model.user_id,
+                previous_passed, previous_score, -1
+            )
+            await self._apply_evaluation_delta(
+                str(submission_model.task_id), str(submission_model.user_id), evaluation, 1
+            )
+        
         await self.session.commit()
         
         return self._evaluation_to_domain(evaluation_model)
@@ -305,6 +556,170 @@ class PostgresSubmissionRepository(SubmissionRepository):
         
         await self.session.execute(stmt)
     
+    async def save_evaluations_bulk(
+        self, 
+        evaluations: List[EvaluationResult]
+    ) -> List[EvaluationResult]:
+        """
+        Save many evaluation results with one batched upsert and a single commit.
+        
+        Args:
+            evaluations: The evaluation results to save
+            
+        Returns:
+            List[EvaluationResult]: The saved evaluation results, in input order
+        """
+        if not evaluations:
+            return []
+        
+        # Keyed by id so a repeated evaluation does not hit the same row twice
+        # in one upsert; the last occurrence wins
+        rows = {}
+        latest = {}
+        try:
+            for evaluation in evaluations:
+                evaluation_uuid = uuid.UUID(evaluation.id)
+                submission_uuid = uuid.UUID(evaluation.submission_id)
+                rows[evaluation_uuid] = {
+                    'id': evaluation_uuid,
+                    'submission_id': submission_uuid,
+                    'agent_type': "ReviewerAgent",  # Default agent type
+                    'passed': evaluation.is_passing(),
+                    'test_results': evaluation.test_output,
+                    'feedback': {"message": evaluation.feedback_message},
+                    'static_analysis': evaluation.static_feedback,
+                    'created_at': evaluation.evaluated_at
+                }
+                latest[submission_uuid] = evaluation
+        except ValueError as e:
+            raise RepositoryError(f"Invalid UUID format: {str(e)}")
+        
+        stmt = pg_insert(EvaluationModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EvaluationModel.id],
+            set_={
+                name: stmt.excluded[name]
+                for name in ('passed', 'test_results', 'feedback', 'static_analysis', 'created_at')
+            }
+        )
+        await self.session.execute(stmt, list(rows.values()))
+        
+        # Outcomes being replaced, fetched for every submission in one query
+        previous = (await self.session.execute(
+            select(
+                SubmissionModel.id, SubmissionModel.task_id, SubmissionModel.user_id,
+                SubmissionModel.status, SubmissionModel.score
+            )
+            .where(SubmissionModel.id.in_(list(latest)))
+        )).all()
+        if not previous:
+            await self.session.commit()
+            return list(evaluations)
+        
+        # Every submission takes its new outcome in a single UPDATE ... FROM (VALUES ...)
+        outcomes = values(
+            column('id', SubmissionModel.id.type),
+            column('status', SubmissionModel.status.type),
+            column('score', SubmissionModel.score.type),
+            column('evaluated_at', SubmissionModel.evaluated_at.type),
+            name='outcomes'
+        ).data([
+            (
+                submission.id,
+                latest[submission.id].status,
+                latest[submission.id].score,
+                latest[submission.id].evaluated_at
+            )
+            for submission in previous
+        ])
+        await self.session.execute(
+            update(SubmissionModel)
+            .where(SubmissionModel.id == outcomes.c.id)
+            .values(
+                status=outcomes.c.status,
+                score=outcomes.c.score,
+                evaluated_at=outcomes.c.evaluated_at
+            )
+        )
+        
+        # Net change per task and per user: the new outcome minus the replaced one
+        task_deltas = {}
+        user_deltas = {}
+        retracted_tasks = set()
+        for submission in previous:
+            evaluation = latest[submission.id]
+            deltas = {
+                'passed_submissions': (
+                    int(evaluation.is_passing())
+                    - int(submission.status == SubmissionStatus.PASS)
+                ),
+                'scored_submissions': (
+                    int(evaluation.score is not None) - int(submission.score is not None)
+                ),
+                'score_sum': (evaluation.score or 0.0) - (submission.score or 0.0),
+            }
+            for key, grouped in ((submission.task_id, task_deltas), (submission.user_id, user_deltas)):
+                totals = grouped.setdefault(key, dict.fromkeys(deltas, 0))
+                for name, value in deltas.items():
+                    totals[name] += value
+            
+            if evaluation.score is not None:
+                totals = task_deltas[submission.task_id]
+                totals['max_score'] = max(totals.get('max_score', evaluation.score), evaluation.score)
+                totals['min_score'] = min(totals.get('min_score', evaluation.score), evaluation.score)
+            if submission.score is not None:
+                retracted_tasks.add(submission.task_id)
+        
+        task_rows = [
+            {'task_id': task_uuid, 'max_score': None, 'min_score': None, **totals}
+            for task_uuid, totals in task_deltas.items()
+        ]
+        task_stmt = pg_insert(TaskStatsModel).values(task_rows)
+        await self.session.execute(
+            task_stmt.on_conflict_do_update(
+                index_elements=[TaskStatsModel.task_id],
+                set_={
+                    'passed_submissions': TaskStatsModel.passed_submissions + task_stmt.excluded.passed_submissions,
+                    'scored_submissions': TaskStatsModel.scored_submissions + task_stmt.excluded.scored_submissions,
+                    'score_sum': TaskStatsModel.score_sum + task_stmt.excluded.score_sum,
+                    'max_score': func.greatest(TaskStatsModel.max_score, task_stmt.excluded.max_score),
+                    'min_score': func.least(TaskStatsModel.min_score, task_stmt.excluded.min_score),
+                }
+            )
+        )
+        
+        user_rows = [{'user_id': user_uuid, **totals} for user_uuid, totals in user_deltas.items()]
+        user_stmt = pg_insert(UserStatsModel).values(user_rows)
+        await self.session.execute(
+            user_stmt.on_conflict_do_update(
+                index_elements=[UserStatsModel.user_id],
+                set_={
+                    'passed_submissions': UserStatsModel.passed_submissions + user_stmt.excluded.passed_submissions,
+                    'scored_submissions': UserStatsModel.scored_submissions + user_stmt.excluded.scored_submissions,
+                    'score_sum': UserStatsModel.score_sum + user_stmt.excluded.score_sum,
+                }
+            )
+        )
+        
+        # Retracted scores may have been bounds; recompute those tasks in one statement
+        if retracted_tasks:
+            await self.session.execute(
+                update(TaskStatsModel)
+                .where(TaskStatsModel.task_id.in_(list(retracted_tasks)))
+                .values(
+                    max_score=select(func.max(SubmissionModel.score))
+                    .where(SubmissionModel.task_id == TaskStatsModel.task_id)
+                    .scalar_subquery(),
+                    min_score=select(func.min(SubmissionModel.score))
+                    .where(SubmissionModel.task_id == TaskStatsModel.task_id)
+                    .scalar_subquery()
+                )
+            )
+        
+        await self.session.commit()
+        
+        return list(evaluations)
+    
     async def get_evaluation(self, evaluation_id: str) -> Optional[EvaluationResult]:
         """
         Retrieve an evaluation result by ID.
@@ -383,6 +798,40 @@ class PostgresSubmissionRepository(SubmissionRepository):
         
         return self._evaluation_to_domain(evaluation_model)
     
+    async def get_latest_evaluations_bulk(
+        self, 
+        submission_ids: List[str]
+    ) -> Dict[str, EvaluationResult]:
+        """
+        Get the most recent evaluation result for many submissions in a single query.
+        
+        Args:
+            submission_ids: Unique identifiers for the submissions
+            
+        Returns:
+            Dict[str, EvaluationResult]: Latest evaluation keyed by submission ID;
+            submissions without evaluations are omitted
+        """
+        submission_uuids = self._parse_uuids(submission_ids)
+        if not submission_uuids:
+            return {}
+        
+        # DISTINCT ON keeps the first row per submission in ORDER BY order
+        stmt = self._prepared('latest_evaluations_bulk', lambda: (
+            select(EvaluationModel)
+            .where(EvaluationModel.submission_id.in_(bindparam('submission_ids', expanding=True)))
+            .ext(distinct_on(EvaluationModel.submission_id))
+            .order_by(EvaluationModel.submission_id, desc(EvaluationModel.created_at))
+        ))
+        
+        result = await self.session.execute(stmt, {'submission_ids': submission_uuids})
+        evaluation_models = result.scalars().all()
+        
+        return {
+            str(evaluation.submission_id): self._evaluation_to_domain(evaluation)
+            for evaluation in evaluation_models
+        }
+    
     async def get_user_evaluations(
         self, 
         user_id: str, 
@@ -442,23 +891,19 @@ class PostgresSubmissionRepository(SubmissionRepository):
         except ValueError:
             return {}
         
-        # Get submission statistics
-        submission_stats = await self.session.execute(
+        # Columns rather than the entity, so the upserts' changes are never
+        # hidden behind a stale identity-map copy of the row
+        stmt = self._prepared('task_evaluation_stats', lambda: (
             select(
-                func.count(SubmissionModel.id).label('total_submissions'),
-                func.count(
-                    func.case((SubmissionModel.status == SubmissionStatus.PASS, 1))
-                ).label('passed_submissions'),
-                func.avg(SubmissionModel.score).label('average_score'),
-                func.max(SubmissionModel.score).label('max_score'),
-                func.min(SubmissionModel.score).label('min_score')
+                TaskStatsModel.total_submissions, TaskStatsModel.passed_submissions,
+                TaskStatsModel.scored_submissions, TaskStatsModel.score_sum,
+                TaskStatsModel.max_score, TaskStatsModel.min_score
             )
-            .where(SubmissionModel.task_id == task_uuid)
-        )
-        
-        stats = submission_stats.first()
+            .where(TaskStatsModel.task_id == bindparam('task_id'))
+        ))
+        stats = (await self.session.execute(stmt, {'task_id': task_uuid})).one_or_none()
         
-        if stats.total_submissions == 0:
+        if stats is None or stats.total_submissions == 0:
             return {
                 'total_submissions': 0,
                 'pass_rate': 0.0,
@@ -472,7 +917,7 @@ class PostgresSubmissionRepository(SubmissionRepository):
         return {
             'total_submissions': stats.total_submissions,
             'pass_rate': round(pass_rate, 2),
-            'average_score': round(float(stats.average_score or 0), 2),
+            'average_score': round(self._average_score(stats), 2),
             'max_score': float(stats.max_score or 0),
             'min_score': float(stats.min_score or 0)
         }
@@ -514,22 +959,17 @@ class PostgresSubmissionRepository(SubmissionRepository):
         except ValueError:
             return {}
         
-        # Get user submission statistics
-        submission_stats = await self.session.execute(
+        stmt = self._prepared('user_progress_stats', lambda: (
             select(
-                func.count(SubmissionModel.id).label('total_submissions'),
-                func.count(
-                    func.case((SubmissionModel.status == SubmissionStatus.PASS, 1))
-                ).label('passed_submissions'),
-                func.avg(SubmissionModel.score).label('average_score'),
-                func.sum(SubmissionModel.execution_time_ms).label('total_execution_time')
+                UserStatsModel.total_submissions, UserStatsModel.passed_submissions,
+                UserStatsModel.scored_submissions, UserStatsModel.score_sum,
+                UserStatsModel.total_execution_time_ms
             )
-            .where(SubmissionModel.user_id == user_uuid)
-        )
-        
-        stats = submission_stats.first()
+            .where(UserStatsModel.user_id == bindparam('user_id'))
+        ))
+        stats = (await self.session.execute(stmt, {'user_id': user_uuid})).one_or_none()
         
-        if stats.total_submissions == 0:
+        if stats is None or stats.total_submissions == 0:
             return {
                 'total_submissions': 0,
                 'completion_rate': 0.0,
@@ -542,9 +982,179 @@ class PostgresSubmissionRepository(SubmissionRepository):
         return {
             'total_submissions': stats.total_submissions,
             'completion_rate': round(completion_rate, 2),
-            'average_score': round(float(stats.average_score or 0), 2),
-            'total_execution_time_ms': int(stats.total_execution_time or 0)
+            'average_score': round(self._average_score(stats), 2),
+            'total_execution_time_ms': int(stats.total_execution_time_ms or 0)
+        }
+    
+    async def get_user_progress_batch(self, user_id: str) -> SubmissionsBatch:
+        """
+        Get a user's submission outcomes as a columnar batch, oldest first.
+        
+        Args:
+            user_id: Unique identifier for the user
+            
+        Returns:
+            SubmissionsBatch: Score, status, execution time and submission time columns
+        """
+        try:
+            user_uuid = uuid.UUID(user_id)
+        except ValueError:
+            return SubmissionsBatch()
+        
+        stmt = (
+            select(
+                SubmissionModel.score,
+                SubmissionModel.status,
+                SubmissionModel.execution_time_ms,
+                SubmissionModel.submitted_at
+            )
+            .where(SubmissionModel.user_id == user_uuid)
+            .order_by(SubmissionModel.submitted_at)
+        )
+        
+        result = await self.session.execute(stmt)
+        return SubmissionsBatch.from_records(result.all())
+    
+    async def _apply_evaluation_delta(
+        self, 
+        task_id: str, 
+        user_id: str, 
+        evaluation: EvaluationResult, 
+        sign: int
+    ) -> None:
+        """
+        Add (sign=1) or retract (sign=-1) an evaluation outcome from the
+        per-task and per-user aggregates.
+        
+        Args:
+            task_id: Task the evaluated submission belongs to
+            user_id: User who made the submission
+            evaluation: Evaluation whose pass flag and score are applied
+            sign: 1 to add the outcome, -1 to retract it
+        """
+        await self._apply_outcome_delta(
+            uuid.UUID(task_id), uuid.UUID(user_id),
+            evaluation.is_passing(), evaluation.score, sign
+        )
+    
+    async def _apply_outcome_delta(
+        self, 
+        task_uuid: uuid.UUID, 
+        user_uuid: uuid.UUID, 
+        passed: bool, 
+        score: Optional[float], 
+        sign: int,
+        submissions: int = 0,
+        execution_time_ms: int = 0
+    ) -> None:
+        """Upsert the aggregate rows with one submission outcome, scaled by sign."""
+        deltas = {
+            'total_submissions': sign * submissions,
+            'passed_submissions': sign if passed else 0,
+            'scored_submissions': sign if score is not None else 0,
+            'score_sum': sign * (score or 0.0),
         }
+        
+        task_stmt = pg_insert(TaskStatsModel).values(
+            task_id=task_uuid, max_score=score, min_score=score, **deltas
+        )
+        task_set = {name: getattr(TaskStatsModel, name) + value for name, value in deltas.items()}
+        if sign > 0 and score is not None:
+            task_set['max_score'] = func.greatest(TaskStatsModel.max_score, score)
+            task_set['min_score'] = func.least(TaskStatsModel.min_score, score)
+        await self.session.execute(
+            task_stmt.on_conflict_do_update(index_elements=[TaskStatsModel.task_id], set_=task_set)
+        )
+        
+        user_deltas = dict(deltas, total_execution_time_ms=sign * execution_time_ms)
+        user_stmt = pg_insert(UserStatsModel).values(user_id=user_uuid, **user_deltas)
+        await self.session.execute(
+            user_stmt.on_conflict_do_update(
+                index_elements=[UserStatsModel.user_id],
+                set_={name: getattr(UserStatsModel, name) + value for name, value in user_deltas.items()}
+            )
+        )
+        
+        # Score bounds cannot be shrunk incrementally; recompute them for this task only
+        if sign < 0 and score is not None:
+            await self.session.execute(
+                update(TaskStatsModel)
+                .where(TaskStatsModel.task_id == task_uuid)
+                .values(
+                    max_score=select(func.max(SubmissionModel.score))
+                    .where(SubmissionModel.task_id == task_uuid)
+                    .scalar_subquery(),
+                    min_score=select(func.min(SubmissionModel.score))
+                    .where(SubmissionModel.task_id == task_uuid)
+                    .scalar_subquery()
+                )
+            )
+    
+    async def refresh_evaluation_stats(
+        self, 
+        task_id: Optional[str] = None, 
+        user_id: Optional[str] = None
+    ) -> None:
+        """
+        Rebuild the maintained aggregates from stored submissions.
+        
+        Args:
+            task_id: Optional task to limit the rebuild to
+            user_id: Optional user to limit the rebuild to
+        """
+        try:
+            task_uuid = uuid.UUID(task_id) if task_id else None
+            user_uuid = uuid.UUID(user_id) if user_id else None
+        except ValueError as e:
+            raise RepositoryError(f"Invalid UUID format: {str(e)}")
+        
+        common = (
+            func.count(SubmissionModel.id),
+            func.count(case((SubmissionModel.status == SubmissionStatus.PASS, 1))),
+            func.count(SubmissionModel.score),
+            func.coalesce(func.sum(SubmissionModel.score), 0.0),
+        )
+        common_columns = ['total_submissions', 'passed_submissions', 'scored_submissions', 'score_sum']
+        
+        # Rows are deleted and re-inserted so scopes whose submissions are gone reset too
+        if task_uuid is not None or user_uuid is None:
+            task_delete = delete(TaskStatsModel)
+            task_select = select(
+                SubmissionModel.task_id, *common,
+                func.max(SubmissionModel.score), func.min(SubmissionModel.score)
+            ).group_by(SubmissionModel.task_id)
+            if task_uuid is not None:
+                task_delete = task_delete.where(TaskStatsModel.task_id == task_uuid)
+                task_select = task_select.where(SubmissionModel.task_id == task_uuid)
+            task_columns = ['task_id', *common_columns, 'max_score', 'min_score']
+            await self.session.execute(task_delete)
+            await self.session.execute(
+                pg_insert(TaskStatsModel).from_select(task_columns, task_select)
+            )
+        
+        if user_uuid is not None or task_uuid is None:
+            user_delete = delete(UserStatsModel)
+            user_select = select(
+                SubmissionModel.user_id, *common,
+                func.coalesce(func.sum(SubmissionModel.execution_time_ms), 0)
+            ).group_by(SubmissionModel.user_id)
+            if user_uuid is not None:
+                user_delete = user_delete.where(UserStatsModel.user_id == user_uuid)
+                user_select = user_select.where(SubmissionModel.user_id == user_uuid)
+            user_columns = ['user_id', *common_columns, 'total_execution_time_ms']
+            await self.session.execute(user_delete)
+            await self.session.execute(
+                pg_insert(UserStatsModel).from_select(user_columns, user_select)
+            )
+        
+        await self.session.commit()
+    
+    @staticmethod
+    def _average_score(stats) -> float:
+        """Average over scored submissions, matching SQL AVG semantics."""
+        if not stats.scored_submissions:
+            return 0.0
+        return float(stats.score_sum) / stats.scored_submissions
     
     async def get_submission_count(self, user_id: Optional[str] = None) -> int:
         """
@@ -568,6 +1178,24 @@ class PostgresSubmissionRepository(SubmissionRepository):
         result = await self.session.execute(stmt)
         return result.scalar() or 0
     
+    @staticmethod
+    def _parse_uuids(ids: List[str]) -> List[uuid.UUID]:
+        """Parse string IDs into UUIDs, skipping malformed and duplicate values."""
+        parsed = {}
+        for value in ids:
+            try:
+                parsed.setdefault(uuid.UUID(value), None)
+            except (ValueError, TypeError, AttributeError):
+                continue
+        return list(parsed)
+    
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Return an aware UTC datetime, treating naive values as UTC."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+    
     # Domain conversion methods
     def _submission_to_domain(self, submission_model: SubmissionModel) -> Submission:
         """Convert database model to domain entity."""
@@ -0,0 +1,41 @@
+"""
+Statement reuse for PostgreSQL repository implementations.
+"""
+from typing import Callable, ClassVar, Dict
+
+from sqlalchemy.sql import Executable
+
+
+class PreparedStatements:
+    """
+    Mixin that builds each repository statement once per class and reuses it.
+    
+    Statements are built on first use with ``bindparam`` placeholders and
+    executed with per-call parameters. Reusing the statement object skips
+    query construction and hits SQLAlchemy's compiled cache, and the
+    identical SQL text lets asyncpg reuse its per-connection prepared
+    statement.
+    """
+    
+    _statements: ClassVar[Dict[str, Executable]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._statements = {}
+    
+    @classmethod
+    def _prepared(cls, key: str, build: Callable[[], Executable]) -> Executable:
+        """
+        Return the cached statement for ``key``, building it on first use.
+        
+        Args:
+            key: Name identifying the statement within the repository
+            build: Factory producing the statement with bound parameters
+            
+        Returns:
+            Executable: The shared statement
+        """
+        statement = cls._statements.get(key)
+        if statement is None:
+            statement = cls._statements[key] = build()
+        return statement
@@ -25,10 +25,11 @@ class DatabaseSettings(BaseSettings):
     
     # Database configuration
     echo_sql: bool = Field(default=False, description="Echo SQL queries to console")
-    pool_size: int = Field(default=5, description="Database connection pool size")
-    max_overflow: int = Field(default=10, description="Maximum connection pool overflow")
+    pool_size: int = Field(default=10, description="Database connection pool size")
+    max_overflow: int = Field(default=40, description="Maximum connection pool overflow")
     pool_timeout: int = Field(default=30, description="Connection pool timeout in seconds")
     pool_recycle: int = Field(default=3600, description="Connection recycle time in seconds")
+    statement_cache_size: int = Field(default=256, description="Prepared statements cached per connection")
     
     @property
     def async_database_url(self) -> str:
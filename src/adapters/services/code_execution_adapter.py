@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import List, Optional
+from typing import FrozenSet, Optional, Tuple
 import httpx
 from datetime import datetime
 
@@ -13,13 +13,16 @@ from ...domain.entities.code_execution import (
     ExecutionStatus,
     TestResult,
     ResourceUsage,
-    SecurityViolation
+    SecurityViolation,
+    Severity
 )
 from ...ports.services.code_execution_service import ICodeExecutionService
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SUPPORTED_LANGUAGES = (ProgrammingLanguage.PYTHON, ProgrammingLanguage.JAVASCRIPT)
+
 
 class CodeExecutionServiceAdapter(ICodeExecutionService):
     """Adapter for remote code execution service."""
@@ -27,6 +30,9 @@ class CodeExecutionServiceAdapter(ICodeExecutionService):
     def __init__(self, service_url: str = "http://localhost:8001"):
         self.service_url = service_url.rstrip('/')
         self.client = httpx.AsyncClient(timeout=30.0)
+        # Loaded from the service on first use; failed lookups are retried
+        self._supported_languages: Optional[Tuple[ProgrammingLanguage, ...]] = None
+        self._supported_language_set: Optional[FrozenSet[ProgrammingLanguage]] = None
     
     async def execute_code(self, request: DomainRequest) -> DomainResult:
         """Execute code via remote service."""
@@ -114,7 +120,7 @@ class CodeExecutionServiceAdapter(ICodeExecutionService):
                 pattern=sv["pattern"],
                 line_number=sv.get("line_number"),
                 description=sv["description"],
-                severity=sv["severity"]
+                severity=Severity(sv["severity"])
             )
             for sv in api_result.get("security_violations", [])
         ]
@@ -152,10 +158,12 @@ class CodeExecutionServiceAdapter(ICodeExecutionService):
             created_at=datetime.utcnow()
         )
     
-    def get_supported_languages(self) -> List[ProgrammingLanguage]:
-        """Get list of supported programming languages."""
+    def get_supported_languages(self) -> Tuple[ProgrammingLanguage, ...]:
+        """Get supported programming languages, fetched once from the service."""
+        if self._supported_languages is not None:
+            return self._supported_languages
+        
         try:
-            # This would be cached in a real implementation
             response = httpx.get(f"{self.service_url}/languages", timeout=5.0)
             response.raise_for_status()
             
@@ -170,17 +178,21 @@ class CodeExecutionServiceAdapter(ICodeExecutionService):
                     except ValueError:
                         continue
             
-            return supported
+            self._supported_languages = tuple(supported)
+            self._supported_language_set = frozenset(supported)
+            return self._supported_languages
             
         except Exception as e:
             logger.error(f"Failed to get supported languages: {e}")
             # Return default supported languages
-            return [ProgrammingLanguage.PYTHON, ProgrammingLanguage.JAVASCRIPT]
+            return DEFAULT_SUPPORTED_LANGUAGES
     
-    def is_language_supported(self, language: ProgrammingLanguage) -> bool:
-        """Check if a programming language is supported."""
-        supported_languages = self.get_supported_languages()
-        return language in supported_languages
+    @property
+    def _supported_set(self) -> FrozenSet[ProgrammingLanguage]:
+        """Supported languages as a cached frozenset."""
+        if self._supported_language_set is not None:
+            return self._supported_language_set
+        return frozenset(self.get_supported_languages())
     
     async def validate_code(self, code: str, language: ProgrammingLanguage) -> dict:
         """Validate code for security violations."""
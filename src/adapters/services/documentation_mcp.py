@@ -4,6 +4,7 @@ Documentation MCP implementation for resource discovery and retrieval.
 import asyncio
 import logging
 import re
+from dataclasses import replace
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import httpx
@@ -59,7 +60,7 @@ class DocumentationMCP(IDocumentationMCP):
             cache_key = f"search:{query}:{language}:{max_results}"
             cached_result = self._get_cached_result(cache_key, self._resource_cache)
             if cached_result:
-                return [LearningResource(**resource) for resource in cached_result]
+                return list(cached_result)
             
             # Build search query
             search_query = self._build_search_query(query, language)
@@ -86,8 +87,8 @@ class DocumentationMCP(IDocumentationMCP):
             # Limit results
             final_resources = ranked_resources[:max_results]
             
-            # Cache results
-            self._cache_result(cache_key, [r.to_dict() for r in final_resources], self._resource_cache)
+            # Cache the immutable resources themselves; no dict round trip on hits
+            self._cache_result(cache_key, tuple(final_resources), self._resource_cache)
             
             return final_resources
             
@@ -308,13 +309,17 @@ class DocumentationMCP(IDocumentationMCP):
         """Rank resources by relevance and quality."""
         scored_resources = []
         
+        # Verify quality concurrently for resources that don't have it yet
+        verified_scores = iter(await self.verify_resource_quality_bulk(
+            [resource for resource in resources if resource.quality_score == 0.0]
+        ))
+        
         for resource in resources:
             # Calculate relevance score
             relevance_score = self._calculate_relevance(resource, query)
             
-            # Verify quality if not already set
             if resource.quality_score == 0.0:
-                resource.quality_score = await self.verify_resource_quality(resource)
+                resource = replace(resource, quality_score=next(verified_scores))
             
             # Combined score
             combined_score = (relevance_score * 0.6) + (resource.quality_score * 0.4)
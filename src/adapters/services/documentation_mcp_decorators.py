@@ -0,0 +1,209 @@
+"""
+Decorators that add request coalescing and caching to any IDocumentationMCP.
+"""
+import asyncio
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from ...ports.services.mcp_tools import IDocumentationMCP, LearningResource
+
+
+class _ExpiringLRU:
+    """Small LRU mapping whose entries also expire after a fixed TTL."""
+    
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float]):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a live value and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries past maxsize."""
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlightDocumentationMCP(IDocumentationMCP):
+    """
+    Coalesce identical concurrent documentation searches into one upstream call.
+    
+    Concurrent ``search_documentation`` calls with the same
+    ``(query, language, max_results)`` share a single in-flight request, and
+    non-empty results are kept in a short TTL cache so sequential repeats are
+    answered without reaching the wrapped service. Other methods delegate
+    unchanged.
+    """
+    
+    def __init__(
+        self,
+        delegate: IDocumentationMCP,
+        cache_size: int = 1024,
+        cache_ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the decorator.
+        
+        Args:
+            delegate: Documentation service to wrap
+            cache_size: Maximum number of cached search results
+            cache_ttl_seconds: Seconds a cached search result stays valid
+            clock: Monotonic time source, injectable for tests
+        """
+        self._delegate = delegate
+        self._results = _ExpiringLRU(cache_size, cache_ttl_seconds, clock)
+        self._inflight: Dict[Tuple[str, Optional[str], int], asyncio.Future] = {}
+    
+    async def search_documentation(self,
+                                 query: str,
+                                 language: Optional[str] = None,
+                                 max_results: int = 10) -> List[LearningResource]:
+        """Search documentation, sharing identical in-flight and recent requests."""
+        key = (query, language, max_results)
+        
+        cached = self._results.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._delegate.search_documentation(query, language, max_results)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._complete(key, done))
+        
+        # Shield so one caller's cancellation doesn't cancel the shared request
+        return list(await asyncio.shield(task))
+    
+    def _complete(self, key: Tuple[str, Optional[str], int], task: asyncio.Future) -> None:
+        """Retire an in-flight search and cache a successful, non-empty result."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        result = task.result()
+        if result:
+            self._results.put(key, tuple(result))
+    
+    async def get_resource_content(self, url: str) -> Optional[str]:
+        """Retrieve content through the wrapped service."""
+        return await self._delegate.get_resource_content(url)
+    
+    async def verify_resource_quality(self, resource: LearningResource) -> float:
+        """Score a resource through the wrapped service."""
+        return await self._delegate.verify_resource_quality(resource)
+    
+    async def verify_resource_quality_bulk(self, 
+                                         resources: List[LearningResource],
+                                         max_concurrency: int = 8,
+                                         return_exceptions: bool = False) -> List[Union[float, BaseException]]:
+        """Score many resources through the wrapped service."""
+        return await self._delegate.verify_resource_quality_bulk(
+            resources, max_concurrency, return_exceptions
+        )
+    
+    async def get_related_resources(self,
+                                  resource: LearningResource,
+                                  max_results: int = 5) -> List[LearningResource]:
+        """Find related resources through the wrapped service."""
+        return await self._delegate.get_related_resources(resource, max_results)
+
+
+class CachingDocumentationMCP(IDocumentationMCP):
+    """
+    Cache ``get_resource_content`` responses in memory, keyed by URL digest.
+    
+    The same documentation pages are fetched for many users and sessions, so
+    a warm page is served without an HTTP round trip. Entries are keyed by
+    the SHA-256 of the URL, which bounds key size for long query URLs, and
+    are stored gzip-compressed. Missing content is not cached. Other methods
+    delegate unchanged.
+    """
+    
+    def __init__(
+        self,
+        delegate: IDocumentationMCP,
+        cache_size: int = 512,
+        cache_ttl_seconds: float = 86400.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the decorator.
+        
+        Args:
+            delegate: Documentation service to wrap
+            cache_size: Maximum number of cached pages
+            cache_ttl_seconds: Seconds a cached page stays valid
+            clock: Monotonic time source, injectable for tests
+        """
+        self._delegate = delegate
+        self._contents = _ExpiringLRU(cache_size, cache_ttl_seconds, clock)
+    
+    async def search_documentation(self,
+                                 query: str,
+                                 language: Optional[str] = None,
+                                 max_results: int = 10) -> List[LearningResource]:
+        """Search documentation through the wrapped service."""
+        return await self._delegate.search_documentation(query, language, max_results)
+    
+    async def get_resource_content(self, url: str) -> Optional[str]:
+        """Retrieve content, serving repeated URLs from the cache."""
+        digest = hashlib.sha256(url.encode('utf-8')).digest()
+        
+        compressed = self._contents.get(digest)
+        if compressed is not None:
+            return gzip.decompress(compressed).decode('utf-8')
+        
+        content = await self._delegate.get_resource_content(url)
+        if content is not None:
+            self._contents.put(digest, gzip.compress(content.encode('utf-8'), compresslevel=6))
+        return content
+    
+    async def verify_resource_quality(self, resource: LearningResource) -> float:
+        """Score a resource through the wrapped service."""
+        return await self._delegate.verify_resource_quality(resource)
+    
+    async def verify_resource_quality_bulk(self, 
+                                         resources: List[LearningResource],
+                                         max_concurrency: int = 8,
+                                         return_exceptions: bool = False) -> List[Union[float, BaseException]]:
+        """Score many resources through the wrapped service."""
+        return await self._delegate.verify_resource_quality_bulk(
+            resources, max_concurrency, return_exceptions
+        )
+    
+    async def get_related_resources(self,
+                                  resource: LearningResource,
+                                  max_results: int = 5) -> List[LearningResource]:
+        """Find related resources through the wrapped service."""
+        return await self._delegate.get_related_resources(resource, max_results)
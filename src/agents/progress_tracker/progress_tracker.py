@@ -484,14 +484,28 @@ class ProgressTracker(BaseAgent):
 
     async def _enrich_tasks_with_status(self, user_id: str, tasks: List, plan: LearningPlan) -> List[DailyTaskInfo]:
         """Enrich tasks with completion status and attempt information."""
+        submissions_by_task = {}
+        for task in tasks:
+            submissions_by_task[task.id] = await self.submission_repository.get_task_submissions(
+                task_id=task.id, user_id=user_id
+            )
+        
+        # One lookup resolves the latest evaluation of every submission across all tasks
+        submission_ids = [
+            submission.id for submissions in submissions_by_task.values() for submission in submissions
+        ]
+        evaluations = {}
+        if submission_ids:
+            evaluations = await self.submission_repository.get_latest_evaluations_bulk(submission_ids)
+        
         enriched = []
         for task in tasks:
-            submissions = await self.submission_repository.get_task_submissions(task_id=task.id, user_id=user_id)
+            submissions = submissions_by_task[task.id]
             is_completed = False
             best_score = None
             
             for submission in submissions:
-                evaluation = await self.submission_repository.get_latest_evaluation(submission.id)
+                evaluation = evaluations.get(submission.id)
                 if evaluation:
                     if evaluation.passed:
                         is_completed = True
@@ -2,6 +2,7 @@
 ResourcesAgent implementation for learning resource discovery and curation.
 """
 import logging
+from dataclasses import replace
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -498,30 +499,25 @@ class ResourcesAgent(BaseAgent):
         """Enhance resources with additional metadata."""
         enhanced = []
         
+        unscored = [resource for resource in resources if resource.quality_score == 0.0]
+        try:
+            verified_scores = iter(await self.documentation_mcp.verify_resource_quality_bulk(
+                unscored, return_exceptions=True
+            ))
+        except Exception as e:
+            self.logger.log_warning(f"Failed to verify quality for {len(unscored)} resources: {e}")
+            verified_scores = iter([0.5] * len(unscored))
+        
         for resource in resources:
-            # Create a copy to avoid modifying original
-            enhanced_resource = LearningResource(
-                title=resource.title,
-                url=resource.url,
-                description=resource.description,
-                resource_type=resource.resource_type,
-                difficulty_level=resource.difficulty_level,
-                topics=resource.topics,
-                language=resource.language,
-                last_updated=resource.last_updated,
-                quality_score=resource.quality_score,
-                source=resource.source
-            )
-            
-            # Enhance quality score if not set
-            if enhanced_resource.quality_score == 0.0:
-                try:
-                    enhanced_resource.quality_score = await self.documentation_mcp.verify_resource_quality(resource)
-                except Exception as e:
-                    self.logger.log_warning(f"Failed to verify quality for {resource.url}: {e}")
-                    enhanced_resource.quality_score = 0.5
-            
-            enhanced.append(enhanced_resource)
+            # Resources are immutable, so only derive a copy when the score changes
+            if resource.quality_score == 0.0:
+                score = next(verified_scores)
+                if isinstance(score, BaseException):
+                    self.logger.log_warning(f"Failed to verify quality for {resource.url}: {score}")
+                    score = 0.5  # Default score
+                resource = replace(resource, quality_score=score)
+            
+            enhanced.append(resource)
         
         return enhanced
     
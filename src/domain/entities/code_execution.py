@@ -26,13 +26,29 @@ class ExecutionStatus(str, Enum):
     COMPILATION_ERROR = "compilation_error"
 
 
-@dataclass(frozen=True)
+class Severity(str, Enum):
+    """Security violation severity, from least to most severe."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+    
+    @property
+    def level(self) -> int:
+        """Numeric rank of the severity, for "at least this severe" checks."""
+        return _SEVERITY_LEVELS[self]
+
+
+_SEVERITY_LEVELS = {severity: level for level, severity in enumerate(Severity)}
+
+
+@dataclass(frozen=True, slots=True)
 class SecurityViolation:
     """Represents a security violation in code."""
     pattern: str
     line_number: Optional[int]
     description: str
-    severity: str  # 'low', 'medium', 'high', 'critical'
+    severity: Severity
 
 
 @dataclass(frozen=True)
@@ -125,7 +141,7 @@ class CodeExecutionResult:
     @property
     def critical_security_violations(self) -> List[SecurityViolation]:
         """Get critical security violations."""
-        return [v for v in self.security_violations if v.severity == 'critical']
+        return [v for v in self.security_violations if v.severity is Severity.CRITICAL]
 
 
 @dataclass(frozen=True)
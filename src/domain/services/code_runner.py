@@ -13,15 +13,30 @@ from docker.errors import ContainerError, ImageNotFound, APIError
 
 from ..entities.code_execution import (
     CodeExecutionRequest, CodeExecutionResult, ExecutionStatus,
-    TestResult, ResourceUsage, ProgrammingLanguage, LanguageConfig
+    TestResult, ResourceUsage, ProgrammingLanguage, LanguageConfig, Severity
 )
-from .security_validator import SecurityValidator
+from .security_validator import validator as shared_security_validator
 
 
 # Configure logging for security events
 security_logger = logging.getLogger('security_audit')
 security_logger.setLevel(logging.INFO)
 
+# Size of the persistent connection pool kept open to the Docker daemon.
+# Each execution issues several API calls (run, wait, logs, stats, kill);
+# keeping connections alive avoids a socket connect + handshake per call.
+DOCKER_MAX_POOL_SIZE = 32
+
+# ResourceUsage is frozen, so a single zero instance is shared by every
+# result that never reached a container.
+_ZERO_USAGE = ResourceUsage(0, 0, 0, 0, 0)
+
+_FALLBACK_MESSAGES = (
+    "Docker is not available: {}",
+    "Falling back to static code analysis only.",
+    "Code execution is disabled. Only security validation was performed."
+)
+
 
 class CodeExecutionError(Exception):
     """Exception raised during code execution."""
@@ -41,7 +56,7 @@ class SecureCodeRunner:
     """Secure code execution service using Docker containers."""
     
     def __init__(self):
-        self.security_validator = SecurityValidator()
+        self.security_validator = shared_security_validator
         self.docker_available = False
         self.docker_client = None
         self.docker_error_message = None
@@ -59,8 +74,10 @@ class SecureCodeRunner:
     def _initialize_docker(self) -> docker.DockerClient:
         """Initialize Docker client with comprehensive error handling."""
         try:
-            client = docker.from_env()
-            # Test Docker connection
+            client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+            # Keep daemon connections open between API calls
+            client.api.headers['Connection'] = 'keep-alive'
+            # Test Docker connection (also pre-warms the first pooled connection)
             client.ping()
             
             # Verify required images are available or can be pulled
@@ -161,8 +178,8 @@ class SecureCodeRunner:
         
         try:
             # Validate security
-            violations = self.security_validator.validate_code(request.code, request.language)
-            critical_violations = [v for v in violations if v.severity == 'critical']
+            violations = await self.security_validator.validate_code_async(request.code, request.language)
+            critical_violations = [v for v in violations if v.severity is Severity.CRITICAL]
             
             # Log all security violations
             if violations:
@@ -175,7 +192,7 @@ class SecureCodeRunner:
                     output="",
                     errors=[f"Security violation: {v.description}" for v in critical_violations],
                     test_results=[],
-                    resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+                    resource_usage=_ZERO_USAGE,
                     security_violations=violations,
                     execution_time=time.time() - start_time,
                     created_at=request.created_at
@@ -193,7 +210,7 @@ class SecureCodeRunner:
                     output="",
                     errors=[f"Unsupported language: {request.language}"],
                     test_results=[],
-                    resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+                    resource_usage=_ZERO_USAGE,
                     security_violations=violations,
                     execution_time=time.time() - start_time,
                     created_at=request.created_at
@@ -214,7 +231,7 @@ class SecureCodeRunner:
                 output="",
                 errors=[f"Execution failed: {str(e)}"],
                 test_results=[],
-                resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+                resource_usage=_ZERO_USAGE,
                 security_violations=[],
                 execution_time=time.time() - start_time,
                 created_at=request.created_at
@@ -228,9 +245,8 @@ class SecureCodeRunner:
     ) -> CodeExecutionResult:
         """Fallback to static analysis when Docker is unavailable."""
         error_messages = [
-            f"Docker is not available: {self.docker_error_message}",
-            "Falling back to static code analysis only.",
-            "Code execution is disabled. Only security validation was performed."
+            _FALLBACK_MESSAGES[0].format(self.docker_error_message),
+            *_FALLBACK_MESSAGES[1:]
         ]
         
         # Perform basic syntax check if possible
@@ -247,7 +263,7 @@ class SecureCodeRunner:
             output="",
             errors=error_messages,
             test_results=[],
-            resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+            resource_usage=_ZERO_USAGE,
             security_violations=violations,
             execution_time=time.time() - start_time,
             created_at=request.created_at
@@ -362,7 +378,7 @@ class SecureCodeRunner:
                     output="",
                     errors=[f"Container error: {e.stderr.decode('utf-8') if e.stderr else str(e)}"],
                     test_results=[],
-                    resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+                    resource_usage=_ZERO_USAGE,
                     security_violations=[],
                     execution_time=time.time() - start_time,
                     created_at=request.created_at
@@ -374,7 +390,7 @@ class SecureCodeRunner:
                     output="",
                     errors=[f"Docker image not found: {config.docker_image}"],
                     test_results=[],
-                    resource_usage=ResourceUsage(0, 0, 0, 0, 0),
+                    resource_usage=_ZERO_USAGE,
                     security_violations=[],
                     execution_time=time.time() - start_time,
                     created_at=request.created_at
@@ -568,12 +584,12 @@ console.log(JSON.stringify({
             }
             
             # Log based on severity
-            if violation.severity == 'critical':
+            if violation.severity is Severity.CRITICAL:
                 security_logger.error(
                     f"CRITICAL security violation detected: {violation.description}",
                     extra=log_entry
                 )
-            elif violation.severity == 'high':
+            elif violation.severity is Severity.HIGH:
                 security_logger.warning(
                     f"HIGH security violation detected: {violation.description}",
                     extra=log_entry
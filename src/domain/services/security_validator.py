@@ -1,260 +1,658 @@
 """Security validation service for code execution."""
 
+import asyncio
+import functools
+import hashlib
 import re
-from typing import List, Dict, Pattern
-from dataclasses import dataclass
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, List, Dict, FrozenSet, Iterator, Mapping, NamedTuple, Optional, Pattern, Tuple
 
-from ..entities.code_execution import SecurityViolation, ProgrammingLanguage
+from ..entities.code_execution import SecurityViolation, ProgrammingLanguage, Severity
 
+try:
+    import hyperscan
+except ImportError:
+    # Optional multi-pattern DFA backend; the fused ``re`` scan is used without it
+    hyperscan = None
 
-@dataclass(frozen=True)
-class SecurityPattern:
+try:
+    import ahocorasick
+except ImportError:
+    # Optional literal prefilter backend; plain substring checks are used without it
+    ahocorasick = None
+
+
+# Number of validation results kept, keyed by language and code digest
+VALIDATION_CACHE_SIZE = 1024
+
+# Inputs larger than this are rejected before any pattern matching
+MAX_CODE_LENGTH = 1 << 20
+
+# How much of the input is checked for NUL bytes to detect binary blobs
+BINARY_SNIFF_LENGTH = 4096
+
+# Character classes stay Unicode-aware: JavaScript treats NBSP and the other
+# Unicode spaces as whitespace, so ``\s`` and ``\b`` must match them too
+_SCAN_FLAGS = re.IGNORECASE
+
+# Python import statement: group 1 is the module of ``from x import``,
+# group 2 the comma-separated modules of ``import a, b as c``
+_PYTHON_IMPORT = re.compile(
+    r'\b(?:from\s+([\w.]+)\s+import\b'
+    r'|import\s+([\w.]+(?:\s+as\s+\w+)?(?:\s*,\s*[\w.]+(?:\s+as\s+\w+)?)*))',
+    _SCAN_FLAGS
+)
+
+_EVAL_CALL = re.compile(r'\beval\s*\(', _SCAN_FLAGS)
+_EXEC_CALL = re.compile(r'\bexec\s*\(', _SCAN_FLAGS)
+_FUNCTION_CALL = re.compile(r'Function\s*\(', _SCAN_FLAGS)
+
+
+def _fuse_replacements(*rules: Tuple[Pattern[str], str]) -> Tuple[Pattern[str], Dict[str, str]]:
+    """Fuse ``(pattern, replacement)`` rules into one regex and a group-name lookup."""
+    alternation = '|'.join(
+        f'(?P<r{index}>{pattern.pattern})' for index, (pattern, _) in enumerate(rules)
+    )
+    replacements = {f'r{index}': replacement for index, (_, replacement) in enumerate(rules)}
+    return re.compile(alternation, _SCAN_FLAGS), replacements
+
+
+# Dangerous calls replaced with safe alternatives by ``sanitize_code`` in a
+# single pass, dispatching on the name of the group that matched
+_SANITIZE_RULES: Dict[ProgrammingLanguage, Tuple[Pattern[str], Dict[str, str]]] = {
+    ProgrammingLanguage.PYTHON: _fuse_replacements(
+        (_EVAL_CALL, 'safe_eval('),
+        (_EXEC_CALL, 'safe_exec('),
+    ),
+    ProgrammingLanguage.JAVASCRIPT: _fuse_replacements(
+        (_EVAL_CALL, 'safe_eval('),
+        (_FUNCTION_CALL, 'SafeFunction('),
+    ),
+}
+_SANITIZE_RULES[ProgrammingLanguage.TYPESCRIPT] = _SANITIZE_RULES[ProgrammingLanguage.JAVASCRIPT]
+
+
+_NODE_BLOCKED_IMPORTS = frozenset({
+    'child_process', 'fs', 'net', 'http', 'https', 'cluster',
+    'worker_threads', 'dgram', 'tls', 'crypto'
+})
+
+_BLOCKED_IMPORTS: Mapping[ProgrammingLanguage, FrozenSet[str]] = MappingProxyType({
+    ProgrammingLanguage.PYTHON: frozenset({
+        'os', 'subprocess', 'sys', 'socket', 'urllib', 'requests',
+        'http', 'ftplib', 'smtplib', 'telnetlib', 'multiprocessing',
+        'threading', 'ctypes', 'importlib'
+    }),
+    ProgrammingLanguage.JAVASCRIPT: _NODE_BLOCKED_IMPORTS,
+    ProgrammingLanguage.TYPESCRIPT: _NODE_BLOCKED_IMPORTS,
+})
+
+class SecurityPattern(NamedTuple):
     """Security pattern definition."""
     pattern: Pattern[str]
     description: str
-    severity: str
+    severity: Severity
     language: ProgrammingLanguage
+    literal: str = ''  # lowercase text every match must contain, used as a prefilter
+
+
+def _initialize_patterns() -> Dict[ProgrammingLanguage, List[SecurityPattern]]:
+    """Initialize security patterns for different languages."""
+    patterns = {
+        ProgrammingLanguage.PYTHON: [
+            # Critical patterns
+            SecurityPattern(
+                pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
+                literal='eval',
+                description="Use of eval() function - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.PYTHON
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'\bexec\s*\(', re.IGNORECASE),
+                literal='exec',
+                description="Use of exec() function - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.PYTHON
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'\b__import__\s*\(', re.IGNORECASE),
+                literal='__import__',
+                description="Direct use of __import__ - potential security risk",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.PYTHON
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'open\s*\(\s*[\'"][^\'\"]*[\'"]', re.IGNORECASE),
+                literal='open',
+                description="File operations - potential file system access",
+                severity=Severity.MEDIUM,
+                language=ProgrammingLanguage.PYTHON
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'while\s+True\s*:', re.IGNORECASE),
+                literal='while',
+                description="Infinite loop detected - potential DoS",
+                severity=Severity.MEDIUM,
+                language=ProgrammingLanguage.PYTHON
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'for\s+\w+\s+in\s+range\s*\(\s*\d{6,}', re.IGNORECASE),
+                literal='range',
+                description="Large range loop - potential DoS",
+                severity=Severity.MEDIUM,
+                language=ProgrammingLanguage.PYTHON
+            ),
+        ],
+    
+        ProgrammingLanguage.JAVASCRIPT: [
+            # Critical patterns
+            SecurityPattern(
+                pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
+                literal='eval',
+                description="Use of eval() function - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'Function\s*\(', re.IGNORECASE),
+                literal='function',
+                description="Function constructor - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'require\s*\(\s*[\'"]child_process[\'"]', re.IGNORECASE),
+                literal='child_process',
+                description="Child process module - command execution",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'require\s*\(\s*[\'"]fs[\'"]', re.IGNORECASE),
+                literal='require',
+                description="File system module - file access",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'require\s*\(\s*[\'"]net[\'"]', re.IGNORECASE),
+                literal='require',
+                description="Network module - external access",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'require\s*\(\s*[\'"]http[\'"]', re.IGNORECASE),
+                literal='require',
+                description="HTTP module - external access",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'process\.exit', re.IGNORECASE),
+                literal='process.exit',
+                description="Process exit - potential disruption",
+                severity=Severity.MEDIUM,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'while\s*\(\s*true\s*\)', re.IGNORECASE),
+                literal='while',
+                description="Infinite loop detected - potential DoS",
+                severity=Severity.MEDIUM,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'__proto__', re.IGNORECASE),
+                literal='__proto__',
+                description="Prototype pollution attempt",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'constructor\.constructor', re.IGNORECASE),
+                literal='constructor.constructor',
+                description="Constructor access - potential code execution",
+                severity=Severity.HIGH,
+                language=ProgrammingLanguage.JAVASCRIPT
+            ),
+        ],
+    
+        ProgrammingLanguage.TYPESCRIPT: [
+            # TypeScript inherits JavaScript patterns plus some additional ones
+            SecurityPattern(
+                pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
+                literal='eval',
+                description="Use of eval() function - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.TYPESCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'Function\s*\(', re.IGNORECASE),
+                literal='function',
+                description="Function constructor - can execute arbitrary code",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.TYPESCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'require\s*\(\s*[\'"]child_process[\'"]', re.IGNORECASE),
+                literal='child_process',
+                description="Child process module - command execution",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.TYPESCRIPT
+            ),
+            SecurityPattern(
+                pattern=re.compile(r'import.*from\s+[\'"]child_process[\'"]', re.IGNORECASE),
+                literal='child_process',
+                description="Child process import - command execution",
+                severity=Severity.CRITICAL,
+                language=ProgrammingLanguage.TYPESCRIPT
+            ),
+        ]
+    }
+    
+    return patterns
+
+
+
+def _initialize_import_patterns() -> Dict[ProgrammingLanguage, Dict[str, SecurityPattern]]:
+    """Initialize blocked-import patterns, keyed by top-level module name.
+    
+    Import statements are found by a single tokenizer regex and the module
+    names it extracts are looked up here, instead of running one regex per
+    blocked module. Covers every module in ``_BLOCKED_IMPORTS`` for Python.
+    """
+    def python_import(module: str, purpose: str, severity: Severity) -> Tuple[str, SecurityPattern]:
+        # Reported per module; matching itself goes through ``_PYTHON_IMPORT``
+        return module, SecurityPattern(
+            pattern=re.compile(rf'\b(?:from|import)\s+{module}\b', _SCAN_FLAGS),
+            literal='import',
+            description=f"Import of {module} module - {purpose}",
+            severity=severity,
+            language=ProgrammingLanguage.PYTHON
+        )
+    
+    network = ('socket', 'urllib', 'requests', 'http', 'ftplib', 'smtplib', 'telnetlib')
+    
+    return {
+        ProgrammingLanguage.PYTHON: dict([
+            python_import('os', "system access", Severity.HIGH),
+            python_import('subprocess', "command execution", Severity.CRITICAL),
+            python_import('sys', "system access", Severity.MEDIUM),
+            *(python_import(module, "external access", Severity.HIGH) for module in network),
+            python_import('multiprocessing', "process creation", Severity.HIGH),
+            python_import('threading', "thread creation", Severity.MEDIUM),
+            python_import('ctypes', "native code access", Severity.HIGH),
+            python_import('importlib', "dynamic imports", Severity.HIGH),
+        ]),
+    }
+
+@functools.lru_cache(maxsize=None)
+def _compile_combined_pattern(language: ProgrammingLanguage) -> Optional[Pattern[str]]:
+    """Fuse the patterns of a language into a single regex.
+    
+    Each pattern becomes a named group ``p<index>`` inside a lookahead, so
+    one sweep over the code reports overlapping matches of different
+    patterns just like searching for every pattern separately. Compiled on
+    first use, so languages a process never sees are never compiled.
+    """
+    language_patterns = _PATTERNS.get(language)
+    if not language_patterns:
+        return None
+    
+    alternation = '|'.join(
+        f'(?P<p{index}>{pattern_def.pattern.pattern})'
+        for index, pattern_def in enumerate(language_patterns)
+    )
+    return re.compile(f'(?=(?:{alternation}))', _SCAN_FLAGS)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_critical_pattern(language: ProgrammingLanguage) -> Optional[Pattern[str]]:
+    """Fuse only the critical patterns of a language into a single regex."""
+    alternatives = [
+        f'(?:{pattern_def.pattern.pattern})'
+        for pattern_def in _PATTERNS.get(language, ())
+        if pattern_def.severity is Severity.CRITICAL
+    ]
+    if not alternatives:
+        return None
+    
+    return re.compile('|'.join(alternatives), _SCAN_FLAGS)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_hyperscan_database(language: ProgrammingLanguage) -> Any:
+    """Compile the patterns of a language into a Hyperscan block database.
+    
+    Returns None when the optional ``hyperscan`` package is not installed or
+    rejects the patterns, in which case the fused ``re`` scan is used.
+    """
+    language_patterns = _PATTERNS.get(language)
+    if hyperscan is None or not language_patterns:
+        return None
+    
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[p.pattern.pattern.encode('utf-8') for p in language_patterns],
+            ids=list(range(len(language_patterns))),
+            elements=len(language_patterns),
+            flags=[
+                hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+                | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            ] * len(language_patterns)
+        )
+    except hyperscan.error:
+        return None
+    
+    return database
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_literal_prefilter(language: ProgrammingLanguage) -> Callable[[str], bool]:
+    """Build a check for whether lowercased code contains any pattern literal.
+    
+    Every match of a language's patterns contains that pattern's literal, so
+    code without any of them cannot produce a violation and skips the regex
+    scan entirely. Uses an Aho-Corasick automaton when ``pyahocorasick`` is
+    installed, otherwise one substring search per literal.
+    """
+    literals = {pattern_def.literal for pattern_def in _PATTERNS.get(language, ())}
+    literals.update(pattern_def.literal for pattern_def in _IMPORT_PATTERNS.get(language, {}).values())
+    
+    if ahocorasick is not None and literals:
+        automaton = ahocorasick.Automaton()
+        for literal in literals:
+            automaton.add_word(literal, literal)
+        automaton.make_automaton()
+        return lambda lowered: next(automaton.iter(lowered), None) is not None
+    
+    literals = tuple(literals)
+    return lambda lowered: any(literal in lowered for literal in literals)
+
+_OVERSIZE_VIOLATION = SecurityViolation(
+    pattern=f'len(code) > {MAX_CODE_LENGTH}',
+    line_number=1,
+    description=f"Code exceeds the maximum size of {MAX_CODE_LENGTH} characters",
+    severity=Severity.CRITICAL
+)
+
+_BINARY_VIOLATION = SecurityViolation(
+    pattern=r'\x00',
+    line_number=1,
+    description="Binary content detected - only source code can be executed",
+    severity=Severity.CRITICAL
+)
+
+
+def _reject_input(code: str) -> Optional[SecurityViolation]:
+    """Reject oversize or binary input up front, bounding worst-case scan time."""
+    if len(code) > MAX_CODE_LENGTH:
+        return _OVERSIZE_VIOLATION
+    if '\x00' in code[:BINARY_SNIFF_LENGTH]:
+        return _BINARY_VIOLATION
+    return None
+
+
+class _LineIndex:
+    """Maps match offsets to 1-based line numbers, indexing newlines on first use."""
+    
+    __slots__ = ('_text', '_newlines')
+    
+    def __init__(self, text):
+        self._text = text
+        self._newlines = None
+    
+    def line_of(self, offset: int) -> int:
+        """Get the line number containing the given offset."""
+        if self._newlines is None:
+            self._newlines = self._index_newlines()
+        return bisect_left(self._newlines, offset) + 1
+    
+    def _index_newlines(self) -> array:
+        """Collect newline offsets with C-level ``find`` calls into a compact int array."""
+        text = self._text
+        newline = b'\n' if isinstance(text, bytes) else '\n'
+        newlines = array('q')
+        
+        position = text.find(newline)
+        while position != -1:
+            newlines.append(position)
+            position = text.find(newline, position + 1)
+        
+        return newlines
+
+
+# Built once per process and shared by every SecurityValidator instance
+_PATTERNS = _initialize_patterns()
+_IMPORT_PATTERNS = _initialize_import_patterns()
+
+_SCRATCH = threading.local()
+_VALIDATION_CACHE: OrderedDict = OrderedDict()
+_VALIDATION_CACHE_LOCK = threading.Lock()
 
 
 class SecurityValidator:
-    """Validates code for security violations."""
+    """Validates code for security violations.
+    
+    All compiled tables and the result cache are process-wide, so instances
+    are interchangeable; prefer the shared ``validator`` instance and the
+    module-level functions that delegate to it.
+    """
+    
+    __slots__ = ('_patterns', '_import_patterns', '_scratch', '_cache', '_cache_lock')
     
     def __init__(self):
-        self._patterns = self._initialize_patterns()
-    
-    def _initialize_patterns(self) -> Dict[ProgrammingLanguage, List[SecurityPattern]]:
-        """Initialize security patterns for different languages."""
-        patterns = {
-            ProgrammingLanguage.PYTHON: [
-                # Critical patterns
-                SecurityPattern(
-                    pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
-                    description="Use of eval() function - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'\bexec\s*\(', re.IGNORECASE),
-                    description="Use of exec() function - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'\b__import__\s*\(', re.IGNORECASE),
-                    description="Direct use of __import__ - potential security risk",
-                    severity="high",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'import\s+os\b', re.IGNORECASE),
-                    description="Import of os module - system access",
-                    severity="high",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'import\s+subprocess\b', re.IGNORECASE),
-                    description="Import of subprocess module - command execution",
-                    severity="critical",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'import\s+sys\b', re.IGNORECASE),
-                    description="Import of sys module - system access",
-                    severity="medium",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'from\s+os\s+import', re.IGNORECASE),
-                    description="Import from os module - system access",
-                    severity="high",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'open\s*\(\s*[\'"][^\'\"]*[\'"]', re.IGNORECASE),
-                    description="File operations - potential file system access",
-                    severity="medium",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'while\s+True\s*:', re.IGNORECASE),
-                    description="Infinite loop detected - potential DoS",
-                    severity="medium",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'for\s+\w+\s+in\s+range\s*\(\s*\d{6,}', re.IGNORECASE),
-                    description="Large range loop - potential DoS",
-                    severity="medium",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-                # Network access
-                SecurityPattern(
-                    pattern=re.compile(r'import\s+(urllib|requests|socket|http)\b', re.IGNORECASE),
-                    description="Network library import - external access",
-                    severity="high",
-                    language=ProgrammingLanguage.PYTHON
-                ),
-            ],
-            
-            ProgrammingLanguage.JAVASCRIPT: [
-                # Critical patterns
-                SecurityPattern(
-                    pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
-                    description="Use of eval() function - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'Function\s*\(', re.IGNORECASE),
-                    description="Function constructor - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'require\s*\(\s*[\'"]child_process[\'"]', re.IGNORECASE),
-                    description="Child process module - command execution",
-                    severity="critical",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'require\s*\(\s*[\'"]fs[\'"]', re.IGNORECASE),
-                    description="File system module - file access",
-                    severity="high",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'require\s*\(\s*[\'"]net[\'"]', re.IGNORECASE),
-                    description="Network module - external access",
-                    severity="high",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'require\s*\(\s*[\'"]http[\'"]', re.IGNORECASE),
-                    description="HTTP module - external access",
-                    severity="high",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'process\.exit', re.IGNORECASE),
-                    description="Process exit - potential disruption",
-                    severity="medium",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'while\s*\(\s*true\s*\)', re.IGNORECASE),
-                    description="Infinite loop detected - potential DoS",
-                    severity="medium",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'__proto__', re.IGNORECASE),
-                    description="Prototype pollution attempt",
-                    severity="high",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'constructor\.constructor', re.IGNORECASE),
-                    description="Constructor access - potential code execution",
-                    severity="high",
-                    language=ProgrammingLanguage.JAVASCRIPT
-                ),
-            ],
+        self._patterns = _PATTERNS
+        self._import_patterns = _IMPORT_PATTERNS
+        self._scratch = _SCRATCH
+        self._cache = _VALIDATION_CACHE
+        self._cache_lock = _VALIDATION_CACHE_LOCK
+    
+    def _match_with_re(
+        self,
+        code: str,
+        combined: Pattern[str],
+        patterns: List[SecurityPattern],
+        lines: _LineIndex
+    ) -> Iterator[Tuple[SecurityPattern, int]]:
+        """Yield ``(pattern, line number)`` for each match of the fused regex."""
+        for match in combined.finditer(code):
+            yield patterns[int(match.lastgroup[1:])], lines.line_of(match.start())
+    
+    def _match_with_hyperscan(
+        self,
+        code: str,
+        language: ProgrammingLanguage,
+        database: Any,
+        patterns: List[SecurityPattern]
+    ) -> Iterator[Tuple[SecurityPattern, int]]:
+        """Yield ``(pattern, line number)`` for each Hyperscan match."""
+        # UTF-8 mode needs valid input; a replaced lone surrogate is still not a newline
+        buffer = code.encode('utf-8', 'replace')
+        matches = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matches.append((pattern_id, start))
+        
+        database.scan(buffer, match_event_handler=on_match, scratch=self._get_scratch(language, database))
+        
+        # Hyperscan reports byte offsets, so index newlines in the encoded buffer
+        lines = _LineIndex(buffer)
+        for index, start in matches:
+            yield patterns[index], lines.line_of(start)
+    
+    def _match_imports(
+        self,
+        code: str,
+        language: ProgrammingLanguage,
+        lines: _LineIndex
+    ) -> Iterator[Tuple[SecurityPattern, int]]:
+        """Yield ``(pattern, line number)`` for each import of a blocked module."""
+        import_patterns = self._import_patterns.get(language)
+        if not import_patterns:
+            return
+        
+        for match in _PYTHON_IMPORT.finditer(code):
+            if match.group(1):
+                names = [match.group(1)]
+            else:
+                names = match.group(2).split(',')
             
-            ProgrammingLanguage.TYPESCRIPT: [
-                # TypeScript inherits JavaScript patterns plus some additional ones
-                SecurityPattern(
-                    pattern=re.compile(r'\beval\s*\(', re.IGNORECASE),
-                    description="Use of eval() function - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.TYPESCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'Function\s*\(', re.IGNORECASE),
-                    description="Function constructor - can execute arbitrary code",
-                    severity="critical",
-                    language=ProgrammingLanguage.TYPESCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'require\s*\(\s*[\'"]child_process[\'"]', re.IGNORECASE),
-                    description="Child process module - command execution",
-                    severity="critical",
-                    language=ProgrammingLanguage.TYPESCRIPT
-                ),
-                SecurityPattern(
-                    pattern=re.compile(r'import.*from\s+[\'"]child_process[\'"]', re.IGNORECASE),
-                    description="Child process import - command execution",
-                    severity="critical",
-                    language=ProgrammingLanguage.TYPESCRIPT
-                ),
-            ]
-        }
+            for name in names:
+                module = name.split()[0].split('.')[0].lower()
+                pattern_def = import_patterns.get(module)
+                if pattern_def is not None:
+                    yield pattern_def, lines.line_of(match.start())
+    
+    def _get_scratch(self, language: ProgrammingLanguage, database: Any) -> Any:
+        """Get this thread's Hyperscan scratch space for a language database."""
+        scratches = getattr(self._scratch, 'by_language', None)
+        if scratches is None:
+            scratches = self._scratch.by_language = {}
         
-        # Add common patterns for Java and Go when implemented
-        patterns[ProgrammingLanguage.JAVA] = []
-        patterns[ProgrammingLanguage.GO] = []
+        scratch = scratches.get(language)
+        if scratch is None:
+            scratch = scratches[language] = hyperscan.Scratch(database)
         
-        return patterns
+        return scratch
     
     def validate_code(self, code: str, language: ProgrammingLanguage) -> List[SecurityViolation]:
-        """Validate code for security violations."""
-        violations = []
+        """Validate code for security violations.
+        
+        Results are cached per language and code digest, so resubmitting the
+        same code skips scanning entirely. Oversize or binary input is
+        rejected with a single critical violation without being scanned.
+        """
+        rejected = _reject_input(code)
+        if rejected is not None:
+            return [rejected]
         
-        if language not in self._patterns:
-            return violations
+        digest = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        key = (language, digest)
         
-        lines = code.split('\n')
-        patterns = self._patterns[language]
+        with self._cache_lock:
+            violations = self._cache.get(key)
+            if violations is not None:
+                self._cache.move_to_end(key)
         
-        for pattern_def in patterns:
-            for line_num, line in enumerate(lines, 1):
-                if pattern_def.pattern.search(line):
-                    violations.append(SecurityViolation(
-                        pattern=pattern_def.pattern.pattern,
-                        line_number=line_num,
-                        description=pattern_def.description,
-                        severity=pattern_def.severity
-                    ))
+        if violations is None:
+            violations = tuple(self.iter_violations(code, language))
+            with self._cache_lock:
+                self._cache[key] = violations
+                if len(self._cache) > VALIDATION_CACHE_SIZE:
+                    self._cache.popitem(last=False)
         
-        return violations
+        return list(violations)
     
-    def sanitize_code(self, code: str, language: ProgrammingLanguage) -> str:
-        """Sanitize code by removing or replacing dangerous constructs."""
-        sanitized = code
+    async def validate_code_async(self, code: str, language: ProgrammingLanguage) -> List[SecurityViolation]:
+        """Validate code in a worker thread so CPU-bound scanning does not block the event loop."""
+        return await asyncio.to_thread(self.validate_code, code, language)
+    
+    def iter_violations(self, code: str, language: ProgrammingLanguage) -> Iterator[SecurityViolation]:
+        """Lazily yield security violations in code, without consulting the cache."""
+        rejected = _reject_input(code)
+        if rejected is not None:
+            yield rejected
+            return
         
-        if language == ProgrammingLanguage.PYTHON:
-            # Replace dangerous functions with safe alternatives
-            sanitized = re.sub(r'\beval\s*\(', 'safe_eval(', sanitized, flags=re.IGNORECASE)
-            sanitized = re.sub(r'\bexec\s*\(', 'safe_exec(', sanitized, flags=re.IGNORECASE)
+        if not _compile_literal_prefilter(language)(code.lower()):
+            return
+        
+        lines = _LineIndex(code)
+        
+        database = _compile_hyperscan_database(language)
+        combined = _compile_combined_pattern(language)
+        if database is not None:
+            matches = self._match_with_hyperscan(code, language, database, self._patterns[language])
+        elif combined is not None:
+            matches = self._match_with_re(code, combined, self._patterns[language], lines)
+        else:
+            matches = iter(())
+        
+        seen = set()
+        mark_seen = seen.add
+        violation = SecurityViolation
+        
+        for pattern_def, line_number in chain(matches, self._match_imports(code, language, lines)):
+            # Report each pattern at most once per line
+            key = (pattern_def, line_number)
+            if key in seen:
+                continue
+            mark_seen(key)
             
-        elif language in [ProgrammingLanguage.JAVASCRIPT, ProgrammingLanguage.TYPESCRIPT]:
-            # Replace dangerous functions
-            sanitized = re.sub(r'\beval\s*\(', 'safe_eval(', sanitized, flags=re.IGNORECASE)
-            sanitized = re.sub(r'Function\s*\(', 'SafeFunction(', sanitized, flags=re.IGNORECASE)
+            yield violation(
+                pattern_def.pattern.pattern,
+                line_number,
+                pattern_def.description,
+                pattern_def.severity
+            )
+    
+    def sanitize_code(self, code: str, language: ProgrammingLanguage) -> str:
+        """Sanitize code by removing or replacing dangerous constructs."""
+        rules = _SANITIZE_RULES.get(language)
+        if rules is None:
+            return code
         
-        return sanitized
+        pattern, replacements = rules
+        return pattern.sub(lambda match: replacements[match.lastgroup], code)
     
     def is_code_safe(self, code: str, language: ProgrammingLanguage) -> bool:
-        """Check if code is safe to execute."""
-        violations = self.validate_code(code, language)
-        critical_violations = [v for v in violations if v.severity == 'critical']
-        return len(critical_violations) == 0
-    
-    def get_blocked_imports(self, language: ProgrammingLanguage) -> List[str]:
-        """Get list of blocked imports for a language."""
-        blocked_imports = {
-            ProgrammingLanguage.PYTHON: [
-                'os', 'subprocess', 'sys', 'socket', 'urllib', 'requests',
-                'http', 'ftplib', 'smtplib', 'telnetlib', 'multiprocessing',
-                'threading', 'ctypes', 'importlib'
-            ],
-            ProgrammingLanguage.JAVASCRIPT: [
-                'child_process', 'fs', 'net', 'http', 'https', 'cluster',
-                'worker_threads', 'dgram', 'tls', 'crypto'
-            ],
-            ProgrammingLanguage.TYPESCRIPT: [
-                'child_process', 'fs', 'net', 'http', 'https', 'cluster',
-                'worker_threads', 'dgram', 'tls', 'crypto'
-            ]
-        }
+        """Check if code is safe to execute.
+        
+        Stops at the first critical match instead of collecting every violation.
+        """
+        if _reject_input(code) is not None:
+            return False
+        
+        if not _compile_literal_prefilter(language)(code.lower()):
+            return True
         
-        return blocked_imports.get(language, [])
\ No newline at end of file
+        critical = _compile_critical_pattern(language)
+        if critical is not None and critical.search(code) is not None:
+            return False
+        
+        return not any(
+            pattern_def.severity is Severity.CRITICAL
+            for pattern_def, _ in self._match_imports(code, language, _LineIndex(code))
+        )
+    
+    def get_blocked_imports(self, language: ProgrammingLanguage) -> FrozenSet[str]:
+        """Get the set of blocked imports for a language."""
+        return _BLOCKED_IMPORTS.get(language, frozenset())
+
+
+# Shared validator instance used by the module-level helpers below
+validator = SecurityValidator()
+
+
+def validate_code(code: str, language: ProgrammingLanguage) -> List[SecurityViolation]:
+    """Validate code for security violations using the shared validator."""
+    return validator.validate_code(code, language)
+
+
+async def validate_code_async(code: str, language: ProgrammingLanguage) -> List[SecurityViolation]:
+    """Validate code in a worker thread using the shared validator."""
+    return await validator.validate_code_async(code, language)
+
+
+def sanitize_code(code: str, language: ProgrammingLanguage) -> str:
+    """Sanitize dangerous constructs in code using the shared validator."""
+    return validator.sanitize_code(code, language)
+
+
+def is_code_safe(code: str, language: ProgrammingLanguage) -> bool:
+    """Check if code is safe to execute using the shared validator."""
+    return validator.is_code_safe(code, language)
+
+
+def get_blocked_imports(language: ProgrammingLanguage) -> FrozenSet[str]:
+    """Get the set of blocked imports for a language."""
+    return validator.get_blocked_imports(language)
@@ -3,10 +3,12 @@ Domain value objects for the Agentic Learning Coach system.
 """
 
 from .enums import SkillLevel, TaskType, SubmissionStatus, LearningPlanStatus
+from .submissions_batch import SubmissionsBatch
 
 __all__ = [
     'SkillLevel',
     'TaskType', 
     'SubmissionStatus',
-    'LearningPlanStatus'
+    'LearningPlanStatus',
+    'SubmissionsBatch'
 ]
\ No newline at end of file
@@ -25,6 +25,23 @@ class SubmissionStatus(Enum):
     PASS = "PASS"
     FAIL = "FAIL"
     PARTIAL = "PARTIAL"
+    
+    def to_int(self) -> int:
+        """Return the compact storage code (FAIL=0, PASS=1, PARTIAL=2)."""
+        return _SUBMISSION_STATUS_CODES[self]
+    
+    @classmethod
+    def from_int(cls, code: int) -> 'SubmissionStatus':
+        """Return the status stored under a compact code."""
+        return _SUBMISSION_STATUSES_BY_CODE[code]
+
+
+_SUBMISSION_STATUS_CODES = {
+    SubmissionStatus.FAIL: 0,
+    SubmissionStatus.PASS: 1,
+    SubmissionStatus.PARTIAL: 2,
+}
+_SUBMISSION_STATUSES_BY_CODE = {code: status for status, code in _SUBMISSION_STATUS_CODES.items()}
 
 
 class LearningPlanStatus(Enum):
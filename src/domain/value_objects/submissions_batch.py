@@ -0,0 +1,78 @@
+"""
+Columnar batch of submission outcomes for analytics.
+"""
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from .enums import SubmissionStatus
+
+
+# Compact codes stored in SubmissionsBatch.statuses, matching the database column
+STATUS_CODES = {status: status.to_int() for status in SubmissionStatus}
+_PASS_CODE = STATUS_CODES[SubmissionStatus.PASS]
+
+
+@dataclass(frozen=True, eq=False)
+class SubmissionsBatch:
+    """
+    Submission outcomes stored column by column in typed arrays.
+    
+    Analytics paths only need a few numeric fields per submission, so this
+    keeps them in flat arrays instead of one Python object per row:
+    ``scores`` is float32 with NaN for unscored submissions, ``statuses``
+    holds one-byte ``STATUS_CODES``, ``execution_times_ms`` is int64 with 0
+    for unknown, and ``submitted_at`` is POSIX seconds as float64.
+    """
+    scores: array = field(default_factory=lambda: array('f'))
+    statuses: array = field(default_factory=lambda: array('B'))
+    execution_times_ms: array = field(default_factory=lambda: array('q'))
+    submitted_at: array = field(default_factory=lambda: array('d'))
+    
+    @classmethod
+    def from_records(
+        cls, 
+        records: Iterable[Tuple[Optional[float], SubmissionStatus, Optional[int], datetime]]
+    ) -> 'SubmissionsBatch':
+        """
+        Build a batch from ``(score, status, execution_time_ms, submitted_at)`` rows.
+        
+        Args:
+            records: Rows as returned by a narrow SELECT over submissions
+        
+        Returns:
+            SubmissionsBatch: The rows split into typed columns
+        """
+        batch = cls()
+        for score, status, execution_time_ms, submitted_at in records:
+            batch.scores.append(math.nan if score is None else score)
+            batch.statuses.append(STATUS_CODES[status])
+            batch.execution_times_ms.append(execution_time_ms or 0)
+            batch.submitted_at.append(submitted_at.timestamp())
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.statuses)
+    
+    @property
+    def passed_count(self) -> int:
+        """Number of submissions with a PASS status."""
+        return self.statuses.count(_PASS_CODE)
+    
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of submissions that passed, 0.0 for an empty batch."""
+        return self.passed_count / len(self) if len(self) else 0.0
+    
+    @property
+    def average_score(self) -> float:
+        """Mean over scored submissions, 0.0 when none are scored."""
+        scored = [score for score in self.scores if not math.isnan(score)]
+        return math.fsum(scored) / len(scored) if scored else 0.0
+    
+    @property
+    def total_execution_time_ms(self) -> int:
+        """Sum of recorded execution times."""
+        return sum(self.execution_times_ms)
@@ -11,7 +11,10 @@ from .base_repository import (
 )
 from .user_repository import UserRepository
 from .curriculum_repository import CurriculumRepository
-from .submission_repository import SubmissionRepository
+from .submission_repository import SubmissionRepository, SubmissionCursor
+from .batch_loader import BatchLoader
+from .batching_evaluation_writer import BatchingEvaluationWriter
+from .caching_user_repository import CachingUserRepository
 
 __all__ = [
     # Base repository
@@ -24,5 +27,11 @@ __all__ = [
     # Specific repositories
     'UserRepository',
     'CurriculumRepository',
-    'SubmissionRepository'
+    'SubmissionRepository',
+    'SubmissionCursor',
+    
+    # Helpers
+    'BatchLoader',
+    'BatchingEvaluationWriter',
+    'CachingUserRepository'
 ]
\ No newline at end of file
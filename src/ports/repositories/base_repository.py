@@ -1,22 +1,34 @@
 """
 Base repository interface for the Agentic Learning Coach system.
+
+Implementation contract
+-----------------------
+Every SQL-backed repository in this package must:
+
+(a) Reuse prepared statements instead of parsing and planning SQL on each
+    call, e.g. statements cached on the connection for the lifetime of the
+    pool or built once and reused (see ``PreparedStatements``).
+(b) Configure the driver's per-connection statement cache with at least
+    256 entries (asyncpg ``prepared_statement_cache_size``).
+(c) Pass every value as a bound parameter, never by string interpolation,
+    so one plan is shared by all users.
 """
-from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List, Any
+from typing import TypeVar, Optional, List, Any, Protocol, runtime_checkable
 
 # Generic type for domain entities
 T = TypeVar('T')
 
 
-class BaseRepository(ABC, Generic[T]):
+@runtime_checkable
+class BaseRepository(Protocol[T]):
     """
-    Abstract base repository interface defining common CRUD operations.
+    Base repository protocol defining common CRUD operations.
     
     This interface provides a foundation for all repository implementations
     following the dependency inversion principle and generic patterns.
+    Implementations satisfy it structurally and need not inherit from it.
     """
     
-    @abstractmethod
     async def save(self, entity: T) -> T:
         """
         Save an entity (create or update).
@@ -27,9 +39,8 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             T: The saved entity
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, entity_id: str) -> Optional[T]:
         """
         Retrieve an entity by its unique identifier.
@@ -40,9 +51,8 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             T or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, entity_id: str) -> bool:
         """
         Delete an entity by its unique identifier.
@@ -53,9 +63,8 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             bool: True if deleted, False if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def exists(self, entity_id: str) -> bool:
         """
         Check if an entity exists by its unique identifier.
@@ -66,9 +75,8 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             bool: True if entity exists, False otherwise
         """
-        pass
+        ...
     
-    @abstractmethod
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """
         List all entities with pagination.
@@ -80,9 +88,8 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             List[T]: List of entities
         """
-        pass
+        ...
     
-    @abstractmethod
     async def count(self) -> int:
         """
         Get the total count of entities.
@@ -90,7 +97,7 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             int: Total number of entities
         """
-        pass
+        ...
 
 
 class RepositoryError(Exception):
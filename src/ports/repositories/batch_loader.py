@@ -0,0 +1,101 @@
+"""
+Batch loader for coalescing per-key repository reads.
+"""
+import asyncio
+from typing import (
+    Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Mapping, Optional, TypeVar
+)
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce ``load(key)`` calls made within one event-loop tick into a single
+    bulk fetch.
+    
+    Callers keep per-item ``await loader.load(key)`` semantics while the
+    repository receives one ``batch_fn(keys)`` call, typically backed by a
+    bulk method such as ``SubmissionRepository.get_submissions_bulk``.
+    Keys missing from the mapping returned by ``batch_fn`` resolve to None.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int = 500
+    ):
+        """
+        Initialize the loader.
+        
+        Args:
+            batch_fn: Coroutine function resolving a list of keys to a mapping
+            max_batch_size: Maximum number of keys passed to one batch_fn call
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[K, asyncio.Future] = {}
+    
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Load a single value, batched with other loads issued in the same tick.
+        
+        Args:
+            key: Key to load
+        
+        Returns:
+            The loaded value or None if not found
+        """
+        return await self._enqueue(key)
+    
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        Load several values in one batch, preserving the order of ``keys``.
+        
+        Args:
+            keys: Keys to load
+        
+        Returns:
+            List of loaded values, None for keys that were not found
+        """
+        futures = [self._enqueue(key) for key in keys]
+        if not futures:
+            return []
+        return list(await asyncio.gather(*futures))
+    
+    def _enqueue(self, key: K) -> asyncio.Future:
+        """Return the pending future for ``key``, scheduling a dispatch if needed."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[key] = future
+        return future
+    
+    def _dispatch(self) -> None:
+        """Hand every pending key to ``batch_fn`` in chunks of max_batch_size."""
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = keys[start:start + self._max_batch_size]
+            asyncio.ensure_future(self._run_batch({key: pending[key] for key in chunk}))
+    
+    async def _run_batch(self, batch: Dict[K, asyncio.Future]) -> None:
+        """Execute one bulk fetch and resolve the futures waiting on it."""
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
@@ -0,0 +1,159 @@
+"""
+Write-through caching decorator for UserRepository implementations.
+"""
+import copy
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ...domain.entities import UserProfile
+from ...domain.value_objects import SkillLevel
+from .user_repository import UserRepository
+
+
+class CachingUserRepository(UserRepository):
+    """
+    UserRepository decorator that caches profile reads in memory.
+    
+    Profiles are cached by user ID and by normalized email with an LRU
+    bound and a TTL. Every write goes to the wrapped repository first and
+    then evicts the user's entries (write-through invalidation), so a read
+    after a write always reaches the store. Lookups that find nothing are
+    not cached. Profiles are mutable, so the cache stores and hands out
+    copies; a caller editing its profile never changes what others read.
+    """
+    
+    def __init__(
+        self,
+        delegate: UserRepository,
+        maxsize: int = 10_000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the caching repository.
+        
+        Args:
+            delegate: Repository that owns the data
+            maxsize: Maximum number of cached keys
+            ttl: Seconds a cached profile stays valid
+            clock: Monotonic time source, injectable for tests
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        
+        self._delegate = delegate
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, UserProfile]]" = OrderedDict()
+        self._emails_by_user: Dict[str, Set[str]] = {}
+        # Bumped on every invalidation so reads racing a write don't repopulate stale data
+        self._generation = 0
+    
+    async def create_user(self, email: str, name: str) -> UserProfile:
+        """Create a user through the wrapped repository."""
+        return await self._delegate.create_user(email, name)
+    
+    async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
+        """Return a cached profile by user ID, loading it on a miss."""
+        key = ('id', user_id)
+        profile = self._get(key)
+        if profile is not None:
+            return profile
+        
+        generation = self._generation
+        profile = await self._delegate.get_user_profile(user_id)
+        if profile is not None and generation == self._generation:
+            self._put(key, profile)
+        return profile
+    
+    async def get_user_profile_by_email(self, email: str) -> Optional[UserProfile]:
+        """Return a cached profile by email, loading it on a miss."""
+        normalized = email.strip().lower()
+        key = ('email', normalized)
+        profile = self._get(key)
+        if profile is not None:
+            return profile
+        
+        generation = self._generation
+        profile = await self._delegate.get_user_profile_by_email(email)
+        if profile is not None and generation == self._generation:
+            self._put(key, profile)
+            self._put(('id', profile.user_id), profile)
+            self._emails_by_user.setdefault(profile.user_id, set()).add(normalized)
+        return profile
+    
+    async def update_user_profile(self, profile: UserProfile) -> UserProfile:
+        """Update the profile in the store, then evict it from the cache."""
+        try:
+            return await self._delegate.update_user_profile(profile)
+        finally:
+            self.invalidate(profile.user_id)
+    
+    async def update_skill_level(self, user_id: str, skill_level: SkillLevel) -> None:
+        """Update the skill level in the store, then evict the user from the cache."""
+        try:
+            await self._delegate.update_skill_level(user_id, skill_level)
+        finally:
+            self.invalidate(user_id)
+    
+    async def delete_user_profile(self, user_id: str) -> bool:
+        """Delete the profile from the store, then evict it from the cache."""
+        try:
+            return await self._delegate.delete_user_profile(user_id)
+        finally:
+            self.invalidate(user_id)
+    
+    async def list_users(self, limit: int = 100, offset: int = 0) -> List[UserProfile]:
+        """List users through the wrapped repository; pages are not cached."""
+        return await self._delegate.list_users(limit, offset)
+    
+    async def count_users(self) -> int:
+        """Count users through the wrapped repository."""
+        return await self._delegate.count_users()
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Evict every cached entry for a user.
+        
+        Args:
+            user_id: Unique identifier for the user
+        """
+        self._generation += 1
+        self._entries.pop(('id', user_id), None)
+        for email in self._emails_by_user.pop(user_id, ()):
+            self._entries.pop(('email', email), None)
+    
+    def clear(self) -> None:
+        """Evict every cached entry."""
+        self._generation += 1
+        self._entries.clear()
+        self._emails_by_user.clear()
+    
+    def _get(self, key: Tuple[str, str]) -> Optional[UserProfile]:
+        """Return a live cached profile and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, profile = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return copy.deepcopy(profile)
+    
+    def _put(self, key: Tuple[str, str], profile: UserProfile) -> None:
+        """Store a profile, evicting the least recently used entries past maxsize."""
+        self._entries[key] = (self._clock() + self._ttl, copy.deepcopy(profile))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            (kind, value), (_, evicted) = self._entries.popitem(last=False)
+            if kind == 'email':
+                emails = self._emails_by_user.get(evicted.user_id)
+                if emails is not None:
+                    emails.discard(value)
+                    if not emails:
+                        del self._emails_by_user[evicted.user_id]
@@ -1,23 +1,25 @@
 """
 Curriculum repository interface for the Agentic Learning Coach system.
+
+SQL implementations follow the implementation contract in ``base_repository``.
 """
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Protocol, runtime_checkable
 
 from ...domain.entities import LearningPlan, Module, Task
 from ...domain.value_objects import LearningPlanStatus
 
 
-class CurriculumRepository(ABC):
+@runtime_checkable
+class CurriculumRepository(Protocol):
     """
-    Abstract repository interface for curriculum and learning plan operations.
+    Repository protocol for curriculum and learning plan operations.
     
     This interface defines the contract for learning plan, module, and task
     persistence operations following the dependency inversion principle.
+    Implementations satisfy it structurally and need not inherit from it.
     """
     
     # Learning Plan Operations
-    @abstractmethod
     async def save_plan(self, plan: LearningPlan) -> LearningPlan:
         """
         Save a learning plan (create or update).
@@ -28,9 +30,8 @@ class CurriculumRepository(ABC):
         Returns:
             LearningPlan: The saved learning plan
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_plan(self, plan_id: str) -> Optional[LearningPlan]:
         """
         Retrieve a learning plan by ID.
@@ -41,9 +42,8 @@ class CurriculumRepository(ABC):
         Returns:
             LearningPlan or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_active_plan(self, user_id: str) -> Optional[LearningPlan]:
         """
         Get the active learning plan for a user.
@@ -54,9 +54,8 @@ class CurriculumRepository(ABC):
         Returns:
             LearningPlan or None if no active plan exists
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_user_plans(self, user_id: str) -> List[LearningPlan]:
         """
         Get all learning plans for a user.
@@ -67,9 +66,8 @@ class CurriculumRepository(ABC):
         Returns:
             List[LearningPlan]: List of user's learning plans
         """
-        pass
+        ...
     
-    @abstractmethod
     async def update_plan_status(self, plan_id: str, status: LearningPlanStatus) -> None:
         """
         Update the status of a learning plan.
@@ -81,9 +79,8 @@ class CurriculumRepository(ABC):
         Raises:
             PlanNotFoundError: If plan doesn't exist
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete_plan(self, plan_id: str) -> bool:
         """
         Delete a learning plan and all associated modules/tasks.
@@ -94,10 +91,9 @@ class CurriculumRepository(ABC):
         Returns:
             bool: True if deleted, False if not found
         """
-        pass
+        ...
     
     # Module Operations
-    @abstractmethod
     async def save_module(self, module: Module) -> Module:
         """
         Save a module (create or update).
@@ -108,9 +104,8 @@ class CurriculumRepository(ABC):
         Returns:
             Module: The saved module
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_module(self, module_id: str) -> Optional[Module]:
         """
         Retrieve a module by ID.
@@ -121,9 +116,8 @@ class CurriculumRepository(ABC):
         Returns:
             Module or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_plan_modules(self, plan_id: str) -> List[Module]:
         """
         Get all modules for a learning plan.
@@ -134,9 +128,8 @@ class CurriculumRepository(ABC):
         Returns:
             List[Module]: List of modules ordered by order_index
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete_module(self, module_id: str) -> bool:
         """
         Delete a module and all associated tasks.
@@ -147,10 +140,9 @@ class CurriculumRepository(ABC):
         Returns:
             bool: True if deleted, False if not found
         """
-        pass
+        ...
     
     # Task Operations
-    @abstractmethod
     async def save_task(self, task: Task) -> Task:
         """
         Save a task (create or update).
@@ -161,9 +153,8 @@ class CurriculumRepository(ABC):
         Returns:
             Task: The saved task
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_task(self, task_id: str) -> Optional[Task]:
         """
         Retrieve a task by ID.
@@ -174,9 +165,8 @@ class CurriculumRepository(ABC):
         Returns:
             Task or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_module_tasks(self, module_id: str) -> List[Task]:
         """
         Get all tasks for a module.
@@ -187,9 +177,8 @@ class CurriculumRepository(ABC):
         Returns:
             List[Task]: List of tasks ordered by day_offset
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_tasks_for_day(self, user_id: str, day_offset: int) -> List[Task]:
         """
         Get all tasks scheduled for a specific day for a user.
@@ -201,9 +190,8 @@ class CurriculumRepository(ABC):
         Returns:
             List[Task]: List of tasks for the specified day
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_user_tasks_by_date_range(
         self, 
         user_id: str, 
@@ -221,9 +209,8 @@ class CurriculumRepository(ABC):
         Returns:
             List[Task]: List of tasks within the date range
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete_task(self, task_id: str) -> bool:
         """
         Delete a task.
@@ -234,4 +221,4 @@ class CurriculumRepository(ABC):
         Returns:
             bool: True if deleted, False if not found
         """
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
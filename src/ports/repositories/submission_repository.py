@@ -1,12 +1,20 @@
 """
 Submission repository interface for the Agentic Learning Coach system.
+
+SQL implementations follow the implementation contract in ``base_repository``.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import AsyncIterator, NamedTuple, Optional, List, Dict, Tuple
 from datetime import datetime
 
 from ...domain.entities import Submission, EvaluationResult
-from ...domain.value_objects import SubmissionStatus
+from ...domain.value_objects import SubmissionStatus, SubmissionsBatch
+
+
+class SubmissionCursor(NamedTuple):
+    """Keyset position of the last submission on a page."""
+    submitted_at: datetime
+    submission_id: str
 
 
 class SubmissionRepository(ABC):
@@ -15,6 +23,10 @@ class SubmissionRepository(ABC):
     
     This interface defines the contract for submission and evaluation result
     persistence operations following the dependency inversion principle.
+    
+    Implementations must draw connections from the application's shared
+    connection pool (e.g. an ``AsyncSession`` bound to the pooled async
+    engine) and never open a dedicated connection per call.
     """
     
     # Submission Operations
@@ -36,6 +48,22 @@ class SubmissionRepository(ABC):
         """Alias for save_submission."""
         return await self.save_submission(submission)
     
+    @abstractmethod
+    async def save_submissions_bulk(self, submissions: List[Submission]) -> List[Submission]:
+        """
+        Save many submissions (create or update) in one batch.
+        
+        Implementations must send the rows as a single batched statement and
+        commit once, rather than one round trip per submission.
+        
+        Args:
+            submissions: The submissions to save
+            
+        Returns:
+            List[Submission]: The saved submissions, in input order
+        """
+        pass
+    
     @abstractmethod
     async def get_submission(self, submission_id: str) -> Optional[Submission]:
         """
@@ -49,6 +77,22 @@ class SubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_submissions_bulk(self, submission_ids: List[str]) -> Dict[str, Submission]:
+        """
+        Retrieve many submissions by ID in a single query.
+        
+        Implementations must resolve all IDs with one round trip
+        (e.g. ``WHERE id IN (...)``) rather than one query per ID.
+        
+        Args:
+            submission_ids: Unique identifiers for the submissions
+            
+        Returns:
+            Dict[str, Submission]: Submissions keyed by ID; missing IDs are omitted
+        """
+        pass
+    
     @abstractmethod
     async def get_user_submissions(
         self, 
@@ -59,6 +103,9 @@ class SubmissionRepository(ABC):
         """
         Get all submissions for a user with pagination.
         
+        Offset pagination reads and discards every skipped row, so it is
+        only suitable for shallow pages. Prefer ``get_user_submissions_page``.
+        
         Args:
             user_id: Unique identifier for the user
             limit: Maximum number of submissions to return
@@ -69,6 +116,63 @@ class SubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_user_submissions_page(
+        self, 
+        user_id: str, 
+        after: Optional[SubmissionCursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Submission], Optional[SubmissionCursor]]:
+        """
+        Get one page of a user's submissions with keyset pagination, newest first.
+        
+        SQL-backed implementations issue ``WHERE user_id = :user_id AND
+        (submitted_at, id) < (:after_submitted_at, :after_id) ORDER BY
+        submitted_at DESC, id DESC LIMIT :limit`` against a composite
+        ``(user_id, submitted_at DESC, id DESC)`` index, so every page reads
+        only ``limit`` rows however deep it is.
+        
+        Args:
+            user_id: Unique identifier for the user
+            after: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of submissions to return
+            
+        Returns:
+            Tuple of the page's submissions and the cursor for the next page,
+            or None when there are no more submissions
+        """
+        pass
+    
+    async def iter_user_submissions(
+        self, 
+        user_id: str, 
+        batch_size: int = 200
+    ) -> AsyncIterator[Submission]:
+        """
+        Stream all submissions for a user, newest first.
+        
+        Use this instead of ``get_user_submissions`` when walking a user's
+        full history: the caller sees the first submission without waiting
+        for the whole result, and at most ``batch_size`` rows are held in
+        memory. The default implementation pages through
+        ``get_user_submissions_page``. SQL-backed implementations should
+        override it with a server-side cursor.
+        
+        Args:
+            user_id: Unique identifier for the user
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Submission: The user's submissions
+        """
+        cursor = None
+        while True:
+            page, cursor = await self.get_user_submissions_page(user_id, after=cursor, limit=batch_size)
+            for submission in page:
+                yield submission
+            if cursor is None:
+                return
+    
     @abstractmethod
     async def get_task_submissions(
         self, 
@@ -92,15 +196,34 @@ class SubmissionRepository(ABC):
         self, 
         user_id: str, 
         start_date: datetime, 
-        end_date: datetime
+        end_date: datetime,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Submission]:
         """
-        Get submissions within a date range for a user.
+        Get submissions within a date range for a user, newest first.
+        
+        The date filter and pagination must be applied by the storage layer,
+        never by fetching all rows and filtering in Python. SQL-backed
+        implementations issue ``WHERE user_id = :user_id AND submitted_at
+        BETWEEN :start AND :end ORDER BY submitted_at DESC LIMIT :limit
+        OFFSET :offset`` against a composite ``(user_id, submitted_at DESC)``
+        index, so only the returned rows are read.
+        
+        Storage contract: the range must compare fixed-width integer instants.
+        Convert ``start_date`` and ``end_date`` to UTC once, bind them as two
+        parameters, and compare them against a column stored as an absolute
+        instant. PostgreSQL ``timestamptz`` qualifies, since it is stored as
+        int64 microseconds since the epoch. A store that keeps local or textual
+        timestamps must add an indexed ``submitted_at_ticks BIGINT`` column
+        (UTC microseconds since the epoch) and filter on that column instead.
         
         Args:
             user_id: Unique identifier for the user
             start_date: Start of date range (inclusive)
             end_date: End of date range (inclusive)
+            limit: Maximum number of submissions to return (None for all)
+            offset: Number of submissions to skip
             
         Returns:
             List[Submission]: List of submissions within date range
@@ -134,6 +257,26 @@ class SubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def save_evaluations_bulk(
+        self, 
+        evaluations: List[EvaluationResult]
+    ) -> List[EvaluationResult]:
+        """
+        Save many evaluation results (create or update) in one transaction.
+        
+        Evaluation rows are written as a single batched statement. When a
+        batch holds several evaluations for one submission, the last one
+        determines the submission's status, as with sequential saves.
+        
+        Args:
+            evaluations: The evaluation results to save
+            
+        Returns:
+            List[EvaluationResult]: The saved evaluation results, in input order
+        """
+        pass
+    
     @abstractmethod
     async def get_evaluation(self, evaluation_id: str) -> Optional[EvaluationResult]:
         """
@@ -173,6 +316,23 @@ class SubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_latest_evaluations_bulk(
+        self, 
+        submission_ids: List[str]
+    ) -> Dict[str, EvaluationResult]:
+        """
+        Get the most recent evaluation result for many submissions in a single query.
+        
+        Args:
+            submission_ids: Unique identifiers for the submissions
+            
+        Returns:
+            Dict[str, EvaluationResult]: Latest evaluation keyed by submission ID;
+            submissions without evaluations are omitted
+        """
+        pass
+    
     @abstractmethod
     async def get_user_evaluations(
         self, 
@@ -184,6 +344,13 @@ class SubmissionRepository(ABC):
         """
         Get evaluation results for a user with optional status filter.
         
+        Storage contract: the submission status is persisted as a SMALLINT
+        using ``SubmissionStatus.to_int()``, not as a text enum, and SQL
+        implementations keep an index on ``submissions(user_id, status)``.
+        Every status is covered, since callers filter on FAIL as well as
+        PASS and PARTIAL. Filtered listings then combine the user and status
+        predicates on that index before ordering by evaluation time.
+        
         Args:
             user_id: Unique identifier for the user
             status_filter: Optional status to filter by
@@ -200,6 +367,12 @@ class SubmissionRepository(ABC):
         """
         Get evaluation statistics for a task.
         
+        Implementations serve this from an incrementally maintained per-task
+        aggregate rather than aggregating over every submission on each call.
+        The aggregates are write-through: every save and delete updates them
+        in the same transaction as the write, so they never diverge from the
+        stored submissions.
+        
         Args:
             task_id: Unique identifier for the task
             
@@ -227,6 +400,9 @@ class SubmissionRepository(ABC):
         """
         Get a summary of user's progress across all submissions.
         
+        Like ``get_task_evaluation_stats`` this reads a maintained per-user
+        aggregate instead of scanning the user's submissions.
+        
         Args:
             user_id: Unique identifier for the user
             
@@ -235,6 +411,41 @@ class SubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_user_progress_batch(self, user_id: str) -> SubmissionsBatch:
+        """
+        Get a user's submission outcomes as a columnar batch, oldest first.
+        
+        For analytics that need per-submission values (distributions, trends)
+        rather than the maintained totals of ``get_user_progress_summary``.
+        Implementations select only the batch columns and never materialize
+        ``Submission`` entities.
+        
+        Args:
+            user_id: Unique identifier for the user
+            
+        Returns:
+            SubmissionsBatch: Score, status, execution time and submission time columns
+        """
+        pass
+    
+    @abstractmethod
+    async def refresh_evaluation_stats(
+        self, 
+        task_id: Optional[str] = None, 
+        user_id: Optional[str] = None
+    ) -> None:
+        """
+        Rebuild the maintained aggregates from stored submissions.
+        
+        Used for backfill and repair; runs the equivalent ``GROUP BY`` once.
+        
+        Args:
+            task_id: Optional task to limit the rebuild to
+            user_id: Optional user to limit the rebuild to
+        """
+        pass
+    
     @abstractmethod
     async def get_submission_count(self, user_id: Optional[str] = None) -> int:
         """
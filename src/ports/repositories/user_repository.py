@@ -1,5 +1,7 @@
 """
 User repository interface for the Agentic Learning Coach system.
+
+SQL implementations follow the implementation contract in ``base_repository``.
 """
 from abc import ABC, abstractmethod
 from typing import Optional, List
@@ -14,6 +16,10 @@ class UserRepository(ABC):
     
     This interface defines the contract for user profile persistence
     operations following the dependency inversion principle.
+    
+    Implementations must draw connections from the application's shared
+    connection pool (e.g. an ``AsyncSession`` bound to the pooled async
+    engine) and never open a dedicated connection per call.
     """
     
     @abstractmethod
@@ -1,7 +1,7 @@
 """Port interface for code execution service."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import FrozenSet, Tuple, final
 
 from ...domain.entities.code_execution import (
     CodeExecutionRequest, CodeExecutionResult, ProgrammingLanguage
@@ -17,11 +17,27 @@ class ICodeExecutionService(ABC):
         pass
     
     @abstractmethod
-    def get_supported_languages(self) -> List[ProgrammingLanguage]:
-        """Get list of supported programming languages."""
+    def get_supported_languages(self) -> Tuple[ProgrammingLanguage, ...]:
+        """
+        Get supported programming languages.
+        
+        Implementations should compute the languages once and return the
+        cached tuple on later calls.
+        """
         pass
     
-    @abstractmethod
+    @property
+    def _supported_set(self) -> FrozenSet[ProgrammingLanguage]:
+        """
+        Supported languages as a set for constant-time membership checks.
+        
+        Implementations should override this with a frozenset cached at
+        construction or on first load. The default builds a new set on
+        every access.
+        """
+        return frozenset(self.get_supported_languages())
+    
+    @final
     def is_language_supported(self, language: ProgrammingLanguage) -> bool:
         """Check if a programming language is supported."""
-        pass
\ No newline at end of file
+        return language in self._supported_set
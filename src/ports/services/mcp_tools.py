@@ -1,9 +1,11 @@
 """
 MCP (Model Context Protocol) tool interfaces for external service integration.
 """
+import asyncio
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Any, Union
 from enum import Enum
 
 
@@ -25,15 +27,42 @@ class DifficultyLevel(str, Enum):
     EXPERT = "expert"
 
 
-@dataclass
+# Value-to-member maps; a dict lookup skips the Enum.__call__ machinery in from_dict
+_RT_MAP: Dict[str, ResourceType] = {member.value: member for member in ResourceType}
+_DL_MAP: Dict[str, DifficultyLevel] = {member.value: member for member in DifficultyLevel}
+
+
+# Canonical topic strings loaded from trusted sources (curricula, analyzers).
+# Objects built through ``from_dict`` share these instances, so a topic
+# that appears on thousands of resources is stored once.
+TOPIC_POOL: Dict[str, str] = {}
+
+
+def register_topics(topics: Iterable[str]) -> None:
+    """Add trusted topic strings to TOPIC_POOL."""
+    for topic in topics:
+        TOPIC_POOL.setdefault(topic, sys.intern(topic))
+
+
+def intern_topics(topics: Iterable[str]) -> List[str]:
+    """Return topics as shared string instances, preferring TOPIC_POOL entries."""
+    return [TOPIC_POOL.get(topic) or sys.intern(topic) for topic in topics]
+
+
+@dataclass(slots=True, frozen=True)
 class LearningResource:
-    """Represents a learning resource from external sources."""
+    """
+    Represents a learning resource from external sources.
+    
+    Instances are immutable; use ``dataclasses.replace`` to derive a copy.
+    They hash on their scalar fields, so they can be deduplicated with a set.
+    """
     title: str
     url: str
     description: str
     resource_type: ResourceType
     difficulty_level: DifficultyLevel
-    topics: List[str]
+    topics: List[str] = field(hash=False)
     language: Optional[str] = None
     last_updated: Optional[str] = None
     quality_score: float = 0.0
@@ -45,11 +74,11 @@ class LearningResource:
         # Handle enum conversion
         resource_type = data.get('resource_type')
         if isinstance(resource_type, str):
-            resource_type = ResourceType(resource_type)
+            resource_type = _RT_MAP.get(resource_type) or ResourceType(resource_type)
         
         difficulty_level = data.get('difficulty_level')
         if isinstance(difficulty_level, str):
-            difficulty_level = DifficultyLevel(difficulty_level)
+            difficulty_level = _DL_MAP.get(difficulty_level) or DifficultyLevel(difficulty_level)
         
         return cls(
             title=data['title'],
@@ -57,7 +86,7 @@ class LearningResource:
             description=data['description'],
             resource_type=resource_type,
             difficulty_level=difficulty_level,
-            topics=data.get('topics', []),
+            topics=intern_topics(data.get('topics', [])),
             language=data.get('language'),
             last_updated=data.get('last_updated'),
             quality_score=data.get('quality_score', 0.0),
@@ -80,15 +109,31 @@ class LearningResource:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeAnalysisResult:
     """Result of static code analysis."""
     complexity_score: float  # 0.0 to 1.0
     difficulty_level: DifficultyLevel
-    issues: List[Dict[str, Any]]
-    suggestions: List[str]
+    issues: List[Dict[str, Any]] = field(hash=False)
+    suggestions: List[str] = field(hash=False)
     estimated_time_minutes: int
-    topics_covered: List[str]
+    topics_covered: List[str] = field(hash=False)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CodeAnalysisResult':
+        """Create a CodeAnalysisResult from a dictionary."""
+        difficulty_level = data.get('difficulty_level')
+        if isinstance(difficulty_level, str):
+            difficulty_level = _DL_MAP.get(difficulty_level) or DifficultyLevel(difficulty_level)
+        
+        return cls(
+            complexity_score=data['complexity_score'],
+            difficulty_level=difficulty_level,
+            issues=data.get('issues', []),
+            suggestions=intern_topics(data.get('suggestions', [])),
+            estimated_time_minutes=data['estimated_time_minutes'],
+            topics_covered=intern_topics(data.get('topics_covered', []))
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -141,6 +186,9 @@ class IDocumentationMCP(ABC):
         """
         Verify and score resource quality.
         
+        Not recommended in loops over result sets: each call waits on its own
+        network I/O. Use ``verify_resource_quality_bulk`` instead.
+        
         Args:
             resource: Resource to verify
             
@@ -149,6 +197,40 @@ class IDocumentationMCP(ABC):
         """
         pass
     
+    async def verify_resource_quality_bulk(self, 
+                                         resources: List[LearningResource],
+                                         max_concurrency: int = 8,
+                                         return_exceptions: bool = False) -> List[Union[float, BaseException]]:
+        """
+        Verify and score many resources concurrently.
+        
+        This is the preferred way to score a result set. The default
+        implementation overlaps up to ``max_concurrency`` calls to
+        ``verify_resource_quality``.
+        
+        Args:
+            resources: Resources to verify
+            max_concurrency: Maximum number of verifications in flight
+            return_exceptions: Return a failed verification's exception in its
+                slot instead of raising it, as ``asyncio.gather`` does
+            
+        Returns:
+            Quality scores (0.0 to 1.0), in the order of ``resources``
+        """
+        if not resources:
+            return []
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def verify(resource: LearningResource) -> float:
+            async with semaphore:
+                return await self.verify_resource_quality(resource)
+        
+        return list(await asyncio.gather(
+            *(verify(resource) for resource in resources),
+            return_exceptions=return_exceptions
+        ))
+    
     @abstractmethod
     async def get_related_resources(self, 
                                   resource: LearningResource,
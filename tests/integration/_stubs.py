@@ -0,0 +1,95 @@
+"""
+Preconfigured async stubs for the services the agents depend on.
+
+Each stub implements only the methods the agents call. Methods are plain
+instance attributes, so a test can swap one (``stub.execute_code =
+const(result)``) and ``reset()`` restores the defaults.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def const(value: Any):
+    """Build a coroutine function that always returns ``value``."""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
+
+
+def raising(error: Exception):
+    """Build a coroutine function that always raises ``error``."""
+    async def _stub(*args, **kwargs):
+        raise error
+    return _stub
+
+
+class DocMCPStub:
+    """
+    Documentation MCP stub serving the same resource for every search.
+    
+    Searches are memoized per ``(query, language, max_results)`` in
+    ``search_cache`` so repeated searches return the same list.
+    """
+    
+    def __init__(self, resource: Any, quality_score: float = 0.85,
+                 content: str = "Function tutorial content..."):
+        self._resource = resource
+        self._quality_score = quality_score
+        self._content = content
+        self.reset()
+    
+    def reset(self) -> None:
+        """Restore the default responses and drop memoized searches."""
+        self.search_cache: Dict[Tuple[str, Optional[str], int], List[Any]] = {}
+        self.search_documentation = self._search_documentation
+        self.verify_resource_quality = const(self._quality_score)
+        self.verify_resource_quality_bulk = self._verify_resource_quality_bulk
+        self.get_resource_content = const(self._content)
+        self.get_related_resources = const([])
+    
+    async def _search_documentation(self, query: str, language: Optional[str] = None,
+                                    max_results: int = 10) -> List[Any]:
+        key = (query, language, max_results)
+        if key not in self.search_cache:
+            self.search_cache[key] = [self._resource]
+        return self.search_cache[key]
+    
+    async def _verify_resource_quality_bulk(self, resources: List[Any],
+                                            max_concurrency: int = 8,
+                                            return_exceptions: bool = False) -> List[float]:
+        return [self._quality_score] * len(resources)
+
+
+class CodeAnalysisMCPStub:
+    """Code analysis MCP stub returning one analysis for every snippet."""
+    
+    def __init__(self, analysis: Any):
+        self._analysis = analysis
+        self.reset()
+    
+    def reset(self) -> None:
+        """Restore the default response."""
+        self.analyze_code_complexity = const(self._analysis)
+
+
+class ExecStub:
+    """Code execution service stub returning one result for every request."""
+    
+    def __init__(self, result: Any):
+        self._result = result
+        self.reset()
+    
+    def reset(self) -> None:
+        """Restore the default response."""
+        self.execute_code = const(self._result)
+
+
+class SubmissionRepoStub:
+    """Submission repository stub returning one saved submission."""
+    
+    def __init__(self, submission: Any):
+        self._submission = submission
+        self.reset()
+    
+    def reset(self) -> None:
+        """Restore the default response."""
+        self.save = const(self._submission)
@@ -1,9 +1,12 @@
 """
 Integration tests for agent interactions and workflows.
 """
+import asyncio
+import dataclasses
+from typing import Final
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 from src.agents.resources_agent import ResourcesAgent
 from src.agents.exercise_generator_agent import ExerciseGeneratorAgent
@@ -18,123 +21,197 @@ from src.domain.entities.code_execution import (
 )
 from src.domain.entities.submission import Submission
 
+from ._stubs import (
+    CodeAnalysisMCPStub, DocMCPStub, ExecStub, SubmissionRepoStub, const, raising
+)
+
+
+def _ok(result, *keys):
+    """Assert an agent result succeeded and its data carries ``keys``."""
+    assert result.success, result.error
+    for key in keys:
+        assert key in result.data, key
+
+
+# Payloads are built once and shared; every one of them is immutable or only read.
+# No test relies on identifiers being unique, so they are fixed.
+_FIXED_REQ_ID = UUID("00000000-0000-4000-8000-000000000001")
+_FIXED_SUB_ID = "00000000-0000-4000-8000-000000000002"
+_FIXED_EXERCISE_ID = "00000000-0000-4000-8000-000000000003"
+
+_DEFAULT_RESOURCE = LearningResource(
+    title="Python Functions Tutorial",
+    url="https://docs.python.org/3/tutorial/controlflow.html#defining-functions",
+    description="Learn how to define and use functions in Python",
+    resource_type=ResourceType.DOCUMENTATION,
+    difficulty_level=DifficultyLevel.INTERMEDIATE,
+    topics=["python", "functions"],
+    language="python",
+    quality_score=0.9,
+    source="docs.python.org"
+)
+
+_DEFAULT_ANALYSIS = CodeAnalysisResult(
+    complexity_score=0.3,
+    difficulty_level=DifficultyLevel.INTERMEDIATE,
+    issues=[],
+    suggestions=["Add comments to explain the logic"],
+    estimated_time_minutes=20,
+    topics_covered=["functions", "python"]
+)
+
+_USAGE_OK = ResourceUsage(0.2, 1024*1024, 512*1024, 0, 0)
+_USAGE_LIGHT = ResourceUsage(0.1, 512*1024, 256*1024, 0, 0)
+
+_TEST_RESULT_PASS = TestResult(
+    test_name="test_add",
+    passed=True,
+    actual_output="8",
+    expected_output="8",
+    execution_time=0.1
+)
+
+_TEST_RESULT_STRETCH = TestResult(
+    test_name="test_advanced",
+    passed=True,
+    actual_output="Perfect solution",
+    expected_output="Perfect solution",
+    execution_time=0.05
+)
+
+_DEFAULT_EXEC_OK = CodeExecutionResult(
+    request_id=_FIXED_REQ_ID,
+    status=ExecutionStatus.SUCCESS,
+    output="8\n",
+    errors=[],
+    test_results=[_TEST_RESULT_PASS],
+    resource_usage=_USAGE_OK,
+    security_violations=[],
+    execution_time=0.3,
+    created_at=None
+)
+
+_DEFAULT_EXEC_FAIL = CodeExecutionResult(
+    request_id=_FIXED_REQ_ID,
+    status=ExecutionStatus.FAILED,
+    output="",
+    errors=["SyntaxError: invalid syntax"],
+    test_results=[],
+    resource_usage=_USAGE_LIGHT,
+    security_violations=[],
+    execution_time=0.1,
+    created_at=None
+)
+
+_DEFAULT_EXEC_OK_FAST = CodeExecutionResult(
+    request_id=_FIXED_REQ_ID,
+    status=ExecutionStatus.SUCCESS,
+    output="Perfect solution\n",
+    errors=[],
+    test_results=[_TEST_RESULT_STRETCH],
+    resource_usage=_USAGE_LIGHT,
+    security_violations=[],
+    execution_time=0.1,
+    created_at=None
+)
+
+_LEARNING_CONTEXT: Final = LearningContext(
+    user_id="integration-test-user",
+    session_id="integration-test-session",
+    current_objective="python functions",
+    skill_level="intermediate",
+    learning_goals=["python", "web development"],
+    attempt_count=1
+)
+
+_QUALITY_RATINGS: Final = ('excellent', 'good', 'fair', 'needs_improvement')
+_HINT_LEVELS: Final = (1, 2, 3)
+_LANGUAGES: Final = ('python', 'javascript')
+
+# Code samples at different quality levels
+_QUALITY_SAMPLES = [
+    {
+        'name': 'poor_quality',
+        'code': 'def f(x):return x*2',
+        'expected_rating': 'needs_improvement'
+    },
+    {
+        'name': 'good_quality',
+        'code': '''
+def calculate_double(number):
+    """Calculate double of a number."""
+    return number * 2
+''',
+        'expected_rating': 'good'
+    }
+]
+
+_DEFAULT_SUBMISSION = Submission(
+    id=_FIXED_SUB_ID,
+    task_id="test-task",
+    user_id="test-user",
+    code_content="def add(a, b): return a + b"
+)
+
+
+@pytest.fixture(scope="class")
+def mock_documentation_mcp():
+    """Create stub documentation MCP shared by the class."""
+    return DocMCPStub(_DEFAULT_RESOURCE)
+
+
+@pytest.fixture(scope="class")
+def mock_code_analysis_mcp():
+    """Create stub code analysis MCP shared by the class."""
+    return CodeAnalysisMCPStub(_DEFAULT_ANALYSIS)
+
+
+@pytest.fixture(scope="class")
+def mock_code_execution_service():
+    """Create stub code execution service shared by the class."""
+    return ExecStub(_DEFAULT_EXEC_OK)
+
 
+@pytest.fixture(scope="class")
+def mock_submission_repository():
+    """Create stub submission repository shared by the class."""
+    return SubmissionRepoStub(_DEFAULT_SUBMISSION)
+
+
+@pytest.fixture(scope="class")
+def resources_agent(mock_documentation_mcp):
+    """Create ResourcesAgent for integration testing."""
+    return ResourcesAgent(mock_documentation_mcp)
+
+
+@pytest.fixture(scope="class")
+def exercise_generator_agent(mock_code_analysis_mcp):
+    """Create ExerciseGeneratorAgent for integration testing."""
+    return ExerciseGeneratorAgent(mock_code_analysis_mcp)
+
+
+@pytest.fixture(scope="class")
+def reviewer_agent(mock_code_execution_service, mock_submission_repository):
+    """Create ReviewerAgent for integration testing."""
+    return ReviewerAgent(mock_code_execution_service, mock_submission_repository)
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group("agents_integration")
 class TestAgentsIntegration:
     """Integration tests for agent workflows."""
     
-    @pytest.fixture
-    def learning_context(self):
-        """Create learning context for testing."""
-        return LearningContext(
-            user_id="integration-test-user",
-            session_id="integration-test-session",
-            current_objective="python functions",
-            skill_level="intermediate",
-            learning_goals=["python", "web development"],
-            attempt_count=1
-        )
-    
-    @pytest.fixture
-    def mock_documentation_mcp(self):
-        """Create mock documentation MCP."""
-        mock = AsyncMock()
-        
-        # Mock search results
-        mock.search_documentation.return_value = [
-            LearningResource(
-                title="Python Functions Tutorial",
-                url="https://docs.python.org/3/tutorial/controlflow.html#defining-functions",
-                description="Learn how to define and use functions in Python",
-                resource_type=ResourceType.DOCUMENTATION,
-                difficulty_level=DifficultyLevel.INTERMEDIATE,
-                topics=["python", "functions"],
-                language="python",
-                quality_score=0.9,
-                source="docs.python.org"
-            )
-        ]
-        
-        mock.verify_resource_quality.return_value = 0.85
-        mock.get_resource_content.return_value = "Function tutorial content..."
-        mock.get_related_resources.return_value = []
-        
-        return mock
-    
-    @pytest.fixture
-    def mock_code_analysis_mcp(self):
-        """Create mock code analysis MCP."""
-        mock = AsyncMock()
-        
-        mock.analyze_code_complexity.return_value = CodeAnalysisResult(
-            complexity_score=0.3,
-            difficulty_level=DifficultyLevel.INTERMEDIATE,
-            issues=[],
-            suggestions=["Add comments to explain the logic"],
-            estimated_time_minutes=20,
-            topics_covered=["functions", "python"]
-        )
-        
-        return mock
-    
-    @pytest.fixture
-    def mock_code_execution_service(self):
-        """Create mock code execution service."""
-        mock = AsyncMock()
-        
-        # Default successful execution
-        mock.execute_code.return_value = CodeExecutionResult(
-            request_id=uuid4(),
-            status=ExecutionStatus.SUCCESS,
-            output="8\n",
-            errors=[],
-            test_results=[
-                TestResult(
-                    test_name="test_add",
-                    passed=True,
-                    actual_output="8",
-                    expected_output="8",
-                    execution_time=0.1
-                )
-            ],
-            resource_usage=ResourceUsage(0.2, 1024*1024, 512*1024, 0, 0),
-            security_violations=[],
-            execution_time=0.3,
-            created_at=None
-        )
-        
-        return mock
-    
-    @pytest.fixture
-    def mock_submission_repository(self):
-        """Create mock submission repository."""
-        mock = AsyncMock()
-        
-        mock.save.return_value = Submission(
-            id=str(uuid4()),
-            task_id="test-task",
-            user_id="test-user",
-            code_content="def add(a, b): return a + b"
-        )
-        
-        return mock
-    
-    @pytest.fixture
-    def resources_agent(self, mock_documentation_mcp):
-        """Create ResourcesAgent for integration testing."""
-        return ResourcesAgent(mock_documentation_mcp)
-    
-    @pytest.fixture
-    def exercise_generator_agent(self, mock_code_analysis_mcp):
-        """Create ExerciseGeneratorAgent for integration testing."""
-        return ExerciseGeneratorAgent(mock_code_analysis_mcp)
-    
-    @pytest.fixture
-    def reviewer_agent(self, mock_code_execution_service, mock_submission_repository):
-        """Create ReviewerAgent for integration testing."""
-        return ReviewerAgent(mock_code_execution_service, mock_submission_repository)
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_documentation_mcp, mock_code_analysis_mcp,
+                     mock_code_execution_service, mock_submission_repository):
+        """Restore the shared stubs to their defaults after each test."""
+        yield
+        for stub in (mock_documentation_mcp, mock_code_analysis_mcp,
+                     mock_code_execution_service, mock_submission_repository):
+            stub.reset()
     
-    @pytest.mark.asyncio
-    async def test_complete_learning_workflow(self, learning_context, resources_agent, 
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    async def test_complete_learning_workflow(self, resources_agent, 
                                             exercise_generator_agent, reviewer_agent):
         """Test complete learning workflow from resource discovery to code evaluation."""
         
@@ -145,8 +222,8 @@ class TestAgentsIntegration:
             'max_results': 3
         }
         
-        resource_result = await resources_agent.process(learning_context, resource_payload)
-        assert resource_result.success
+        resource_result = await resources_agent.process(_LEARNING_CONTEXT, resource_payload)
+        _ok(resource_result)
         assert len(resource_result.data['resources']) > 0
         
         # Step 2: Generate exercise based on topic
@@ -158,10 +235,8 @@ class TestAgentsIntegration:
             'exercise_type': 'coding'
         }
         
-        exercise_result = await exercise_generator_agent.process(learning_context, exercise_payload)
-        assert exercise_result.success
-        assert 'test_cases' in exercise_result.data
-        assert 'hints' in exercise_result.data
+        exercise_result = await exercise_generator_agent.process(_LEARNING_CONTEXT, exercise_payload)
+        _ok(exercise_result, 'test_cases', 'hints')
         
         # Step 3: Submit and evaluate solution
         submission_data = {
@@ -182,9 +257,8 @@ print(result)
             'exercise': exercise_result.data
         }
         
-        evaluation_result = await reviewer_agent.process(learning_context, evaluation_payload)
-        assert evaluation_result.success
-        assert 'evaluation' in evaluation_result.data
+        evaluation_result = await reviewer_agent.process(_LEARNING_CONTEXT, evaluation_payload)
+        _ok(evaluation_result, 'evaluation')
         
         # Verify workflow continuity
         evaluation = evaluation_result.data['evaluation']
@@ -193,8 +267,8 @@ print(result)
         else:
             assert 'retry_submission' in evaluation_result.next_actions
     
-    @pytest.mark.asyncio
-    async def test_adaptive_difficulty_workflow(self, learning_context, exercise_generator_agent, 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_adaptive_difficulty_workflow(self, exercise_generator_agent, 
                                               reviewer_agent, mock_code_execution_service):
         """Test adaptive difficulty adjustment based on performance."""
         
@@ -206,32 +280,16 @@ print(result)
             'language': 'python'
         }
         
-        exercise_result = await exercise_generator_agent.process(learning_context, exercise_payload)
-        assert exercise_result.success
+        exercise_result = await exercise_generator_agent.process(_LEARNING_CONTEXT, exercise_payload)
+        _ok(exercise_result)
         
         # Simulate failed submission (multiple attempts)
-        failed_context = LearningContext(
-            user_id=learning_context.user_id,
-            session_id=learning_context.session_id,
-            current_objective=learning_context.current_objective,
-            skill_level=learning_context.skill_level,
-            learning_goals=learning_context.learning_goals,
-            attempt_count=3,
-            last_feedback={'passed': False}
+        failed_context = dataclasses.replace(
+            _LEARNING_CONTEXT, attempt_count=3, last_feedback={'passed': False}
         )
         
         # Mock failed execution
-        mock_code_execution_service.execute_code.return_value = CodeExecutionResult(
-            request_id=uuid4(),
-            status=ExecutionStatus.FAILED,
-            output="",
-            errors=["SyntaxError: invalid syntax"],
-            test_results=[],
-            resource_usage=ResourceUsage(0.1, 512*1024, 256*1024, 0, 0),
-            security_violations=[],
-            execution_time=0.1,
-            created_at=None
-        )
+        mock_code_execution_service.execute_code = const(_DEFAULT_EXEC_FAIL)
         
         # Evaluate failed submission
         evaluation_payload = {
@@ -241,7 +299,7 @@ print(result)
         }
         
         evaluation_result = await reviewer_agent.process(failed_context, evaluation_payload)
-        assert evaluation_result.success
+        _ok(evaluation_result)
         assert not evaluation_result.data['evaluation']['passed']
         
         # Generate easier exercise (recap)
@@ -252,35 +310,17 @@ print(result)
         }
         
         recap_result = await exercise_generator_agent.process(failed_context, recap_payload)
-        assert recap_result.success
+        _ok(recap_result)
         assert recap_result.data['is_recap'] == True
         assert recap_result.data['difficulty'] == 'beginner'
     
-    @pytest.mark.asyncio
-    async def test_stretch_exercise_workflow(self, learning_context, exercise_generator_agent, 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stretch_exercise_workflow(self, exercise_generator_agent, 
                                            reviewer_agent, mock_code_execution_service):
         """Test stretch exercise generation for advanced learners."""
         
         # Mock very successful execution (quick completion)
-        mock_code_execution_service.execute_code.return_value = CodeExecutionResult(
-            request_id=uuid4(),
-            status=ExecutionStatus.SUCCESS,
-            output="Perfect solution\n",
-            errors=[],
-            test_results=[
-                TestResult(
-                    test_name="test_advanced",
-                    passed=True,
-                    actual_output="Perfect solution",
-                    expected_output="Perfect solution",
-                    execution_time=0.05
-                )
-            ],
-            resource_usage=ResourceUsage(0.1, 512*1024, 256*1024, 0, 0),
-            security_violations=[],
-            execution_time=0.1,
-            created_at=None
-        )
+        mock_code_execution_service.execute_code = const(_DEFAULT_EXEC_OK_FAST)
         
         # Evaluate successful submission
         evaluation_payload = {
@@ -290,13 +330,13 @@ print(result)
                 'language': 'python'
             },
             'exercise': {
-                'id': str(uuid4()),
+                'id': _FIXED_EXERCISE_ID,
                 'test_cases': [{'name': 'test_advanced', 'expected_output': 'Perfect solution'}]
             }
         }
         
-        evaluation_result = await reviewer_agent.process(learning_context, evaluation_payload)
-        assert evaluation_result.success
+        evaluation_result = await reviewer_agent.process(_LEARNING_CONTEXT, evaluation_payload)
+        _ok(evaluation_result)
         assert evaluation_result.data['evaluation']['passed']
         
         # Generate stretch exercise
@@ -306,13 +346,13 @@ print(result)
             'current_difficulty': 'intermediate'
         }
         
-        stretch_result = await exercise_generator_agent.process(learning_context, stretch_payload)
-        assert stretch_result.success
+        stretch_result = await exercise_generator_agent.process(_LEARNING_CONTEXT, stretch_payload)
+        _ok(stretch_result)
         assert stretch_result.data['is_stretch'] == True
         assert stretch_result.data['difficulty'] == 'advanced'
     
-    @pytest.mark.asyncio
-    async def test_resource_to_exercise_workflow(self, learning_context, resources_agent, 
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    async def test_resource_to_exercise_workflow(self, resources_agent, 
                                                exercise_generator_agent):
         """Test workflow from resource discovery to exercise generation."""
         
@@ -324,37 +364,38 @@ print(result)
             'max_results': 5
         }
         
-        resource_result = await resources_agent.process(learning_context, resource_payload)
-        assert resource_result.success
+        resource_result = await resources_agent.process(_LEARNING_CONTEXT, resource_payload)
+        _ok(resource_result)
         
         resources = resource_result.data['resources']
         assert len(resources) > 0
         
         # Step 2: Get detailed content from a resource
-        if resources:
-            content_payload = {
-                'intent': 'get_resource_content',
-                'url': resources[0]['url']
-            }
-            
-            content_result = await resources_agent.process(learning_context, content_payload)
-            assert content_result.success
-            assert 'content' in content_result.data
+        content_payload = {
+            'intent': 'get_resource_content',
+            'url': resources[0]['url']
+        }
         
         # Step 3: Generate exercise based on the topic
         exercise_payload = {
             'intent': 'generate_exercise',
             'topic': 'loops',  # Topic from resource search
-            'difficulty': learning_context.skill_level,
+            'difficulty': _LEARNING_CONTEXT.skill_level,
             'language': 'python'
         }
         
-        exercise_result = await exercise_generator_agent.process(learning_context, exercise_payload)
-        assert exercise_result.success
+        # The exercise does not depend on the content, so fetch both concurrently
+        content_result, exercise_result = await asyncio.gather(
+            resources_agent.process(_LEARNING_CONTEXT, content_payload),
+            exercise_generator_agent.process(_LEARNING_CONTEXT, exercise_payload),
+        )
+        _ok(content_result, 'content')
+        _ok(exercise_result)
         assert exercise_result.data['topic'] == 'loops'
     
-    @pytest.mark.asyncio
-    async def test_exercise_hint_workflow(self, learning_context, exercise_generator_agent):
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    @pytest.mark.parametrize("hint_level", _HINT_LEVELS)
+    async def test_exercise_hint_workflow(self, exercise_generator_agent, hint_level):
         """Test exercise generation with progressive hints."""
         
         # Generate exercise
@@ -364,85 +405,69 @@ print(result)
             'difficulty': 'beginner'
         }
         
-        exercise_result = await exercise_generator_agent.process(learning_context, exercise_payload)
-        assert exercise_result.success
+        exercise_result = await exercise_generator_agent.process(_LEARNING_CONTEXT, exercise_payload)
+        _ok(exercise_result)
         
         exercise_data = exercise_result.data
         
-        # Request hints at different levels
-        for hint_level in [1, 2, 3]:
-            hint_payload = {
-                'intent': 'generate_hints',
-                'exercise': exercise_data,
-                'hint_level': hint_level
-            }
-            
-            hint_result = await exercise_generator_agent.process(learning_context, hint_payload)
-            assert hint_result.success
-            assert hint_result.data['hint_level'] == hint_level
-            
-            # Higher levels should provide more hints
-            if hint_level > 1:
-                assert len(hint_result.data['hints']) >= hint_level
+        # Request hints at the parametrized level
+        hint_payload = {
+            'intent': 'generate_hints',
+            'exercise': exercise_data,
+            'hint_level': hint_level
+        }
+        
+        hint_result = await exercise_generator_agent.process(_LEARNING_CONTEXT, hint_payload)
+        _ok(hint_result)
+        assert hint_result.data['hint_level'] == hint_level
+        
+        # Higher levels should provide more hints
+        if hint_level > 1:
+            assert len(hint_result.data['hints']) >= hint_level
     
-    @pytest.mark.asyncio
-    async def test_code_quality_feedback_workflow(self, learning_context, reviewer_agent):
-        """Test comprehensive code quality analysis workflow."""
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    @pytest.mark.parametrize("sample", _QUALITY_SAMPLES, ids=lambda s: s["name"])
+    async def test_code_quality_feedback_workflow(self, reviewer_agent, sample):
+        """Test code quality analysis for each quality level."""
+        
+        quality_payload = {
+            'intent': 'check_code_quality',
+            'code': sample['code'],
+            'language': 'python'
+        }
         
-        # Test different code quality levels
-        code_samples = [
-            {
-                'name': 'poor_quality',
-                'code': 'def f(x):return x*2',
-                'expected_rating': 'needs_improvement'
-            },
-            {
-                'name': 'good_quality',
-                'code': '''
-def calculate_double(number):
-    """Calculate double of a number."""
-    return number * 2
-''',
-                'expected_rating': 'good'
-            }
-        ]
+        quality_result = await reviewer_agent.process(_LEARNING_CONTEXT, quality_payload)
+        _ok(quality_result)
         
-        for sample in code_samples:
-            quality_payload = {
-                'intent': 'check_code_quality',
-                'code': sample['code'],
-                'language': 'python'
-            }
-            
-            quality_result = await reviewer_agent.process(learning_context, quality_payload)
-            assert quality_result.success
-            
-            quality_rating = quality_result.data['quality_rating']
-            # Note: Exact rating may vary based on implementation details
-            assert quality_rating in ['excellent', 'good', 'fair', 'needs_improvement']
+        quality_rating = quality_result.data['quality_rating']
+        # Note: Exact rating may vary based on implementation details
+        assert quality_rating in _QUALITY_RATINGS
     
-    @pytest.mark.asyncio
-    async def test_multi_language_support_workflow(self, learning_context, exercise_generator_agent, 
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    async def test_multi_language_support_workflow(self, exercise_generator_agent, 
                                                  reviewer_agent):
         """Test workflow with multiple programming languages."""
         
-        languages = ['python', 'javascript']
-        
-        for language in languages:
-            # Generate exercise for language
-            exercise_payload = {
+        # Generate one exercise per language concurrently
+        exercise_payloads = [
+            {
                 'intent': 'generate_exercise',
                 'topic': 'functions',
                 'language': language,
                 'difficulty': 'beginner'
             }
-            
-            exercise_result = await exercise_generator_agent.process(learning_context, exercise_payload)
-            assert exercise_result.success
-            assert exercise_result.data['language'] == language
-            
+            for language in _LANGUAGES
+        ]
+        
+        exercise_results = await asyncio.gather(*(
+            exercise_generator_agent.process(_LEARNING_CONTEXT, payload)
+            for payload in exercise_payloads
+        ))
+        
+        for language, exercise_result in zip(_LANGUAGES, exercise_results):
             # Check language-specific elements
-            assert 'language_info' in exercise_result.data
+            _ok(exercise_result, 'language_info')
+            assert exercise_result.data['language'] == language
             lang_info = exercise_result.data['language_info']
             
             if language == 'python':
@@ -452,32 +477,29 @@ def calculate_double(number):
                 assert lang_info['file_extension'] == '.js'
                 assert lang_info['comment_style'] == '//'
     
-    @pytest.mark.asyncio
-    async def test_error_recovery_workflow(self, learning_context, resources_agent, 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_recovery_workflow(self, resources_agent, 
                                          mock_documentation_mcp):
         """Test error recovery and fallback mechanisms."""
         
         # Simulate MCP service failure
-        mock_documentation_mcp.search_documentation.side_effect = Exception("Service unavailable")
+        mock_documentation_mcp.search_documentation = raising(Exception("Service unavailable"))
         
-        # Request should still succeed with fallback
         resource_payload = {
             'intent': 'search_resources',
             'query': 'python functions',
             'max_results': 3
         }
         
-        # The agent should handle the error gracefully
-        try:
-            result = await resources_agent.process(learning_context, resource_payload)
-            # If the agent has proper error handling, it should return an error result
-            assert not result.success
-        except Exception:
-            # If no error handling, the exception should be caught by the base agent
-            pass
+        # The agent converts the failure into an error result instead of raising;
+        # the autouse reset fixture restores the search stub afterwards
+        result = await resources_agent.process(_LEARNING_CONTEXT, resource_payload)
+        assert result.success is False
+        assert result.error_code == "SEARCH_FAILED"
+        assert "Service unavailable" in result.error
     
-    @pytest.mark.asyncio
-    async def test_learning_path_curation_workflow(self, learning_context, resources_agent):
+    @pytest.mark.asyncio_concurrent(group="agents_integration")
+    async def test_learning_path_curation_workflow(self, resources_agent):
         """Test complete learning path resource curation."""
         
         topics = ["variables", "functions", "loops", "conditionals"]
@@ -488,21 +510,18 @@ def calculate_double(number):
             'resources_per_topic': 2
         }
         
-        curation_result = await resources_agent.process(learning_context, curation_payload)
-        assert curation_result.success
+        curation_result = await resources_agent.process(_LEARNING_CONTEXT, curation_payload)
+        _ok(curation_result)
         
         curated_resources = curation_result.data['curated_resources']
         
-        # Should have resources for each topic
+        # Should have resources for each topic, collecting their types in the same pass
+        resource_types = set()
         for topic in topics:
             assert topic in curated_resources
-            assert len(curated_resources[topic]) <= 2
-        
-        # Verify resource diversity
-        all_resources = []
-        for topic_resources in curated_resources.values():
-            all_resources.extend(topic_resources)
+            topic_resources = curated_resources[topic]
+            assert len(topic_resources) <= 2
+            resource_types.update(resource['resource_type'] for resource in topic_resources)
         
         # Should have diverse resource types
-        resource_types = set(resource['resource_type'] for resource in all_resources)
         assert len(resource_types) >= 1  # At least some diversity
\ No newline at end of file
@@ -9,15 +9,22 @@ Tests cover all core API functionality including:
 - Progress tracking endpoints
 """
 
+import asyncio
+import copy
+import itertools
+import orjson
 import pytest
+import pytest_asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from unittest.mock import AsyncMock
+from uuid import UUID
 
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from fastapi.middleware.cors import CORSMiddleware
+from httpx import ASGITransport, AsyncClient
+from pydantic import ValidationError
 
-from src.adapters.api.main import app
+from src.adapters.api.models.goals import SetGoalsRequest
+from src.adapters.api.models.submissions import SubmitCodeRequest
 from src.domain.entities.user_profile import UserProfile
 from src.domain.entities.learning_plan import LearningPlan
 from src.domain.entities.module import Module
@@ -25,27 +32,180 @@ from src.domain.entities.task import Task
 from src.domain.entities.submission import Submission
 from src.domain.entities.evaluation_result import EvaluationResult
 from src.domain.value_objects.enums import SkillLevel, TaskType, LearningPlanStatus
+from src.ports.repositories import CurriculumRepository, SubmissionRepository, UserRepository
 
 
-# Test user ID for all tests
+# Test user ID and authentication headers for all tests
 TEST_USER_ID = "test-user-123"
+AUTH_HEADERS = {"X-User-ID": TEST_USER_ID}
+
+
+def _json(response):
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+
+# Request bodies are serialized once and posted as raw JSON content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_AUTH_JSON_HEADERS = {**AUTH_HEADERS, **_JSON_HEADERS}
+
+_TASK_DETAIL_URL = "/api/v1/tasks/{task_id}"
+
+_SET_GOALS_PAYLOAD = {
+    "goals": ["Learn React", "Master TypeScript"],
+    "time_constraints": {
+        "hours_per_week": 10,
+        "preferred_times": ["evening"],
+        "available_days": ["monday", "wednesday"],
+        "session_length_minutes": 60
+    },
+    "skill_level": "intermediate"
+}
+_SET_GOALS_BODY = orjson.dumps(_SET_GOALS_PAYLOAD)
+
+_MINIMAL_GOALS_BODY = orjson.dumps({
+    "goals": ["Learn React"],
+    "time_constraints": {
+        "hours_per_week": 10,
+        "preferred_times": [],
+        "available_days": [],
+        "session_length_minutes": 60
+    }
+})
+
+_CREATE_CURRICULUM_BODY = orjson.dumps({
+    "goals": ["Learn React", "Build a todo app"],
+    "skill_level": "beginner"
+})
+
+# Every test shares the session event loop with the module-scoped client;
+# under pytest-xdist each worker process builds its own loop and client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+# Entity modules whose id default factories call their module-level uuid4
+_ENTITY_MODULES = (
+    "src.domain.entities.user_profile",
+    "src.domain.entities.learning_plan",
+    "src.domain.entities.module",
+    "src.domain.entities.task",
+    "src.domain.entities.submission",
+    "src.domain.entities.evaluation_result",
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _sequential_entity_ids():
+    """
+    Give test entities sequential UUIDs instead of random ones.
+    
+    Module-scoped like the shared entity fixtures, so they are built with
+    sequential ids too, and the patch is undone before other test modules
+    run; ids stay unique across the module and failure output is
+    reproducible.
+    """
+    counter = itertools.count(1)
+    
+    def next_uuid():
+        return UUID(int=next(counter))
+    
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for module in _ENTITY_MODULES:
+            monkeypatch.setattr(f"{module}.uuid4", next_uuid)
+        yield
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Import the app on first use rather than at collection time.
+    
+    Importing it pulls in every router, the settings and the database
+    engine, which ``--collect-only`` and ``-k`` selections don't need.
+    """
+    from src.adapters.api.main import app as _app
+    return _app
+
+
+@pytest.fixture(scope="module")
+def test_app(app):
+    """
+    Serve the app without middleware these tests never exercise.
+    
+    CORS is the only middleware installed outside production and no test
+    here sends an Origin header, so it is dropped for this module and
+    restored in teardown, before suites that do send one run against the
+    same app. Authentication is a dependency and is unaffected.
+    """
+    user_middleware = app.user_middleware
+    app.user_middleware = [m for m in user_middleware if m.cls is not CORSMiddleware]
+    app.middleware_stack = None  # Rebuilt lazily on the next request
+    yield app
+    app.user_middleware = user_middleware
+    app.middleware_stack = None
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(test_app):
+    """
+    Create an in-process async client shared by the whole module.
+    
+    Requests are dispatched straight to the ASGI app on the test event loop.
+    ASGITransport does not run the app lifespan, so database migrations and
+    connection checks are skipped. The OpenAPI schema is generated up front
+    so FastAPI's cached copy serves /openapi.json.
+    """
+    test_app.openapi()
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+        yield client
+
+
+def coro(value):
+    """Build a minimal coroutine function that always returns ``value``."""
+    async def _coro(*args, **kwargs):
+        return value
+    return _coro
+
+
+def _patch_repositories(monkeypatch, router, **repositories):
+    """
+    Make a router build the given mocks in place of its repository classes.
+    
+    The mocks are specced from the repository ports, which every Postgres
+    repository implements, so a misspelled method fails with AttributeError
+    instead of returning a fresh child mock.
+    """
+    for class_name, repository in repositories.items():
+        monkeypatch.setattr(
+            f"src.adapters.api.routers.{router}.{class_name}",
+            lambda *args, _repository=repository, **kwargs: _repository
+        )
 
 
-@pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_loop():
+    """Expose the session event loop the client and the tests run on."""
+    return asyncio.get_running_loop()
 
 
-@pytest.fixture
-def auth_headers():
-    """Create authentication headers for test requests."""
-    return {"X-User-ID": TEST_USER_ID}
+async def _mock_db_session():
+    """Yield a stand-in session; the repositories built from it are mocked."""
+    yield AsyncMock()
 
 
-@pytest.fixture
-def mock_user_profile():
-    """Create a mock user profile."""
+@pytest.fixture(scope="module", autouse=True)
+def _override_db_session(app):
+    """Keep this module's requests from opening real database sessions."""
+    from src.adapters.api.dependencies import get_db_session
+    
+    app.dependency_overrides[get_db_session] = _mock_db_session
+    yield
+    app.dependency_overrides.pop(get_db_session, None)
+
+
+@pytest.fixture(scope="module")
+def _canonical_user_profile():
+    """Build the user profile once per module; tests get copies of it."""
     return UserProfile(
         user_id=TEST_USER_ID,
         skill_level=SkillLevel.INTERMEDIATE,
@@ -61,8 +221,14 @@ def mock_user_profile():
 
 
 @pytest.fixture
+def mock_user_profile(_canonical_user_profile):
+    """Provide a fresh copy of the user profile, since set_goals mutates it."""
+    return copy.deepcopy(_canonical_user_profile)
+
+
+@pytest.fixture(scope="module")
 def mock_learning_plan():
-    """Create a mock learning plan with modules and tasks."""
+    """Create a mock learning plan with modules and tasks, shared read-only."""
     plan = LearningPlan(
         user_id=TEST_USER_ID,
         title="React Learning Path",
@@ -104,77 +270,75 @@ def mock_learning_plan():
     return plan
 
 
+class TestEventLoop:
+    """Tests for event loop sharing across the module."""
+    
+    @pytest.mark.parametrize("attempt", [1, 2])
+    async def test_tests_run_on_session_loop(self, session_loop, client, attempt):
+        """Every test runs on the loop that owns the session client."""
+        assert asyncio.get_running_loop() is session_loop
+
+
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
     
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test basic health check endpoint."""
-        response = client.get("/health/")
+        response = await client.get("/health/")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["status"] == "healthy"
         assert "timestamp" in data
     
-    def test_liveness_check(self, client):
+    async def test_liveness_check(self, client):
         """Test liveness check endpoint."""
-        response = client.get("/health/live")
+        response = await client.get("/health/live")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["alive"] is True
 
 
 class TestGoalsEndpoints:
     """Tests for goal setting endpoints."""
     
-    @patch("src.adapters.api.routers.goals.PostgresUserRepository")
-    def test_set_goals_success(self, mock_repo_class, client, auth_headers, mock_user_profile):
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the goals router's repositories to per-test mocks."""
+        self._mock_user_repo = AsyncMock(spec=UserRepository)
+        _patch_repositories(
+            monkeypatch, "goals",
+            PostgresUserRepository=self._mock_user_repo
+        )
+    
+    async def test_set_goals_success(self, client, mock_user_profile):
         """Test successful goal setting."""
-        mock_repo = AsyncMock()
-        mock_repo.get_user_profile.return_value = mock_user_profile
-        mock_repo.update_user_profile.return_value = mock_user_profile
-        mock_repo_class.return_value = mock_repo
-        
-        request_data = {
-            "goals": ["Learn React", "Master TypeScript"],
-            "time_constraints": {
-                "hours_per_week": 10,
-                "preferred_times": ["evening"],
-                "available_days": ["monday", "wednesday"],
-                "session_length_minutes": 60
-            },
-            "skill_level": "intermediate"
-        }
+        self._mock_user_repo.get_user_profile = coro(mock_user_profile)
+        self._mock_user_repo.update_user_profile = coro(mock_user_profile)
         
-        response = client.post(
+        response = await client.post(
             "/api/v1/goals",
-            json=request_data,
-            headers=auth_headers
+            content=_SET_GOALS_BODY,
+            headers=_AUTH_JSON_HEADERS
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = _json(response)
         assert data["success"] is True
-        assert data["goals"] == request_data["goals"]
+        assert data["goals"] == _SET_GOALS_PAYLOAD["goals"]
         assert "goal_categories" in data
         assert "estimated_timeline" in data
     
-    def test_set_goals_missing_auth(self, client):
+    async def test_set_goals_missing_auth(self, client):
         """Test goal setting without authentication."""
-        request_data = {
-            "goals": ["Learn React"],
-            "time_constraints": {
-                "hours_per_week": 10,
-                "preferred_times": [],
-                "available_days": [],
-                "session_length_minutes": 60
-            }
-        }
-        
-        response = client.post("/api/v1/goals", json=request_data)
+        response = await client.post(
+            "/api/v1/goals",
+            content=_MINIMAL_GOALS_BODY,
+            headers=_JSON_HEADERS
+        )
         assert response.status_code == 401
     
-    def test_set_goals_invalid_data(self, client, auth_headers):
-        """Test goal setting with invalid data."""
+    async def test_set_goals_invalid_data(self):
+        """Test goal setting with invalid data is rejected by the request model."""
         request_data = {
             "goals": [],  # Empty goals list
             "time_constraints": {
@@ -185,36 +349,25 @@ class TestGoalsEndpoints:
             }
         }
         
-        response = client.post(
-            "/api/v1/goals",
-            json=request_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 422  # Validation error
+        with pytest.raises(ValidationError):
+            SetGoalsRequest.model_validate(request_data)
     
-    @patch("src.adapters.api.routers.goals.PostgresUserRepository")
-    def test_get_goals_success(self, mock_repo_class, client, auth_headers, mock_user_profile):
+    async def test_get_goals_success(self, client, mock_user_profile):
         """Test successful goal retrieval."""
-        mock_repo = AsyncMock()
-        mock_repo.get_user_profile.return_value = mock_user_profile
-        mock_repo_class.return_value = mock_repo
+        self._mock_user_repo.get_user_profile = coro(mock_user_profile)
         
-        response = client.get("/api/v1/goals", headers=auth_headers)
+        response = await client.get("/api/v1/goals", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["success"] is True
         assert "goals" in data
     
-    @patch("src.adapters.api.routers.goals.PostgresUserRepository")
-    def test_get_goals_not_found(self, mock_repo_class, client, auth_headers):
+    async def test_get_goals_not_found(self, client):
         """Test goal retrieval when profile doesn't exist."""
-        mock_repo = AsyncMock()
-        mock_repo.get_user_profile.return_value = None
-        mock_repo_class.return_value = mock_repo
+        self._mock_user_repo.get_user_profile = coro(None)
         
-        response = client.get("/api/v1/goals", headers=auth_headers)
+        response = await client.get("/api/v1/goals", headers=AUTH_HEADERS)
         
         assert response.status_code == 404
 
@@ -222,79 +375,67 @@ class TestGoalsEndpoints:
 class TestCurriculumEndpoints:
     """Tests for curriculum endpoints."""
     
-    @patch("src.adapters.api.routers.curriculum.PostgresCurriculumRepository")
-    def test_get_curriculum_success(self, mock_repo_class, client, auth_headers, mock_learning_plan):
-        """Test successful curriculum retrieval."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = mock_learning_plan
-        mock_repo_class.return_value = mock_repo
-        
-        response = client.get("/api/v1/curriculum", headers=auth_headers)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == mock_learning_plan.title
-        assert "modules" in data
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the curriculum router's repositories to per-test mocks."""
+        self._mock_curriculum_repo = AsyncMock(spec=CurriculumRepository)
+        self._mock_user_repo = AsyncMock(spec=UserRepository)
+        _patch_repositories(
+            monkeypatch, "curriculum",
+            PostgresCurriculumRepository=self._mock_curriculum_repo,
+            PostgresUserRepository=self._mock_user_repo
+        )
     
-    @patch("src.adapters.api.routers.curriculum.PostgresCurriculumRepository")
-    def test_get_curriculum_not_found(self, mock_repo_class, client, auth_headers):
-        """Test curriculum retrieval when no active plan exists."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = None
-        mock_repo_class.return_value = mock_repo
+    @pytest.mark.parametrize("has_plan,expected_status", [
+        (True, 200),
+        (False, 404),
+    ], ids=["success", "not_found"])
+    async def test_get_curriculum(self, client, mock_learning_plan,
+                                  has_plan, expected_status):
+        """Test curriculum retrieval with and without an active plan."""
+        self._mock_curriculum_repo.get_active_plan = coro(
+            mock_learning_plan if has_plan else None
+        )
         
-        response = client.get("/api/v1/curriculum", headers=auth_headers)
+        response = await client.get("/api/v1/curriculum", headers=AUTH_HEADERS)
         
-        assert response.status_code == 404
+        assert response.status_code == expected_status
+        if has_plan:
+            data = _json(response)
+            assert data["title"] == mock_learning_plan.title
+            assert "modules" in data
     
-    @patch("src.adapters.api.routers.curriculum.PostgresCurriculumRepository")
-    @patch("src.adapters.api.routers.curriculum.PostgresUserRepository")
-    def test_create_curriculum_success(
-        self, mock_user_repo_class, mock_curriculum_repo_class,
-        client, auth_headers, mock_user_profile
-    ):
+    async def test_create_curriculum_success(self, client, mock_user_profile):
         """Test successful curriculum creation."""
-        mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_profile.return_value = mock_user_profile
-        mock_user_repo_class.return_value = mock_user_repo
+        self._mock_user_repo.get_user_profile = coro(mock_user_profile)
         
-        mock_curriculum_repo = AsyncMock()
-        mock_curriculum_repo.save_plan.return_value = LearningPlan(
+        self._mock_curriculum_repo.save_plan = coro(LearningPlan(
             user_id=TEST_USER_ID,
             title="Test Plan",
             goal_description="Test goals",
             total_days=30,
             status=LearningPlanStatus.DRAFT
-        )
-        mock_curriculum_repo_class.return_value = mock_curriculum_repo
-        
-        request_data = {
-            "goals": ["Learn React", "Build a todo app"],
-            "skill_level": "beginner"
-        }
+        ))
         
-        response = client.post(
+        response = await client.post(
             "/api/v1/curriculum",
-            json=request_data,
-            headers=auth_headers
+            content=_CREATE_CURRICULUM_BODY,
+            headers=_AUTH_JSON_HEADERS
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = _json(response)
         assert "id" in data
         assert "modules" in data
     
-    @patch("src.adapters.api.routers.curriculum.PostgresCurriculumRepository")
-    def test_get_curriculum_status(self, mock_repo_class, client, auth_headers, mock_learning_plan):
+    async def test_get_curriculum_status(self, client, mock_learning_plan):
         """Test curriculum status retrieval."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = mock_learning_plan
-        mock_repo_class.return_value = mock_repo
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
         
-        response = client.get("/api/v1/curriculum/status", headers=auth_headers)
+        response = await client.get("/api/v1/curriculum/status", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["has_active_plan"] is True
         assert "progress_percentage" in data
 
@@ -302,64 +443,64 @@ class TestCurriculumEndpoints:
 class TestTasksEndpoints:
     """Tests for task retrieval endpoints."""
     
-    @patch("src.adapters.api.routers.tasks.PostgresCurriculumRepository")
-    def test_get_today_tasks(self, mock_repo_class, client, auth_headers, mock_learning_plan):
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the tasks router's repositories to per-test mocks."""
+        self._mock_curriculum_repo = AsyncMock(spec=CurriculumRepository)
+        _patch_repositories(
+            monkeypatch, "tasks",
+            PostgresCurriculumRepository=self._mock_curriculum_repo
+        )
+    
+    async def test_get_today_tasks(self, client, mock_learning_plan):
         """Test getting today's tasks."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = mock_learning_plan
-        mock_repo.get_tasks_for_day.return_value = mock_learning_plan.modules[0].tasks
-        mock_repo.get_module.return_value = mock_learning_plan.modules[0]
-        mock_repo_class.return_value = mock_repo
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
+        self._mock_curriculum_repo.get_tasks_for_day = coro(mock_learning_plan.modules[0].tasks)
+        self._mock_curriculum_repo.get_module = coro(mock_learning_plan.modules[0])
         
-        response = client.get("/api/v1/tasks/today", headers=auth_headers)
+        response = await client.get("/api/v1/tasks/today", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "tasks" in data
         assert "date" in data
         assert "progress_message" in data
     
-    @patch("src.adapters.api.routers.tasks.PostgresCurriculumRepository")
-    def test_get_task_detail(self, mock_repo_class, client, auth_headers, mock_learning_plan):
+    async def test_get_task_detail(self, client, mock_learning_plan):
         """Test getting task details."""
         task = mock_learning_plan.modules[0].tasks[0]
         module = mock_learning_plan.modules[0]
         
-        mock_repo = AsyncMock()
-        mock_repo.get_task.return_value = task
-        mock_repo.get_module.return_value = module
-        mock_repo.get_plan.return_value = mock_learning_plan
-        mock_repo_class.return_value = mock_repo
+        self._mock_curriculum_repo.get_task = coro(task)
+        self._mock_curriculum_repo.get_module = coro(module)
+        self._mock_curriculum_repo.get_plan = coro(mock_learning_plan)
         
-        response = client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+        task_id = task.id
+        response = await client.get(_TASK_DETAIL_URL.format(task_id=task_id), headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == task.id
+        data = _json(response)
+        assert data["id"] == task_id
         assert data["description"] == task.description
     
-    @patch("src.adapters.api.routers.tasks.PostgresCurriculumRepository")
-    def test_get_task_not_found(self, mock_repo_class, client, auth_headers):
+    async def test_get_task_not_found(self, client):
         """Test getting non-existent task."""
-        mock_repo = AsyncMock()
-        mock_repo.get_task.return_value = None
-        mock_repo_class.return_value = mock_repo
+        self._mock_curriculum_repo.get_task = coro(None)
         
-        response = client.get("/api/v1/tasks/nonexistent-id", headers=auth_headers)
+        response = await client.get(
+            _TASK_DETAIL_URL.format(task_id="nonexistent-id"), headers=AUTH_HEADERS
+        )
         
         assert response.status_code == 404
     
-    @patch("src.adapters.api.routers.tasks.PostgresCurriculumRepository")
-    def test_list_tasks(self, mock_repo_class, client, auth_headers, mock_learning_plan):
+    async def test_list_tasks(self, client, mock_learning_plan):
         """Test listing tasks."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = mock_learning_plan
-        mock_repo_class.return_value = mock_repo
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
         
-        response = client.get("/api/v1/tasks", headers=auth_headers)
+        response = await client.get("/api/v1/tasks", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "tasks" in data
         assert "total" in data
 
@@ -367,21 +508,25 @@ class TestTasksEndpoints:
 class TestSubmissionsEndpoints:
     """Tests for code submission endpoints."""
     
-    @patch("src.adapters.api.routers.submissions.PostgresCurriculumRepository")
-    @patch("src.adapters.api.routers.submissions.PostgresSubmissionRepository")
-    def test_submit_code_success(
-        self, mock_submission_repo_class, mock_curriculum_repo_class,
-        client, auth_headers, mock_learning_plan
-    ):
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the submissions router's repositories to per-test mocks."""
+        self._mock_curriculum_repo = AsyncMock(spec=CurriculumRepository)
+        self._mock_submission_repo = AsyncMock(spec=SubmissionRepository)
+        _patch_repositories(
+            monkeypatch, "submissions",
+            PostgresCurriculumRepository=self._mock_curriculum_repo,
+            PostgresSubmissionRepository=self._mock_submission_repo
+        )
+    
+    async def test_submit_code_success(self, client, mock_learning_plan):
         """Test successful code submission."""
         task = mock_learning_plan.modules[0].tasks[1]  # CODE task
         module = mock_learning_plan.modules[0]
         
-        mock_curriculum_repo = AsyncMock()
-        mock_curriculum_repo.get_task.return_value = task
-        mock_curriculum_repo.get_module.return_value = module
-        mock_curriculum_repo.get_plan.return_value = mock_learning_plan
-        mock_curriculum_repo_class.return_value = mock_curriculum_repo
+        self._mock_curriculum_repo.get_task = coro(task)
+        self._mock_curriculum_repo.get_module = coro(module)
+        self._mock_curriculum_repo.get_plan = coro(mock_learning_plan)
         
         submission = Submission(
             task_id=task.id,
@@ -397,10 +542,8 @@ class TestSubmissionsEndpoints:
             execution_time=0.1
         )
         
-        mock_submission_repo = AsyncMock()
-        mock_submission_repo.save_submission.return_value = submission
-        mock_submission_repo.save_evaluation.return_value = evaluation
-        mock_submission_repo_class.return_value = mock_submission_repo
+        self._mock_submission_repo.save_submission = coro(submission)
+        self._mock_submission_repo.save_evaluation = coro(evaluation)
         
         request_data = {
             "task_id": task.id,
@@ -408,63 +551,43 @@ class TestSubmissionsEndpoints:
             "language": "python"
         }
         
-        response = client.post(
+        response = await client.post(
             "/api/v1/submissions",
             json=request_data,
-            headers=auth_headers
+            headers=AUTH_HEADERS
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = _json(response)
         assert "submission_id" in data
         assert "passed" in data
         assert "score" in data
         assert "feedback" in data
     
-    def test_submit_code_empty(self, client, auth_headers):
-        """Test submitting empty code."""
+    @pytest.mark.parametrize("code,language", [
+        ("   ", "python"),  # Whitespace only
+        ("print('hello')", "invalid_language"),
+    ], ids=["empty_code", "invalid_language"])
+    async def test_submit_code_invalid(self, code, language):
+        """Test empty code or an unsupported language is rejected by the request model."""
         request_data = {
             "task_id": "task-123",
-            "code": "   ",  # Whitespace only
-            "language": "python"
+            "code": code,
+            "language": language
         }
         
-        response = client.post(
-            "/api/v1/submissions",
-            json=request_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 422  # Validation error
+        with pytest.raises(ValidationError):
+            SubmitCodeRequest.model_validate(request_data)
     
-    def test_submit_code_invalid_language(self, client, auth_headers):
-        """Test submitting code with invalid language."""
-        request_data = {
-            "task_id": "task-123",
-            "code": "print('hello')",
-            "language": "invalid_language"
-        }
-        
-        response = client.post(
-            "/api/v1/submissions",
-            json=request_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 422  # Validation error
-    
-    @patch("src.adapters.api.routers.submissions.PostgresSubmissionRepository")
-    def test_list_submissions(self, mock_repo_class, client, auth_headers):
+    async def test_list_submissions(self, client):
         """Test listing submissions."""
-        mock_repo = AsyncMock()
-        mock_repo.get_user_submissions.return_value = []
-        mock_repo.get_submission_count.return_value = 0
-        mock_repo_class.return_value = mock_repo
+        self._mock_submission_repo.get_user_submissions = coro([])
+        self._mock_submission_repo.get_submission_count = coro(0)
         
-        response = client.get("/api/v1/submissions", headers=auth_headers)
+        response = await client.get("/api/v1/submissions", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "submissions" in data
         assert "total" in data
 
@@ -472,101 +595,81 @@ class TestSubmissionsEndpoints:
 class TestProgressEndpoints:
     """Tests for progress tracking endpoints."""
     
-    @patch("src.adapters.api.routers.progress.PostgresCurriculumRepository")
-    @patch("src.adapters.api.routers.progress.PostgresSubmissionRepository")
-    def test_get_progress_summary(
-        self, mock_submission_repo_class, mock_curriculum_repo_class,
-        client, auth_headers, mock_learning_plan
-    ):
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the progress router's repositories to per-test mocks."""
+        self._mock_curriculum_repo = AsyncMock(spec=CurriculumRepository)
+        self._mock_submission_repo = AsyncMock(spec=SubmissionRepository)
+        _patch_repositories(
+            monkeypatch, "progress",
+            PostgresCurriculumRepository=self._mock_curriculum_repo,
+            PostgresSubmissionRepository=self._mock_submission_repo
+        )
+    
+    async def test_get_progress_summary(self, client, mock_learning_plan):
         """Test getting progress summary."""
-        mock_curriculum_repo = AsyncMock()
-        mock_curriculum_repo.get_active_plan.return_value = mock_learning_plan
-        mock_curriculum_repo_class.return_value = mock_curriculum_repo
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
         
-        mock_submission_repo = AsyncMock()
-        mock_submission_repo.get_user_progress_summary.return_value = {
+        self._mock_submission_repo.get_user_progress_summary = coro({
             "completed_tasks": 5,
             "completed_modules": 1,
             "total_time_minutes": 120,
             "average_score": 85.0
-        }
-        mock_submission_repo_class.return_value = mock_submission_repo
+        })
         
-        response = client.get("/api/v1/progress", headers=auth_headers)
+        response = await client.get("/api/v1/progress", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "overall_progress" in data
         assert "total_tasks" in data
         assert "completed_tasks" in data
     
-    @patch("src.adapters.api.routers.progress.PostgresCurriculumRepository")
-    @patch("src.adapters.api.routers.progress.PostgresSubmissionRepository")
-    def test_get_progress_no_plan(
-        self, mock_submission_repo_class, mock_curriculum_repo_class,
-        client, auth_headers
-    ):
+    async def test_get_progress_no_plan(self, client):
         """Test getting progress when no plan exists."""
-        mock_curriculum_repo = AsyncMock()
-        mock_curriculum_repo.get_active_plan.return_value = None
-        mock_curriculum_repo_class.return_value = mock_curriculum_repo
+        self._mock_curriculum_repo.get_active_plan = coro(None)
         
-        mock_submission_repo = AsyncMock()
-        mock_submission_repo_class.return_value = mock_submission_repo
-        
-        response = client.get("/api/v1/progress", headers=auth_headers)
+        response = await client.get("/api/v1/progress", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["has_active_plan"] is False
     
-    @patch("src.adapters.api.routers.progress.PostgresCurriculumRepository")
-    @patch("src.adapters.api.routers.progress.PostgresSubmissionRepository")
-    def test_get_detailed_progress(
-        self, mock_submission_repo_class, mock_curriculum_repo_class,
-        client, auth_headers, mock_learning_plan
-    ):
+    async def test_get_detailed_progress(self, client, mock_learning_plan):
         """Test getting detailed progress."""
-        mock_curriculum_repo = AsyncMock()
-        mock_curriculum_repo.get_active_plan.return_value = mock_learning_plan
-        mock_curriculum_repo_class.return_value = mock_curriculum_repo
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
         
-        mock_submission_repo = AsyncMock()
-        mock_submission_repo.get_user_progress_summary.return_value = {
+        self._mock_submission_repo.get_user_progress_summary = coro({
             "completed_tasks": 5,
             "completed_modules": 1,
             "total_time_minutes": 120,
             "average_score": 85.0
-        }
-        mock_submission_repo.get_user_submissions.return_value = []
-        mock_submission_repo_class.return_value = mock_submission_repo
+        })
+        self._mock_submission_repo.get_user_submissions = coro([])
         
-        response = client.get("/api/v1/progress/detailed", headers=auth_headers)
+        response = await client.get("/api/v1/progress/detailed", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "summary" in data
         assert "modules" in data
         assert "recommendations" in data
     
-    @patch("src.adapters.api.routers.progress.PostgresSubmissionRepository")
-    def test_get_progress_stats(self, mock_repo_class, client, auth_headers):
+    async def test_get_progress_stats(self, client):
         """Test getting progress statistics."""
-        mock_repo = AsyncMock()
-        mock_repo.get_user_progress_summary.return_value = {
+        self._mock_submission_repo.get_user_progress_summary = coro({
             "total_time_minutes": 300,
             "tasks_this_week": 10,
             "tasks_this_month": 25,
             "days_active": 7,
             "total_tasks": 30,
             "completed_tasks": 15
-        }
-        mock_repo_class.return_value = mock_repo
+        })
         
-        response = client.get("/api/v1/progress/stats", headers=auth_headers)
+        response = await client.get("/api/v1/progress/stats", headers=AUTH_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "total_learning_hours" in data
         assert "completion_rate" in data
 
@@ -574,85 +677,77 @@ class TestProgressEndpoints:
 class TestAPIDocumentation:
     """Tests for API documentation."""
     
-    def test_openapi_schema_available(self, client):
+    async def test_openapi_schema_available(self, client, app):
         """Test that OpenAPI schema is available."""
-        response = client.get("/openapi.json")
+        assert app.openapi_schema is not None  # Warmed by the client fixture
+        
+        response = await client.get("/openapi.json")
         assert response.status_code == 200
-        schema = response.json()
+        schema = _json(response)
         assert "openapi" in schema
         assert "paths" in schema
     
-    def test_docs_endpoint_available(self, client):
+    async def test_docs_endpoint_available(self, client):
         """Test that docs endpoint is available in non-production."""
-        response = client.get("/docs")
+        response = await client.get("/docs")
         # Should redirect or return HTML
         assert response.status_code in [200, 307]
     
-    def test_redoc_endpoint_available(self, client):
+    async def test_redoc_endpoint_available(self, client):
         """Test that ReDoc endpoint is available in non-production."""
-        response = client.get("/redoc")
+        response = await client.get("/redoc")
         assert response.status_code in [200, 307]
 
 
 class TestErrorHandling:
     """Tests for API error handling."""
     
-    def test_invalid_json(self, client, auth_headers):
+    async def test_invalid_json(self, client):
         """Test handling of invalid JSON."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/goals",
             content="invalid json",
-            headers={**auth_headers, "Content-Type": "application/json"}
+            headers=_AUTH_JSON_HEADERS
         )
         assert response.status_code == 422
     
-    def test_missing_required_fields(self, client, auth_headers):
+    async def test_missing_required_fields(self):
         """Test handling of missing required fields."""
-        response = client.post(
-            "/api/v1/goals",
-            json={},  # Missing required fields
-            headers=auth_headers
-        )
-        assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            SetGoalsRequest.model_validate({})  # Missing required fields
     
-    def test_unauthorized_access(self, client):
+    async def test_unauthorized_access(self, client):
         """Test unauthorized access to protected endpoints."""
-        response = client.get("/api/v1/curriculum")
+        response = await client.get("/api/v1/curriculum")
         assert response.status_code == 401
 
 
 class TestPagination:
     """Tests for pagination functionality."""
     
-    @patch("src.adapters.api.routers.tasks.PostgresCurriculumRepository")
-    def test_pagination_params(self, mock_repo_class, client, auth_headers, mock_learning_plan):
-        """Test pagination parameters."""
-        mock_repo = AsyncMock()
-        mock_repo.get_active_plan.return_value = mock_learning_plan
-        mock_repo_class.return_value = mock_repo
-        
-        response = client.get(
-            "/api/v1/tasks?page=1&page_size=10",
-            headers=auth_headers
+    @pytest.fixture(autouse=True)
+    def _patch_repos(self, monkeypatch):
+        """Route the tasks router's repositories to per-test mocks."""
+        self._mock_curriculum_repo = AsyncMock(spec=CurriculumRepository)
+        _patch_repositories(
+            monkeypatch, "tasks",
+            PostgresCurriculumRepository=self._mock_curriculum_repo
         )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["page"] == 1
-        assert data["page_size"] == 10
-    
-    def test_invalid_pagination(self, client, auth_headers):
-        """Test invalid pagination parameters."""
-        response = client.get(
-            "/api/v1/tasks?page=0",  # Invalid page number
-            headers=auth_headers
-        )
-        assert response.status_code == 400
     
-    def test_page_size_limit(self, client, auth_headers):
-        """Test page size limit."""
-        response = client.get(
-            "/api/v1/tasks?page_size=200",  # Exceeds limit
-            headers=auth_headers
-        )
-        assert response.status_code == 400
+    @pytest.mark.parametrize("query,expected_status", [
+        ("page=1&page_size=10", 200),
+        ("page=0", 400),  # Invalid page number
+        ("page_size=200", 400),  # Exceeds limit
+    ], ids=["valid", "invalid_page", "page_size_limit"])
+    async def test_pagination(self, client, mock_learning_plan,
+                              query, expected_status):
+        """Test pagination parameters and their validation."""
+        self._mock_curriculum_repo.get_active_plan = coro(mock_learning_plan)
+        
+        response = await client.get(f"/api/v1/tasks?{query}", headers=AUTH_HEADERS)
+        
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            data = _json(response)
+            assert data["page"] == 1
+            assert data["page_size"] == 10
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 import pytest
 import asyncio
+import itertools
+import time
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
 
 from src.domain.entities.code_execution import (
     CodeExecutionRequest, ExecutionLimits, TestCase, ProgrammingLanguage
@@ -11,43 +13,22 @@ from src.domain.entities.code_execution import (
 from src.domain.services.code_runner import SecureCodeRunner, CodeExecutionError
 
 
-class TestSecureCodeRunner:
-    """Integration tests for SecureCodeRunner."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.code_runner = SecureCodeRunner()
-    
-    @pytest.mark.asyncio
-    async def test_simple_python_execution(self):
-        """Test simple Python code execution."""
-        code = """
+# Requests don't depend on wall-clock time or random ids, so they share one
+# timestamp (naive UTC, like the entity's own default) and get sequential ids
+_FIXED_DT = datetime(2024, 1, 1)
+_request_ids = itertools.count(1)
+
+# Code samples and their test cases are built once and shared by every
+# request that sends them
+_ADD_CODE = """
 def add(a, b):
     return a + b
 
 result = add(2, 3)
 print(result)
 """
-        
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(timeout=5),
-            created_at=datetime.utcnow()
-        )
-        
-        result = await self.code_runner.execute_code(request)
-        
-        assert result.success is True
-        assert "5" in result.output
-        assert len(result.errors) == 0
-    
-    @pytest.mark.asyncio
-    async def test_python_with_test_cases(self):
-        """Test Python code execution with test cases."""
-        code = """
+
+_MULTIPLY_CODE = """
 def multiply(a, b):
     return a * b
 
@@ -55,32 +36,28 @@ def main(input_data):
     a, b = map(int, input_data.split(','))
     return multiply(a, b)
 """
-        
-        test_cases = [
-            TestCase("test_multiply_positive", "3,4", "12"),
-            TestCase("test_multiply_zero", "0,5", "0"),
-            TestCase("test_multiply_negative", "-2,3", "-6")
-        ]
-        
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=test_cases,
-            limits=ExecutionLimits(timeout=10),
-            created_at=datetime.utcnow()
-        )
-        
-        result = await self.code_runner.execute_code(request)
-        
-        assert result.success is True
-        assert len(result.test_results) == 3
-        assert all(test.passed for test in result.test_results)
-    
-    @pytest.mark.asyncio
-    async def test_security_violation_detection(self):
-        """Test that security violations are detected and blocked."""
-        dangerous_code = """
+
+_MULTIPLY_TEST_CASES = (
+    TestCase("test_multiply_positive", "3,4", "12"),
+    TestCase("test_multiply_zero", "0,5", "0"),
+    TestCase("test_multiply_negative", "-2,3", "-6"),
+)
+
+_ADD_MAIN_CODE = """
+def add(a, b):
+    return a + b  # Correct implementation
+
+def main(input_data):
+    a, b = map(int, input_data.split(','))
+    return add(a, b)
+"""
+
+_ADD_TEST_CASES = (
+    TestCase("test_correct", "2,3", "5"),  # Should pass
+    TestCase("test_incorrect", "2,3", "6"),  # Should fail
+)
+
+_DANGEROUS_CODE = """
 import os
 import subprocess
 
@@ -88,85 +65,140 @@ def dangerous_function():
     os.system('rm -rf /')
     subprocess.run(['ls', '-la'])
 """
+
+_SYNTAX_ERROR_CODE = """
+def broken_function(
+    # Missing closing parenthesis and colon
+    return "This won't compile"
+"""
+
+
+def make_request(code, language=ProgrammingLanguage.PYTHON, test_cases=(), **limits):
+    """Build an execution request; keyword arguments become ExecutionLimits."""
+    return CodeExecutionRequest(
+        id=UUID(int=next(_request_ids)),
+        code=code,
+        language=language,
+        test_cases=list(test_cases),
+        limits=ExecutionLimits(**limits),
+        created_at=_FIXED_DT
+    )
+
+
+@pytest.fixture(scope="session")
+def code_runner():
+    """
+    Build one runner for the whole session.
+    
+    The constructor connects to Docker and checks the language images, so
+    the handshake is paid once instead of once per test. Without a reachable
+    daemon every test using the runner is skipped.
+    """
+    runner = SecureCodeRunner()
+    if not runner.is_docker_available():
+        pytest.skip(runner.docker_error_message or "Docker is not available")
+    return runner
+
+
+@pytest.mark.docker
+@pytest.mark.xdist_group("docker")
+class TestSecureCodeRunner:
+    """
+    Integration tests for SecureCodeRunner.
+    
+    The tests run on the session event loop, and under pytest-xdist they stay
+    on one worker so their containers don't compete for the Docker daemon.
+    """
+    
+    @pytest.mark.parametrize("code,language,expected_success,expected_text", [
+        (_ADD_CODE, ProgrammingLanguage.PYTHON, True, "5"),
+        (_SYNTAX_ERROR_CODE, ProgrammingLanguage.PYTHON, False, ""),
+        ("print('hello')", ProgrammingLanguage.JAVA, False, "Unsupported language"),  # Not implemented yet
+    ], ids=["python", "syntax_error", "unsupported_language"])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_single_execution(self, code_runner, code, language,
+                                    expected_success, expected_text):
+        """Test the outcome of code executed without test cases."""
+        request = make_request(code, language, timeout=5)
+        
+        result = await code_runner.execute_code(request)
+        
+        assert result.success is expected_success
+        if expected_success:
+            assert expected_text in result.output
+            assert len(result.errors) == 0
+        else:
+            assert len(result.errors) > 0
+            assert expected_text in result.errors[0]
+    
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_python_with_test_cases(self, code_runner):
+        """Test Python code execution with test cases."""
+        request = make_request(_MULTIPLY_CODE, test_cases=_MULTIPLY_TEST_CASES, timeout=10)
         
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=dangerous_code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(),
-            created_at=datetime.utcnow()
-        )
+        result = await code_runner.execute_code(request)
+        
+        assert result.success is True
+        assert len(result.test_results) == 3
+        assert all(test.passed for test in result.test_results)
+    
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_security_violation_detection(self, code_runner):
+        """Test that security violations are detected and blocked."""
+        request = make_request(_DANGEROUS_CODE)
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
         assert result.success is False
         assert result.status.value == "security_violation"
         assert len(result.security_violations) > 0
         assert any(v.severity == "critical" for v in result.security_violations)
+        # Rejected by static analysis before any container is started
+        assert result.execution_time < 0.1
     
-    @pytest.mark.asyncio
-    async def test_timeout_handling(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_timeout_handling(self, code_runner):
         """Test that code execution respects timeout limits."""
         infinite_loop_code = """
-import time
-
 def infinite_loop():
     while True:
-        time.sleep(0.1)
-        print("Running...")
+        pass
 
 infinite_loop()
 """
         
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=infinite_loop_code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(timeout=2),  # 2 second timeout
-            created_at=datetime.utcnow()
-        )
+        request = make_request(infinite_loop_code, timeout=1)  # 1 second timeout
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
         # Should timeout or be blocked by security validator
         assert result.success is False
         assert result.status.value in ["timeout", "security_violation"]
     
-    @pytest.mark.asyncio
-    async def test_memory_limit_enforcement(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_memory_limit_enforcement(self, code_runner):
         """Test that memory limits are enforced."""
         memory_intensive_code = """
-def memory_hog():
-    # Try to allocate a large amount of memory
-    big_list = [0] * (10**7)  # 10 million integers
-    return len(big_list)
-
-result = memory_hog()
-print(result)
+# One 70MB allocation, past the limit whatever the interpreter overhead
+data = bytearray(70 * 1024 * 1024)
+print(len(data))
 """
         
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=memory_intensive_code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(
-                timeout=10,
-                memory_limit=64 * 1024 * 1024  # 64MB limit
-            ),
-            created_at=datetime.utcnow()
+        request = make_request(
+            memory_intensive_code,
+            timeout=10,
+            memory_limit=64 * 1024 * 1024  # 64MB limit
         )
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
-        # Should either succeed within limits or fail due to memory
-        if not result.success:
-            assert result.status.value in ["memory_exceeded", "failed"]
+        # The container is killed at the limit; the runner reports the
+        # non-zero exit as a failed run
+        assert result.success is False
+        assert result.status.value in ["memory_exceeded", "failed"]
     
-    @pytest.mark.asyncio
-    async def test_javascript_execution(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_javascript_execution(self, code_runner):
         """Test JavaScript code execution."""
         code = """
 function fibonacci(n) {
@@ -177,64 +209,17 @@ function fibonacci(n) {
 console.log(fibonacci(10));
 """
         
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=code,
-            language=ProgrammingLanguage.JAVASCRIPT,
-            test_cases=[],
-            limits=ExecutionLimits(timeout=5),
-            created_at=datetime.utcnow()
-        )
+        request = make_request(code, ProgrammingLanguage.JAVASCRIPT, timeout=5)
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
         # JavaScript execution might not be fully implemented yet
         # This test verifies the request is processed without crashing
         assert result is not None
         assert hasattr(result, 'success')
     
-    @pytest.mark.asyncio
-    async def test_unsupported_language(self):
-        """Test handling of unsupported programming languages."""
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code="print('hello')",
-            language=ProgrammingLanguage.JAVA,  # Not implemented yet
-            test_cases=[],
-            limits=ExecutionLimits(),
-            created_at=datetime.utcnow()
-        )
-        
-        result = await self.code_runner.execute_code(request)
-        
-        assert result.success is False
-        assert "Unsupported language" in result.errors[0]
-    
-    @pytest.mark.asyncio
-    async def test_compilation_error_handling(self):
-        """Test handling of code with syntax errors."""
-        invalid_code = """
-def broken_function(
-    # Missing closing parenthesis and colon
-    return "This won't compile"
-"""
-        
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=invalid_code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(),
-            created_at=datetime.utcnow()
-        )
-        
-        result = await self.code_runner.execute_code(request)
-        
-        assert result.success is False
-        assert len(result.errors) > 0
-    
-    @pytest.mark.asyncio
-    async def test_resource_usage_tracking(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resource_usage_tracking(self, code_runner):
         """Test that resource usage is tracked."""
         code = """
 import time
@@ -253,99 +238,63 @@ print(f"Result: {result}")
 print(f"Time taken: {end_time - start_time:.3f} seconds")
 """
         
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=[],
-            limits=ExecutionLimits(timeout=10),
-            created_at=datetime.utcnow()
-        )
+        request = make_request(code, timeout=10)
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
         if result.success:
             assert result.resource_usage.cpu_time > 0
             assert result.resource_usage.memory_peak > 0
             assert result.execution_time > 0
     
-    def test_get_supported_languages(self):
+    def test_get_supported_languages(self, code_runner):
         """Test getting supported languages."""
-        languages = self.code_runner.get_supported_languages()
+        languages = code_runner.get_supported_languages()
         
         assert isinstance(languages, list)
         assert ProgrammingLanguage.PYTHON in languages
         assert ProgrammingLanguage.JAVASCRIPT in languages
     
-    def test_is_language_supported(self):
+    def test_is_language_supported(self, code_runner):
         """Test checking if languages are supported."""
-        assert self.code_runner.is_language_supported(ProgrammingLanguage.PYTHON) is True
-        assert self.code_runner.is_language_supported(ProgrammingLanguage.JAVASCRIPT) is True
+        assert code_runner.is_language_supported(ProgrammingLanguage.PYTHON) is True
+        assert code_runner.is_language_supported(ProgrammingLanguage.JAVASCRIPT) is True
         # Java and Go might not be implemented yet
-        # assert self.code_runner.is_language_supported(ProgrammingLanguage.JAVA) is False
+        # assert code_runner.is_language_supported(ProgrammingLanguage.JAVA) is False
     
-    @pytest.mark.asyncio
-    async def test_concurrent_executions(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_concurrent_executions(self, code_runner):
         """Test that multiple code executions can run concurrently."""
         code = """
 import time
-time.sleep(1)
+time.sleep(0.2)
 print("Execution completed")
 """
         
-        requests = [
-            CodeExecutionRequest(
-                id=uuid4(),
-                code=code,
-                language=ProgrammingLanguage.PYTHON,
-                test_cases=[],
-                limits=ExecutionLimits(timeout=5),
-                created_at=datetime.utcnow()
-            )
-            for _ in range(3)
-        ]
+        requests = [make_request(code, timeout=5) for _ in range(3)]
         
         # Execute all requests concurrently
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         results = await asyncio.gather(*[
-            self.code_runner.execute_code(request) for request in requests
+            code_runner.execute_code(request) for request in requests
         ])
-        end_time = datetime.utcnow()
+        elapsed = time.perf_counter() - start_time
         
         # All should complete
         assert len(results) == 3
         
-        # Should take less time than sequential execution (less than 3 seconds)
-        execution_time = (end_time - start_time).total_seconds()
-        assert execution_time < 2.5  # Allow some overhead
+        # Overlapping runs finish sooner than the same runs back to back.
+        # Compared against the runs' own durations, so container start-up
+        # time doesn't need a fixed allowance.
+        if all(result.success for result in results):
+            assert elapsed < sum(result.execution_time for result in results)
     
-    @pytest.mark.asyncio
-    async def test_failed_test_cases(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_failed_test_cases(self, code_runner):
         """Test handling of failed test cases."""
-        code = """
-def add(a, b):
-    return a + b  # Correct implementation
-
-def main(input_data):
-    a, b = map(int, input_data.split(','))
-    return add(a, b)
-"""
-        
-        test_cases = [
-            TestCase("test_correct", "2,3", "5"),  # Should pass
-            TestCase("test_incorrect", "2,3", "6"),  # Should fail
-        ]
-        
-        request = CodeExecutionRequest(
-            id=uuid4(),
-            code=code,
-            language=ProgrammingLanguage.PYTHON,
-            test_cases=test_cases,
-            limits=ExecutionLimits(),
-            created_at=datetime.utcnow()
-        )
+        request = make_request(_ADD_MAIN_CODE, test_cases=_ADD_TEST_CASES)
         
-        result = await self.code_runner.execute_code(request)
+        result = await code_runner.execute_code(request)
         
         assert result.success is True  # Code executed successfully
         assert len(result.test_results) == 2
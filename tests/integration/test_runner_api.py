@@ -1,10 +1,15 @@
 """Integration tests for the runner service API."""
 
-import pytest
-from fastapi.testclient import TestClient
+import asyncio
 import sys
+import time
 from pathlib import Path
 
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -12,41 +17,169 @@ sys.path.insert(0, str(project_root))
 from runner_service.app.api import app
 
 
+# Request bodies are serialized once and posted as raw JSON content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_SAFE_CODE_BODY = orjson.dumps({
+    "code": "def add(a, b):\n    return a + b\n\nprint(add(2, 3))",
+    "language": "python",
+    "test_cases": [],
+    "limits": {}
+})
+
+# Trips the static security checks on both /validate and /execute
+_DANGEROUS_CODE_BODY = orjson.dumps({
+    "code": (
+        "import os\nimport subprocess\n"
+        "os.system('rm -rf /')\nsubprocess.run(['ls', '-la'])"
+    ),
+    "language": "python",
+    "test_cases": [],
+    "limits": {}
+})
+
+_SIMPLE_EXEC_BODY = orjson.dumps({
+    "code": "print('Hello, World!')",
+    "language": "python",
+    "test_cases": [],
+    "limits": {
+        "timeout": 5,
+        "memory_limit": 128
+    }
+})
+
+_TEST_CASES_EXEC_BODY = orjson.dumps({
+    "code": """
+def multiply(a, b):
+    return a * b
+
+def main(input_data):
+    a, b = map(int, input_data.split(','))
+    return multiply(a, b)
+""",
+    "language": "python",
+    "test_cases": [
+        {
+            "name": "test_multiply",
+            "input_data": "3,4",
+            "expected_output": "12"
+        }
+    ],
+    "limits": {
+        "timeout": 10
+    }
+})
+
+_INVALID_LANGUAGE_EXEC_BODY = orjson.dumps({
+    "code": "print('hello')",
+    "language": "invalid_language",
+    "test_cases": [],
+    "limits": {}
+})
+
+_EMPTY_CODE_EXEC_BODY = orjson.dumps({
+    "code": "",
+    "language": "python",
+    "test_cases": [],
+    "limits": {}
+})
+
+_INVALID_LIMITS_EXEC_BODY = orjson.dumps({
+    "code": "print('hello')",
+    "language": "python",
+    "test_cases": [],
+    "limits": {
+        "timeout": -1,  # Invalid timeout
+        "memory_limit": 1000000  # Too high
+    }
+})
+
+# A large code string, but within limits
+_LARGE_CODE = "# " + "x" * 1000 + "\nprint('hello')"
+
+_LARGE_CODE_BODY = orjson.dumps({
+    "code": _LARGE_CODE,
+    "language": "python",
+    "test_cases": [],
+    "limits": {}
+})
+
+# Exceeds the 50000 character limit
+_TOO_LARGE_CODE = "# " + "x" * 60000 + "\nprint('hello')"
+
+_TOO_LARGE_CODE_BODY = orjson.dumps({
+    "code": _TOO_LARGE_CODE,
+    "language": "python",
+    "test_cases": [],
+    "limits": {}
+})
+
+_SLEEP_EXEC_BODY = orjson.dumps({
+    "code": "import time\ntime.sleep(0.05)\nprint('done')",
+    "language": "python",
+    "test_cases": [],
+    "limits": {"timeout": 5}
+})
+
+# Fields every /execute response carries, whatever the outcome
+_EXECUTE_KEYS = frozenset({
+    "success", "status", "output", "errors", "test_results",
+    "resource_usage", "security_violations", "execution_time"
+})
+
+
+def _assert_execute_schema(data):
+    """Check that an /execute response body has every expected field."""
+    missing = _EXECUTE_KEYS - data.keys()
+    assert not missing, f"missing fields: {sorted(missing)}"
+
+
+# Every test shares the session event loop with the session-scoped client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    Create an in-process async client shared by the whole session.
+    
+    Requests are dispatched straight to the ASGI app on the test event loop
+    instead of through TestClient's worker thread.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.xdist_group("docker")
 class TestRunnerAPI:
     """Integration tests for the Runner API."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-    
-    def test_root_endpoint(self):
-        """Test the root endpoint."""
-        response = self.client.get("/")
-        
-        assert response.status_code == 200
-        data = response.json()
+    async def test_read_only_endpoints(self, client):
+        """Test the root, health, languages and language validation endpoints."""
+        root, health, languages, supported, unsupported = await asyncio.gather(
+            client.get("/"),
+            client.get("/health"),
+            client.get("/languages"),
+            client.get("/languages/python/validate"),
+            client.get("/languages/cobol/validate")
+        )
+        
+        assert root.status_code == 200
+        data = root.json()
         assert data["service"] == "Secure Code Runner Service"
         assert data["version"] == "1.0.0"
         assert data["status"] == "running"
-    
-    def test_health_endpoint(self):
-        """Test the health check endpoint."""
-        response = self.client.get("/health")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert health.status_code == 200
+        data = health.json()
         assert data["service"] == "code-runner"
         assert data["version"] == "1.0.0"
         assert "status" in data
         assert "docker_available" in data
         assert "supported_languages" in data
-    
-    def test_languages_endpoint(self):
-        """Test the languages endpoint."""
-        response = self.client.get("/languages")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert languages.status_code == 200
+        data = languages.json()
         assert isinstance(data, list)
         
         # Check that we have language information
@@ -55,36 +188,21 @@ class TestRunnerAPI:
             assert "name" in lang_info
             assert "supported" in lang_info
             assert "docker_image" in lang_info
-    
-    def test_language_validation_supported(self):
-        """Test language validation for supported language."""
-        response = self.client.get("/languages/python/validate")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert supported.status_code == 200
+        data = supported.json()
         assert data["language"] == "python"
         assert "supported" in data
-    
-    def test_language_validation_unsupported(self):
-        """Test language validation for unsupported language."""
-        response = self.client.get("/languages/cobol/validate")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert unsupported.status_code == 200
+        data = unsupported.json()
         assert data["language"] == "cobol"
         assert data["supported"] is False
         assert "error" in data
     
-    def test_code_validation_safe(self):
+    async def test_code_validation_safe(self, client):
         """Test code validation for safe code."""
-        request_data = {
-            "code": "def add(a, b):\n    return a + b\n\nprint(add(2, 3))",
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/validate", json=request_data)
+        response = await client.post("/validate", content=_SAFE_CODE_BODY, headers=_JSON_HEADERS)
         
         assert response.status_code == 200
         data = response.json()
@@ -93,16 +211,9 @@ class TestRunnerAPI:
         assert "blocked_imports" in data
         assert isinstance(data["violations"], list)
     
-    def test_code_validation_unsafe(self):
+    async def test_code_validation_unsafe(self, client):
         """Test code validation for unsafe code."""
-        request_data = {
-            "code": "import os\nos.system('rm -rf /')",
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/validate", json=request_data)
+        response = await client.post("/validate", content=_DANGEROUS_CODE_BODY, headers=_JSON_HEADERS)
         
         assert response.status_code == 200
         data = response.json()
@@ -113,203 +224,104 @@ class TestRunnerAPI:
         violations = data["violations"]
         assert any(v["severity"] in ["high", "critical"] for v in violations)
     
-    def test_code_execution_simple(self):
+    async def test_code_execution_simple(self, client):
         """Test simple code execution."""
-        request_data = {
-            "code": "print('Hello, World!')",
-            "language": "python",
-            "test_cases": [],
-            "limits": {
-                "timeout": 5,
-                "memory_limit": 128
-            }
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post("/execute", content=_SIMPLE_EXEC_BODY, headers=_JSON_HEADERS)
         
         # Should return 200 even if execution fails (business logic)
         assert response.status_code == 200
         data = response.json()
         
         # Check response structure
-        assert "success" in data
-        assert "status" in data
-        assert "output" in data
-        assert "errors" in data
-        assert "test_results" in data
-        assert "resource_usage" in data
-        assert "security_violations" in data
-        assert "execution_time" in data
+        _assert_execute_schema(data)
     
-    def test_code_execution_with_test_cases(self):
+    async def test_code_execution_with_test_cases(self, client):
         """Test code execution with test cases."""
-        request_data = {
-            "code": """
-def multiply(a, b):
-    return a * b
-
-def main(input_data):
-    a, b = map(int, input_data.split(','))
-    return multiply(a, b)
-""",
-            "language": "python",
-            "test_cases": [
-                {
-                    "name": "test_multiply",
-                    "input_data": "3,4",
-                    "expected_output": "12"
-                }
-            ],
-            "limits": {
-                "timeout": 10
-            }
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_TEST_CASES_EXEC_BODY, headers=_JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
         
         # Check that test results are included
-        assert "test_results" in data
+        _assert_execute_schema(data)
         if data["success"]:
             assert len(data["test_results"]) == 1
     
-    def test_code_execution_security_violation(self):
+    async def test_code_execution_security_violation(self, client):
         """Test code execution with security violations."""
-        request_data = {
-            "code": "import subprocess\nsubprocess.run(['ls', '-la'])",
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_DANGEROUS_CODE_BODY, headers=_JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
+        _assert_execute_schema(data)
         
         # Should detect security violation
         assert data["success"] is False
         assert data["status"] == "security_violation"
         assert len(data["security_violations"]) > 0
+        # Rejected by static analysis before any container is started
+        assert data["execution_time"] < 0.1
     
-    def test_code_execution_invalid_language(self):
+    async def test_code_execution_invalid_language(self, client):
         """Test code execution with invalid language."""
-        request_data = {
-            "code": "print('hello')",
-            "language": "invalid_language",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_INVALID_LANGUAGE_EXEC_BODY, headers=_JSON_HEADERS
+        )
         
         # Should return 422 for validation error
         assert response.status_code == 422
     
-    def test_code_execution_empty_code(self):
+    async def test_code_execution_empty_code(self, client):
         """Test code execution with empty code."""
-        request_data = {
-            "code": "",
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_EMPTY_CODE_EXEC_BODY, headers=_JSON_HEADERS
+        )
         
         # Should return 422 for validation error
         assert response.status_code == 422
     
-    def test_code_execution_invalid_limits(self):
+    async def test_code_execution_invalid_limits(self, client):
         """Test code execution with invalid limits."""
-        request_data = {
-            "code": "print('hello')",
-            "language": "python",
-            "test_cases": [],
-            "limits": {
-                "timeout": -1,  # Invalid timeout
-                "memory_limit": 1000000  # Too high
-            }
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_INVALID_LIMITS_EXEC_BODY, headers=_JSON_HEADERS
+        )
         
         # Should return 422 for validation error
         assert response.status_code == 422
     
-    def test_code_execution_large_code(self):
+    async def test_code_execution_large_code(self, client):
         """Test code execution with large code input."""
-        # Create a large code string (but within limits)
-        large_code = "# " + "x" * 1000 + "\nprint('hello')"
-        
-        request_data = {
-            "code": large_code,
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post("/execute", content=_LARGE_CODE_BODY, headers=_JSON_HEADERS)
         
         assert response.status_code == 200
         # Should process the request even if it's large
+        _assert_execute_schema(response.json())
     
-    def test_code_execution_too_large_code(self):
+    async def test_code_execution_too_large_code(self, client):
         """Test code execution with code that exceeds size limit."""
-        # Create code that exceeds the 50000 character limit
-        too_large_code = "# " + "x" * 60000 + "\nprint('hello')"
-        
-        request_data = {
-            "code": too_large_code,
-            "language": "python",
-            "test_cases": [],
-            "limits": {}
-        }
-        
-        response = self.client.post("/execute", json=request_data)
+        response = await client.post(
+            "/execute", content=_TOO_LARGE_CODE_BODY, headers=_JSON_HEADERS
+        )
         
         # Should return 422 for validation error
         assert response.status_code == 422
     
-    def test_concurrent_requests(self):
+    async def test_concurrent_requests(self, client):
         """Test handling of concurrent requests."""
-        import threading
-        import time
-        
-        results = []
-        
-        def make_request():
-            request_data = {
-                "code": "import time\ntime.sleep(0.1)\nprint('done')",
-                "language": "python",
-                "test_cases": [],
-                "limits": {"timeout": 5}
-            }
-            response = self.client.post("/execute", json=request_data)
-            results.append(response.status_code)
-        
-        # Create multiple threads
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-        
-        # Start all threads
-        start_time = time.time()
-        for thread in threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        end_time = time.time()
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/execute", content=_SLEEP_EXEC_BODY, headers=_JSON_HEADERS)
+            for _ in range(3)
+        ])
+        end_time = time.perf_counter()
         
         # All requests should complete successfully
-        assert len(results) == 3
-        assert all(status == 200 for status in results)
+        assert len(responses) == 3
+        assert all(response.status_code == 200 for response in responses)
         
         # Should handle concurrent requests efficiently
-        assert end_time - start_time < 2.0  # Should not take too long
\ No newline at end of file
+        assert end_time - start_time < 2.0  # Should not take too long
@@ -0,0 +1,39 @@
+"""
+Unit tests for PostgresCurriculumRepository protocol conformance.
+"""
+import inspect
+from unittest.mock import AsyncMock
+
+from src.adapters.database.repositories.postgres_curriculum_repository import (
+    PostgresCurriculumRepository
+)
+from src.ports.repositories import CurriculumRepository
+
+
+_PROTOCOL_METHODS = [
+    name for name, member in vars(CurriculumRepository).items()
+    if inspect.iscoroutinefunction(member)
+]
+
+
+class TestPostgresCurriculumRepositoryConformance:
+    """The adapter satisfies CurriculumRepository structurally."""
+    
+    def test_is_instance_of_protocol(self):
+        """The runtime-checkable protocol accepts the adapter."""
+        assert isinstance(PostgresCurriculumRepository(AsyncMock()), CurriculumRepository)
+    
+    def test_does_not_inherit_protocol_stubs(self):
+        """No method can fall back to a protocol stub that returns None."""
+        assert CurriculumRepository not in PostgresCurriculumRepository.__mro__
+    
+    def test_implements_every_protocol_method(self):
+        """Each protocol method is an adapter coroutine with the same parameters."""
+        assert _PROTOCOL_METHODS
+        for name in _PROTOCOL_METHODS:
+            implementation = getattr(PostgresCurriculumRepository, name, None)
+            assert inspect.iscoroutinefunction(implementation), name
+            assert (
+                list(inspect.signature(implementation).parameters)
+                == list(inspect.signature(getattr(CurriculumRepository, name)).parameters)
+            ), name
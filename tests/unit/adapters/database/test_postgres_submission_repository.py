@@ -0,0 +1,460 @@
+"""
+Unit tests for PostgresSubmissionRepository query construction.
+"""
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.database.repositories.postgres_submission_repository import (
+    PostgresSubmissionRepository
+)
+from src.ports.repositories.submission_repository import SubmissionCursor
+from src.domain.entities.submission import Submission
+from src.domain.value_objects.enums import SubmissionStatus
+
+
+def _compile(stmt) -> str:
+    """Render a statement as PostgreSQL SQL text."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestPostgresSubmissionRepository:
+    """Test cases for PostgresSubmissionRepository."""
+    
+    @pytest.fixture
+    def session(self):
+        """Create a session mock that records executed statements."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute.return_value = result
+        return session
+    
+    @pytest.fixture
+    def repository(self, session):
+        """Create repository bound to the mock session."""
+        return PostgresSubmissionRepository(session)
+    
+    @pytest.mark.asyncio
+    async def test_date_range_filter_is_pushed_to_storage(self, repository, session):
+        """Date bounds, ordering and pagination are part of the SQL statement."""
+        end = datetime.utcnow()
+        
+        await repository.get_submissions_by_date_range(
+            str(uuid.uuid4()), end - timedelta(days=7), end, limit=20, offset=40
+        )
+        
+        session.execute.assert_awaited_once()
+        sql = _compile(session.execute.await_args.args[0])
+        assert "submissions.user_id =" in sql
+        assert "submissions.submitted_at >=" in sql
+        assert "submissions.submitted_at <=" in sql
+        assert "ORDER BY submissions.submitted_at DESC" in sql
+        assert "LIMIT" in sql
+        assert "OFFSET" in sql
+    
+    @pytest.mark.asyncio
+    async def test_date_range_bounds_are_bound_as_utc(self, repository, session):
+        """Naive and offset-aware bounds are normalized to UTC before binding."""
+        start = datetime(2026, 1, 1, 12, 0)
+        end = datetime(2026, 1, 2, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+        
+        await repository.get_submissions_by_date_range(str(uuid.uuid4()), start, end)
+        
+        params = session.execute.await_args.args[1]
+        bounds = sorted(value for value in params.values() if isinstance(value, datetime))
+        assert bounds == [
+            datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+            datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+        ]
+        assert all(bound.tzinfo is timezone.utc for bound in bounds)
+    
+    @pytest.mark.asyncio
+    async def test_submissions_page_uses_keyset_predicate(self, repository, session):
+        """Pages seek past the cursor instead of skipping rows with OFFSET."""
+        user_id = uuid.uuid4()
+        rows = [
+            MagicMock(
+                id=uuid.uuid4(), task_id=uuid.uuid4(), user_id=user_id,
+                code_content=f"print({i})", repository_url=None,
+                submitted_at=datetime(2026, 1, 1, tzinfo=timezone.utc) - timedelta(minutes=i)
+            )
+            for i in range(3)
+        ]
+        session.execute.return_value.scalars.return_value.all.return_value = rows
+        after = SubmissionCursor(datetime(2026, 1, 2, tzinfo=timezone.utc), str(uuid.uuid4()))
+        
+        page, next_cursor = await repository.get_user_submissions_page(
+            str(user_id), after=after, limit=2
+        )
+        
+        sql = _compile(session.execute.await_args.args[0])
+        assert "(submissions.submitted_at, submissions.id) <" in sql
+        assert "ORDER BY submissions.submitted_at DESC, submissions.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert [s.id for s in page] == [str(row.id) for row in rows[:2]]
+        assert next_cursor == SubmissionCursor(rows[1].submitted_at, str(rows[1].id))
+    
+    @pytest.mark.asyncio
+    async def test_last_submissions_page_has_no_cursor(self, repository, session):
+        """A short page ends pagination."""
+        page, next_cursor = await repository.get_user_submissions_page(str(uuid.uuid4()), limit=20)
+        
+        assert page == []
+        assert next_cursor is None
+    
+    @pytest.mark.asyncio
+    async def test_iter_user_submissions_streams_through_cursor(self, repository, session):
+        """Submissions are yielded from a server-side cursor, not a buffered list."""
+        user_id = uuid.uuid4()
+        rows = [
+            MagicMock(
+                id=uuid.uuid4(), task_id=uuid.uuid4(), user_id=user_id,
+                code_content=f"print({i})", repository_url=None,
+                submitted_at=datetime.utcnow()
+            )
+            for i in range(3)
+        ]
+        
+        async def stream():
+            for row in rows:
+                yield row
+        
+        session.stream_scalars.return_value = stream()
+        
+        streamed = [s async for s in repository.iter_user_submissions(str(user_id), batch_size=50)]
+        
+        assert [s.id for s in streamed] == [str(row.id) for row in rows]
+        stmt = session.stream_scalars.await_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 50
+        assert "ORDER BY submissions.submitted_at DESC" in _compile(stmt)
+        session.execute.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_user_submissions_reuse_prepared_statement(self, repository, session):
+        """Repeated calls execute one shared statement with bound parameters."""
+        user_id = uuid.uuid4()
+        
+        await repository.get_user_submissions(str(user_id), limit=10, offset=0)
+        await repository.get_user_submissions(str(uuid.uuid4()), limit=20, offset=20)
+        
+        (first_stmt, first_params), (second_stmt, second_params) = (
+            call.args for call in session.execute.await_args_list
+        )
+        assert first_stmt is second_stmt
+        assert first_params == {'user_id': user_id, 'limit': 10, 'offset': 0}
+        assert second_params['limit'] == 20
+        assert "submissions.user_id = %(user_id)s" in _compile(first_stmt)
+    
+    @pytest.mark.asyncio
+    async def test_bulk_lookups_issue_single_query(self, repository, session):
+        """Bulk lookups resolve every ID with one statement."""
+        ids = [str(uuid.uuid4()) for _ in range(5)] + ["not-a-uuid"]
+        
+        await repository.get_submissions_bulk(ids)
+        await repository.get_latest_evaluations_bulk(ids)
+        
+        assert session.execute.await_count == 2
+        submissions_sql, evaluations_sql = (
+            _compile(call.args[0]) for call in session.execute.await_args_list
+        )
+        assert "submissions.id IN" in submissions_sql
+        assert "DISTINCT ON (evaluations.submission_id)" in evaluations_sql
+    
+    @pytest.mark.asyncio
+    async def test_hot_reads_reuse_prepared_statements(self, repository, session):
+        """Each hot read executes one shared statement, whatever its arguments."""
+        session.execute.return_value.one_or_none.return_value = None
+        end = datetime.utcnow()
+        after = SubmissionCursor(end, str(uuid.uuid4()))
+        
+        async def read_all():
+            user_id, ids = str(uuid.uuid4()), [str(uuid.uuid4()) for _ in range(3)]
+            await repository.get_submissions_bulk(ids)
+            await repository.get_latest_evaluations_bulk(ids)
+            await repository.get_user_submissions_page(user_id)
+            await repository.get_user_submissions_page(user_id, after=after)
+            await repository.get_submissions_by_date_range(user_id, end - timedelta(days=1), end)
+            await repository.get_task_evaluation_stats(str(uuid.uuid4()))
+            await repository.get_user_progress_summary(user_id)
+        
+        await read_all()
+        await read_all()
+        
+        calls = [call.args for call in session.execute.await_args_list]
+        assert len(calls) == 14
+        assert all(len(args) == 2 for args in calls)
+        statements = [args[0] for args in calls]
+        assert all(stmt is again for stmt, again in zip(statements[:7], statements[7:]))
+        assert len({id(stmt) for stmt in statements}) == 7
+    
+    @pytest.mark.asyncio
+    async def test_bulk_lookups_skip_query_without_valid_ids(self, repository, session):
+        """No statement is executed when no ID parses as a UUID."""
+        assert await repository.get_submissions_bulk(["bad"]) == {}
+        assert await repository.get_latest_evaluations_bulk([]) == {}
+        session.execute.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_task_stats_read_maintained_aggregate(self, repository, session):
+        """Task statistics come from the aggregate row, not a scan over submissions."""
+        task_id = uuid.uuid4()
+        session.execute.return_value.one_or_none.return_value = MagicMock(
+            total_submissions=4, passed_submissions=3, scored_submissions=2,
+            score_sum=150.0, max_score=90.0, min_score=60.0
+        )
+        
+        stats = await repository.get_task_evaluation_stats(str(task_id))
+        
+        stmt, params = session.execute.await_args.args
+        assert params == {'task_id': task_id}
+        assert "FROM task_evaluation_stats" in _compile(stmt)
+        assert "FROM submissions" not in _compile(stmt)
+        assert stats == {
+            'total_submissions': 4,
+            'pass_rate': 75.0,
+            'average_score': 75.0,
+            'max_score': 90.0,
+            'min_score': 60.0
+        }
+    
+    @pytest.mark.asyncio
+    async def test_bulk_save_sends_rows_in_one_statement(self, repository, session):
+        """All submissions are upserted by a single batched INSERT and one commit."""
+        task_id, user_id = str(uuid.uuid4()), str(uuid.uuid4())
+        submissions = [
+            Submission(task_id=task_id, user_id=user_id, code_content=f"print({i})")
+            for i in range(3)
+        ]
+        
+        saved = await repository.save_submissions_bulk(submissions)
+        
+        assert saved == submissions
+        inserts = [
+            call for call in session.execute.await_args_list
+            if "INSERT INTO submissions" in _compile(call.args[0])
+        ]
+        assert len(inserts) == 1
+        assert "ON CONFLICT (id) DO UPDATE" in _compile(inserts[0].args[0])
+        assert len(inserts[0].args[1]) == 3
+        session.commit.assert_awaited_once()
+    
+    @staticmethod
+    def _executed(session):
+        """Compile every statement the session executed, in order."""
+        return [
+            call.args[0].compile(dialect=postgresql.dialect())
+            for call in session.execute.await_args_list
+        ]
+    
+    @staticmethod
+    def _stats_upsert(compiled, table):
+        """Return the single aggregate upsert issued against ``table``."""
+        upserts = [c for c in compiled if str(c).startswith(f"INSERT INTO {table} ")]
+        assert len(upserts) == 1
+        return upserts[0]
+    
+    @pytest.mark.asyncio
+    async def test_new_submission_counts_toward_aggregates(self, repository, session):
+        """A new submission adds one unevaluated outcome to task and user stats."""
+        session.get.return_value = None
+        session.add = MagicMock()
+        submission = Submission(
+            task_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), code_content="print(1)"
+        )
+        
+        await repository.save_submission(submission)
+        
+        compiled = self._executed(session)
+        for table in ("task_evaluation_stats", "user_progress_stats"):
+            params = self._stats_upsert(compiled, table).params
+            assert params['total_submissions'] == 1
+            assert params['total_submissions_1'] == 1
+            assert params['passed_submissions_1'] == 0
+            assert params['scored_submissions_1'] == 0
+        assert not any(str(c).startswith("UPDATE task_evaluation_stats") for c in compiled)
+        session.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_existing_submission_leaves_aggregates_alone(self, repository, session):
+        """Re-saving a known submission does not count it a second time."""
+        session.get.return_value = MagicMock()
+        submission = Submission(
+            task_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), code_content="print(1)"
+        )
+        
+        await repository.save_submission(submission)
+        
+        session.execute.assert_not_awaited()
+        session.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_evaluation_replaces_previous_outcome(self, repository, session):
+        """Saving an evaluation retracts the old outcome, then adds the new one."""
+        task_id, user_id = uuid.uuid4(), uuid.uuid4()
+        submission_model = MagicMock(
+            task_id=task_id, user_id=user_id, status=SubmissionStatus.FAIL, score=40.0
+        )
+        session.get.side_effect = [None, submission_model]
+        session.add = MagicMock()
+        evaluation = MagicMock(
+            id=str(uuid.uuid4()), submission_id=str(uuid.uuid4()),
+            status=SubmissionStatus.PASS, score=90.0, evaluated_at=datetime.utcnow()
+        )
+        evaluation.is_passing.return_value = True
+        repository._evaluation_to_domain = MagicMock(return_value=evaluation)
+        
+        assert await repository.save_evaluation(evaluation) is evaluation
+        
+        compiled = self._executed(session)
+        sql = [str(c) for c in compiled]
+        assert sql[0].startswith("UPDATE submissions SET")
+        
+        retract, add = [c for c in compiled if str(c).startswith("INSERT INTO task_evaluation_stats ")]
+        assert retract.params['passed_submissions_1'] == 0
+        assert retract.params['scored_submissions_1'] == -1
+        assert retract.params['score_sum_1'] == -40.0
+        assert "greatest" not in str(retract)
+        assert add.params['total_submissions_1'] == 0
+        assert add.params['passed_submissions_1'] == 1
+        assert add.params['scored_submissions_1'] == 1
+        assert add.params['score_sum_1'] == 90.0
+        assert "max_score = greatest(task_evaluation_stats.max_score" in str(add)
+        assert "min_score = least(task_evaluation_stats.min_score" in str(add)
+        
+        # The retracted score may have been a bound, so bounds are recomputed
+        # between the retraction and the new outcome being applied
+        recompute = [i for i, s in enumerate(sql) if s.startswith("UPDATE task_evaluation_stats")]
+        assert len(recompute) == 1
+        assert sql.index(str(retract)) < recompute[0] < sql.index(str(add))
+        assert "max(submissions.score)" in sql[recompute[0]]
+        assert "min(submissions.score)" in sql[recompute[0]]
+        session.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_delete_retracts_outcome_after_removing_row(self, repository, session):
+        """The DELETE runs before the retraction so the bounds recompute skips the row."""
+        task_id, user_id = uuid.uuid4(), uuid.uuid4()
+        session.get.return_value = MagicMock(
+            task_id=task_id, user_id=user_id, status=SubmissionStatus.PASS,
+            score=80.0, execution_time_ms=120
+        )
+        session.execute.return_value = MagicMock(rowcount=1)
+        
+        assert await repository.delete_submission(str(uuid.uuid4())) is True
+        
+        compiled = self._executed(session)
+        sql = [str(c) for c in compiled]
+        assert sql[0].startswith("DELETE FROM submissions")
+        
+        task_params = self._stats_upsert(compiled, "task_evaluation_stats").params
+        assert task_params['total_submissions_1'] == -1
+        assert task_params['passed_submissions_1'] == -1
+        assert task_params['scored_submissions_1'] == -1
+        assert task_params['score_sum_1'] == -80.0
+        user_params = self._stats_upsert(compiled, "user_progress_stats").params
+        assert user_params['total_execution_time_ms_1'] == -120
+        
+        assert sql[-1].startswith("UPDATE task_evaluation_stats SET max_score=")
+        assert "min_score=" in sql[-1]
+        session.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_delete_unknown_submission_leaves_aggregates_alone(self, repository, session):
+        """Deleting a missing submission touches neither the table nor the aggregates."""
+        session.get.return_value = None
+        
+        assert await repository.delete_submission(str(uuid.uuid4())) is False
+        
+        session.execute.assert_not_awaited()
+    
+    @staticmethod
+    def _evaluation(submission_id, passed, score):
+        """Build an evaluation stub carrying the fields the repository writes."""
+        evaluation = MagicMock(
+            id=str(uuid.uuid4()), submission_id=str(submission_id),
+            status=SubmissionStatus.PASS if passed else SubmissionStatus.FAIL,
+            score=score, evaluated_at=datetime.utcnow()
+        )
+        evaluation.is_passing.return_value = passed
+        return evaluation
+    
+    @pytest.mark.asyncio
+    async def test_bulk_evaluations_group_aggregate_writes(self, repository, session):
+        """Submission updates and aggregate deltas are batched, not issued per row."""
+        task_id, user_id = uuid.uuid4(), uuid.uuid4()
+        submission_ids = [uuid.uuid4() for _ in range(3)]
+        session.execute.return_value.all.return_value = [
+            MagicMock(id=submission_ids[0], task_id=task_id, user_id=user_id,
+                      status=SubmissionStatus.FAIL, score=None),
+            MagicMock(id=submission_ids[1], task_id=task_id, user_id=user_id,
+                      status=SubmissionStatus.FAIL, score=None),
+            MagicMock(id=submission_ids[2], task_id=task_id, user_id=user_id,
+                      status=SubmissionStatus.PASS, score=70.0),
+        ]
+        evaluations = [
+            self._evaluation(submission_ids[0], True, 90.0),
+            self._evaluation(submission_ids[1], False, 20.0),
+            self._evaluation(submission_ids[2], True, 80.0),
+        ]
+        
+        saved = await repository.save_evaluations_bulk(evaluations)
+        
+        assert saved == evaluations
+        compiled = self._executed(session)
+        sql = [str(c) for c in compiled]
+        assert len(sql) == 6
+        
+        updates = [s for s in sql if s.startswith("UPDATE submissions")]
+        assert len(updates) == 1
+        assert "FROM (VALUES" in updates[0]
+        
+        task_params = self._stats_upsert(compiled, "task_evaluation_stats").params
+        assert task_params['passed_submissions_m0'] == 1
+        assert task_params['scored_submissions_m0'] == 2
+        assert task_params['score_sum_m0'] == 120.0
+        assert task_params['max_score_m0'] == 90.0
+        assert task_params['min_score_m0'] == 20.0
+        user_params = self._stats_upsert(compiled, "user_progress_stats").params
+        assert user_params['passed_submissions_m0'] == 1
+        assert user_params['score_sum_m0'] == 120.0
+        
+        # The replaced 70.0 may have been a bound, so the task is recomputed
+        assert sql[-1].startswith("UPDATE task_evaluation_stats SET max_score=")
+        session.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_evaluations_skip_recompute_without_retracted_scores(
+        self, repository, session
+    ):
+        """Bounds are only widened when no previously stored score is replaced."""
+        submission_id = uuid.uuid4()
+        session.execute.return_value.all.return_value = [
+            MagicMock(id=submission_id, task_id=uuid.uuid4(), user_id=uuid.uuid4(),
+                      status=SubmissionStatus.FAIL, score=None),
+        ]
+        
+        await repository.save_evaluations_bulk([self._evaluation(submission_id, True, 50.0)])
+        
+        sql = [str(c) for c in self._executed(session)]
+        assert not any(s.startswith("UPDATE task_evaluation_stats") for s in sql)
+        task_upsert = next(s for s in sql if s.startswith("INSERT INTO task_evaluation_stats "))
+        assert "max_score = greatest(task_evaluation_stats.max_score, excluded.max_score)" in task_upsert
+        assert "min_score = least(task_evaluation_stats.min_score, excluded.min_score)" in task_upsert
+    
+    @pytest.mark.asyncio
+    async def test_bulk_evaluations_dedupe_repeated_ids(self, repository, session):
+        """A repeated evaluation is upserted once so no row is affected twice."""
+        submission_id = uuid.uuid4()
+        evaluation = self._evaluation(submission_id, True, 50.0)
+        session.execute.return_value.all.return_value = []
+        
+        await repository.save_evaluations_bulk([evaluation, evaluation])
+        
+        upsert = session.execute.await_args_list[0]
+        assert "INSERT INTO evaluations" in _compile(upsert.args[0])
+        assert len(upsert.args[1]) == 1
+        session.commit.assert_awaited_once()
@@ -427,4 +427,16 @@ def very_long_function_that_does_many_things_and_has_a_very_long_name():
         assert result.complexity_score == 0.5
         assert result.difficulty_level == DifficultyLevel.INTERMEDIATE
         assert result.estimated_time_minutes == 30
-        assert "python" in result.topics_covered
\ No newline at end of file
+        assert "python" in result.topics_covered
+    
+    def test_from_dict_round_trip_shares_topic_strings(self, code_analysis_mcp):
+        """Test from_dict restores a result and interns repeated topics."""
+        result = code_analysis_mcp._create_default_analysis_result("print('hello')", "python")
+        
+        first = CodeAnalysisResult.from_dict(result.to_dict())
+        second = CodeAnalysisResult.from_dict(
+            {**result.to_dict(), 'topics_covered': [''.join(t) for t in result.topics_covered]}
+        )
+        
+        assert first == result
+        assert all(a is b for a, b in zip(first.topics_covered, second.topics_covered))
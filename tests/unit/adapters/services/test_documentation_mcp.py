@@ -1,6 +1,8 @@
 """
 Unit tests for DocumentationMCP implementation.
 """
+import asyncio
+import dataclasses
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
@@ -140,6 +142,30 @@ class TestDocumentationMCP:
         # Should give lower score for unknown source
         assert quality_score < 0.8
     
+    @pytest.mark.asyncio
+    async def test_verify_resource_quality_bulk_bounds_concurrency(self, documentation_mcp, sample_resource):
+        """Test bulk verification preserves order and caps in-flight calls."""
+        in_flight = 0
+        peak = 0
+        
+        async def verify(resource):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return len(resource.title) / 100
+        
+        resources = [
+            dataclasses.replace(sample_resource, title="x" * (i + 1)) for i in range(10)
+        ]
+        
+        with patch.object(documentation_mcp, 'verify_resource_quality', side_effect=verify):
+            scores = await documentation_mcp.verify_resource_quality_bulk(resources, max_concurrency=3)
+        
+        assert scores == [(i + 1) / 100 for i in range(10)]
+        assert peak == 3
+    
     @pytest.mark.asyncio
     async def test_get_related_resources(self, documentation_mcp, sample_resource):
         """Test finding related resources."""
@@ -244,6 +270,31 @@ class TestDocumentationMCP:
         # Assert
         assert len(unique) == 2  # Should remove duplicate URL
     
+    @pytest.mark.asyncio
+    async def test_search_cache_returns_typed_resources(self, documentation_mcp, sample_resource):
+        """Cached searches return LearningResource objects without re-searching."""
+        documentation_mcp._search_official_docs = AsyncMock(return_value=[sample_resource])
+        documentation_mcp._search_community_resources = AsyncMock(return_value=[])
+        documentation_mcp._search_code_examples = AsyncMock(return_value=[])
+        
+        first = await documentation_mcp.search_documentation("python functions", "python")
+        second = await documentation_mcp.search_documentation("python functions", "python")
+        
+        assert second == first
+        assert second[0].resource_type is ResourceType.DOCUMENTATION
+        documentation_mcp._search_official_docs.assert_awaited_once()
+    
+    def test_learning_resource_is_immutable_and_hashable(self, sample_resource):
+        """LearningResource is frozen, slotted and usable in sets."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_resource.quality_score = 0.1
+        
+        assert not hasattr(sample_resource, '__dict__')
+        
+        copy = LearningResource.from_dict(sample_resource.to_dict())
+        assert len({sample_resource, copy}) == 1
+        assert dataclasses.replace(sample_resource, quality_score=0.5).quality_score == 0.5
+    
     def test_cache_functionality(self, documentation_mcp):
         """Test caching functionality."""
         key = "test_key"
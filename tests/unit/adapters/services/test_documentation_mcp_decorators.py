@@ -0,0 +1,118 @@
+"""
+Unit tests for the DocumentationMCP decorators.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from src.adapters.services.documentation_mcp_decorators import (
+    CachingDocumentationMCP, SingleFlightDocumentationMCP
+)
+from src.ports.services.mcp_tools import (
+    IDocumentationMCP, LearningResource, ResourceType, DifficultyLevel
+)
+
+
+class TestSingleFlightDocumentationMCP:
+    """Test cases for SingleFlightDocumentationMCP."""
+    
+    @pytest.fixture
+    def sample_resource(self):
+        """Create sample learning resource."""
+        return LearningResource(
+            title="asyncio tutorial",
+            url="https://docs.python.org/3/library/asyncio.html",
+            description="Asynchronous I/O",
+            resource_type=ResourceType.DOCUMENTATION,
+            difficulty_level=DifficultyLevel.INTERMEDIATE,
+            topics=["asyncio"]
+        )
+    
+    @pytest.fixture
+    def delegate(self, sample_resource):
+        """Create a slow mock documentation service."""
+        delegate = AsyncMock(spec=IDocumentationMCP)
+        
+        async def search(query, language=None, max_results=10):
+            await asyncio.sleep(0.01)
+            return [sample_resource]
+        
+        delegate.search_documentation.side_effect = search
+        return delegate
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_call(self, delegate, sample_resource):
+        """Duplicate concurrent searches collapse to one upstream request."""
+        mcp = SingleFlightDocumentationMCP(delegate)
+        
+        results = await asyncio.gather(
+            *(mcp.search_documentation("asyncio tutorial", "python") for _ in range(5))
+        )
+        
+        assert all(result == [sample_resource] for result in results)
+        assert delegate.search_documentation.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_results_cached_until_ttl_expires(self, delegate):
+        """Sequential repeats are served from the cache until the TTL passes."""
+        now = [0.0]
+        mcp = SingleFlightDocumentationMCP(delegate, cache_ttl_seconds=300, clock=lambda: now[0])
+        
+        await mcp.search_documentation("asyncio tutorial")
+        await mcp.search_documentation("asyncio tutorial")
+        await mcp.search_documentation("asyncio tutorial", max_results=5)
+        assert delegate.search_documentation.await_count == 2
+        
+        now[0] = 301.0
+        await mcp.search_documentation("asyncio tutorial")
+        assert delegate.search_documentation.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_failures_and_empty_results_are_not_cached(self, delegate):
+        """Errors reach every waiter and are retried on the next call."""
+        delegate.search_documentation.side_effect = [RuntimeError("upstream down"), []]
+        mcp = SingleFlightDocumentationMCP(delegate)
+        
+        with pytest.raises(RuntimeError):
+            await mcp.search_documentation("asyncio tutorial")
+        assert await mcp.search_documentation("asyncio tutorial") == []
+        assert delegate.search_documentation.await_count == 2
+
+
+class TestCachingDocumentationMCP:
+    """Test cases for CachingDocumentationMCP."""
+    
+    @pytest.fixture
+    def delegate(self):
+        """Create a mock documentation service serving page content."""
+        delegate = AsyncMock(spec=IDocumentationMCP)
+        delegate.get_resource_content.return_value = "<h1>asyncio</h1>" * 100
+        return delegate
+    
+    @pytest.mark.asyncio
+    async def test_repeated_urls_served_from_cache(self, delegate):
+        """A warm URL returns identical content without refetching."""
+        mcp = CachingDocumentationMCP(delegate)
+        url = "https://docs.python.org/3/library/asyncio.html"
+        
+        first = await mcp.get_resource_content(url)
+        second = await mcp.get_resource_content(url)
+        
+        assert first == second == "<h1>asyncio</h1>" * 100
+        delegate.get_resource_content.assert_awaited_once_with(url)
+    
+    @pytest.mark.asyncio
+    async def test_missing_and_expired_content_is_refetched(self, delegate):
+        """None results are not cached and entries expire after the TTL."""
+        now = [0.0]
+        mcp = CachingDocumentationMCP(delegate, cache_ttl_seconds=60, clock=lambda: now[0])
+        delegate.get_resource_content.side_effect = [None, "page", "page"]
+        
+        assert await mcp.get_resource_content("https://example.com") is None
+        assert await mcp.get_resource_content("https://example.com") == "page"
+        assert await mcp.get_resource_content("https://example.com") == "page"
+        assert delegate.get_resource_content.await_count == 2
+        
+        now[0] = 61.0
+        await mcp.get_resource_content("https://example.com")
+        assert delegate.get_resource_content.await_count == 3
@@ -231,6 +231,52 @@ class TestProgressTracker:
         
         assert result.success is True
         assert result.data["day_offset"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_enrich_tasks_with_status_uses_one_bulk_lookup(
+        self, progress_tracker, mock_submission_repository, sample_learning_plan
+    ):
+        """Test that task statuses come from a single bulk evaluation lookup."""
+        passed_task, failed_task, untried_task = sample_learning_plan.modules[0].tasks[:3]
+        
+        def submit(task):
+            return Submission(task_id=task.id, user_id="test-user-123", code_content="x = 1")
+        
+        def evaluate(submission, passed, score):
+            return EvaluationResult(
+                submission_id=submission.id, passed=passed, score=score,
+                feedback={}, execution_time=0.5
+            )
+        
+        first_try, second_try = submit(passed_task), submit(passed_task)
+        failed_try, unevaluated_try = submit(failed_task), submit(failed_task)
+        submissions = {
+            passed_task.id: [first_try, second_try],
+            failed_task.id: [failed_try, unevaluated_try],
+            untried_task.id: []
+        }
+        mock_submission_repository.get_task_submissions.side_effect = (
+            lambda task_id, user_id: submissions[task_id]
+        )
+        mock_submission_repository.get_latest_evaluations_bulk.return_value = {
+            first_try.id: evaluate(first_try, False, 40.0),
+            second_try.id: evaluate(second_try, True, 85.0),
+            failed_try.id: evaluate(failed_try, False, 30.0)
+        }
+        
+        enriched = await progress_tracker._enrich_tasks_with_status(
+            "test-user-123", [passed_task, failed_task, untried_task], sample_learning_plan
+        )
+        
+        mock_submission_repository.get_latest_evaluations_bulk.assert_awaited_once_with(
+            [first_try.id, second_try.id, failed_try.id, unevaluated_try.id]
+        )
+        assert [info.task_id for info in enriched] == [passed_task.id, failed_task.id, untried_task.id]
+        assert [(info.is_completed, info.attempts, info.best_score) for info in enriched] == [
+            (True, 2, 85.0),
+            (False, 2, 30.0),
+            (False, 0, None)
+        ]
 
     # ==================== Record Attempt Tests ====================
     
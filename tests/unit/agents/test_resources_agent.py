@@ -2,6 +2,7 @@
 Unit tests for ResourcesAgent.
 """
 import pytest
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock
 
 from src.agents.resources_agent import ResourcesAgent
@@ -21,6 +22,13 @@ class TestResourcesAgent:
     def mock_documentation_mcp(self):
         """Create mock documentation MCP."""
         mock = AsyncMock(spec=IDocumentationMCP)
+        
+        async def verify_bulk(resources, max_concurrency=8, return_exceptions=False):
+            return await IDocumentationMCP.verify_resource_quality_bulk(
+                mock, resources, max_concurrency, return_exceptions
+            )
+        
+        mock.verify_resource_quality_bulk.side_effect = verify_bulk
         return mock
     
     @pytest.fixture
@@ -519,6 +527,23 @@ class TestResourcesAgent:
         # At least try to get different types if available
         assert len(set(types)) >= 1
     
+    @pytest.mark.asyncio
+    async def test_enhance_metadata_falls_back_per_resource(self, resources_agent, mock_documentation_mcp,
+                                                           learning_context, sample_resources):
+        """Test that one failed verification only defaults that resource's score."""
+        # Arrange
+        unscored = [replace(resource, quality_score=0.0) for resource in sample_resources]
+        mock_documentation_mcp.verify_resource_quality.side_effect = [
+            0.8, RuntimeError("verification failed"), 0.6
+        ]
+        
+        # Act
+        enhanced = await resources_agent._enhance_resources_metadata(unscored, learning_context)
+        
+        # Assert
+        assert [resource.quality_score for resource in enhanced] == [0.8, 0.5, 0.6]
+        assert mock_documentation_mcp.verify_resource_quality.await_count == 3
+    
     def test_process_resource_content(self, resources_agent):
         """Test resource content processing."""
         context = LearningContext(
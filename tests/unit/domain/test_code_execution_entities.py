@@ -7,7 +7,7 @@ from uuid import uuid4
 from src.domain.entities.code_execution import (
     CodeExecutionRequest, CodeExecutionResult, ExecutionStatus,
     TestCase, TestResult, ResourceUsage, ExecutionLimits,
-    SecurityViolation, ProgrammingLanguage, LanguageConfig
+    SecurityViolation, ProgrammingLanguage, LanguageConfig, Severity
 )
 
 
@@ -52,13 +52,13 @@ class TestCodeExecutionEntities:
             pattern=r"\beval\s*\(",
             line_number=5,
             description="Use of eval() function",
-            severity="critical"
+            severity=Severity.CRITICAL
         )
         
         assert violation.pattern == r"\beval\s*\("
         assert violation.line_number == 5
         assert violation.description == "Use of eval() function"
-        assert violation.severity == "critical"
+        assert violation.severity is Severity.CRITICAL
     
     def test_resource_usage_creation(self):
         """Test ResourceUsage entity creation."""
@@ -155,7 +155,7 @@ class TestCodeExecutionEntities:
         
         resource_usage = ResourceUsage(1.0, 1024, 512, 100, 50)
         violations = [
-            SecurityViolation("pattern1", 1, "Description1", "medium")
+            SecurityViolation("pattern1", 1, "Description1", Severity.MEDIUM)
         ]
         
         result = CodeExecutionResult(
@@ -248,9 +248,9 @@ class TestCodeExecutionEntities:
     def test_code_execution_result_security_violations_properties(self):
         """Test CodeExecutionResult security violation properties."""
         violations = [
-            SecurityViolation("pattern1", 1, "Medium issue", "medium"),
-            SecurityViolation("pattern2", 2, "Critical issue", "critical"),
-            SecurityViolation("pattern3", 3, "Low issue", "low")
+            SecurityViolation("pattern1", 1, "Medium issue", Severity.MEDIUM),
+            SecurityViolation("pattern2", 2, "Critical issue", Severity.CRITICAL),
+            SecurityViolation("pattern3", 3, "Low issue", Severity.LOW)
         ]
         
         result = CodeExecutionResult(
@@ -308,4 +308,12 @@ class TestCodeExecutionEntities:
         assert ExecutionStatus.TIMEOUT == "timeout"
         assert ExecutionStatus.MEMORY_EXCEEDED == "memory_exceeded"
         assert ExecutionStatus.SECURITY_VIOLATION == "security_violation"
-        assert ExecutionStatus.COMPILATION_ERROR == "compilation_error"
\ No newline at end of file
+        assert ExecutionStatus.COMPILATION_ERROR == "compilation_error"
+    
+    def test_severity_enum(self):
+        """Test Severity enum values and ordering."""
+        assert Severity.LOW == "low"
+        assert Severity.MEDIUM == "medium"
+        assert Severity.HIGH == "high"
+        assert Severity.CRITICAL == "critical"
+        assert Severity.LOW.level < Severity.MEDIUM.level < Severity.HIGH.level < Severity.CRITICAL.level
@@ -0,0 +1,53 @@
+"""Tests for the columnar SubmissionsBatch value object."""
+
+import math
+from datetime import datetime, timezone
+
+from src.domain.value_objects import SubmissionStatus, SubmissionsBatch
+from src.domain.value_objects.submissions_batch import STATUS_CODES
+
+
+class TestSubmissionsBatch:
+    """Test cases for SubmissionsBatch."""
+    
+    def test_from_records_splits_rows_into_typed_columns(self):
+        """Rows become typed arrays, with NaN and 0 for missing values."""
+        submitted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        batch = SubmissionsBatch.from_records([
+            (90.0, SubmissionStatus.PASS, 120, submitted_at),
+            (None, SubmissionStatus.FAIL, None, submitted_at),
+        ])
+        
+        assert len(batch) == 2
+        assert batch.scores.typecode == 'f'
+        assert batch.scores[0] == 90.0
+        assert math.isnan(batch.scores[1])
+        assert list(batch.statuses) == [
+            STATUS_CODES[SubmissionStatus.PASS], STATUS_CODES[SubmissionStatus.FAIL]
+        ]
+        assert list(batch.execution_times_ms) == [120, 0]
+        assert list(batch.submitted_at) == [submitted_at.timestamp()] * 2
+    
+    def test_aggregates(self):
+        """Reductions ignore unscored rows and match the summary semantics."""
+        now = datetime.now(timezone.utc)
+        batch = SubmissionsBatch.from_records([
+            (80.0, SubmissionStatus.PASS, 100, now),
+            (60.0, SubmissionStatus.PARTIAL, 50, now),
+            (None, SubmissionStatus.FAIL, None, now),
+            (100.0, SubmissionStatus.PASS, 25, now),
+        ])
+        
+        assert batch.passed_count == 2
+        assert batch.pass_rate == 0.5
+        assert batch.average_score == 80.0
+        assert batch.total_execution_time_ms == 175
+    
+    def test_empty_batch(self):
+        """An empty batch reports zeroes instead of dividing by zero."""
+        batch = SubmissionsBatch()
+        
+        assert len(batch) == 0
+        assert batch.pass_rate == 0.0
+        assert batch.average_score == 0.0
+        assert batch.total_execution_time_ms == 0
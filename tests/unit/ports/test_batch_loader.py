@@ -0,0 +1,59 @@
+"""Tests for the repository batch loader."""
+
+import asyncio
+
+import pytest
+
+from src.ports.repositories import BatchLoader
+
+
+class TestBatchLoader:
+    """Test cases for BatchLoader."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_coalesced(self):
+        """Loads issued in the same tick are resolved by one batch call."""
+        calls = []
+        
+        async def fetch(keys):
+            calls.append(list(keys))
+            return {key: key.upper() for key in keys if key != "missing"}
+        
+        loader = BatchLoader(fetch)
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing")
+        )
+        
+        assert results == ["A", "B", "A", None]
+        assert calls == [["a", "b", "missing"]]
+    
+    @pytest.mark.asyncio
+    async def test_load_many_respects_max_batch_size(self):
+        """load_many preserves key order and splits oversized batches."""
+        calls = []
+        
+        async def fetch(keys):
+            calls.append(len(keys))
+            return {key: key * 2 for key in keys}
+        
+        loader = BatchLoader(fetch, max_batch_size=2)
+        
+        assert await loader.load_many([3, 1, 2]) == [6, 2, 4]
+        assert calls == [2, 1]
+        assert await loader.load_many([]) == []
+    
+    @pytest.mark.asyncio
+    async def test_batch_errors_propagate_to_every_caller(self):
+        """A failing batch call fails every pending load."""
+        async def fetch(keys):
+            raise RuntimeError("database unavailable")
+        
+        loader = BatchLoader(fetch)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    def test_invalid_batch_size_rejected(self):
+        """max_batch_size must be positive."""
+        with pytest.raises(ValueError):
+            BatchLoader(lambda keys: keys, max_batch_size=0)
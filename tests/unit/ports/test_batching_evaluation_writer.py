@@ -0,0 +1,100 @@
+"""Tests for the batching evaluation writer."""
+
+import asyncio
+
+import pytest
+
+from src.domain.entities import EvaluationResult
+from src.ports.repositories import BatchingEvaluationWriter, RepositoryError
+
+
+def _evaluation(index: int) -> EvaluationResult:
+    """Create a minimal evaluation result."""
+    return EvaluationResult(
+        submission_id=f"submission-{index}",
+        passed=True,
+        score=90.0,
+        feedback={},
+        execution_time=0.1
+    )
+
+
+class TestBatchingEvaluationWriter:
+    """Test cases for BatchingEvaluationWriter."""
+    
+    @pytest.mark.asyncio
+    async def test_burst_is_written_in_batches(self):
+        """Concurrent saves share writes bounded by max_batch_size."""
+        batches = []
+        
+        async def save_batch(evaluations):
+            batches.append(len(evaluations))
+            return list(evaluations)
+        
+        writer = BatchingEvaluationWriter(save_batch, max_batch_size=4, max_delay=0.05)
+        evaluations = [_evaluation(i) for i in range(10)]
+        
+        saved = await asyncio.gather(*(writer.save_evaluation(e) for e in evaluations))
+        await writer.close()
+        
+        assert saved == evaluations
+        assert batches == [4, 4, 2]
+    
+    @pytest.mark.asyncio
+    async def test_failed_write_reaches_every_caller(self):
+        """A failing batch raises in each waiting save, and later saves retry."""
+        calls = []
+        
+        async def save_batch(evaluations):
+            calls.append(len(evaluations))
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return list(evaluations)
+        
+        writer = BatchingEvaluationWriter(save_batch, max_delay=0.01)
+        
+        results = await asyncio.gather(
+            writer.save_evaluation(_evaluation(1)),
+            writer.save_evaluation(_evaluation(2)),
+            return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        
+        retried = _evaluation(3)
+        assert await writer.save_evaluation(retried) is retried
+        await writer.close()
+        assert calls == [2, 1]
+    
+    @pytest.mark.asyncio
+    async def test_short_batch_result_fails_unmatched_callers(self):
+        """Callers without a saved result get an error instead of hanging."""
+        async def save_batch(evaluations):
+            return list(evaluations)[:1]
+        
+        writer = BatchingEvaluationWriter(save_batch, max_delay=0.01)
+        first, second = _evaluation(1), _evaluation(2)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                writer.save_evaluation(first),
+                writer.save_evaluation(second),
+                return_exceptions=True
+            ),
+            timeout=1
+        )
+        await writer.close()
+        
+        assert results[0] is first
+        assert isinstance(results[1], RepositoryError)
+    
+    @pytest.mark.asyncio
+    async def test_closed_writer_rejects_saves(self):
+        """Saves after close() fail instead of hanging."""
+        async def save_batch(evaluations):
+            return list(evaluations)
+        
+        writer = BatchingEvaluationWriter(save_batch)
+        await writer.close()
+        
+        with pytest.raises(RuntimeError):
+            await writer.save_evaluation(_evaluation(1))
@@ -0,0 +1,88 @@
+"""Tests for the write-through caching user repository."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.domain.entities import UserProfile
+from src.domain.value_objects import SkillLevel
+from src.ports.repositories import CachingUserRepository, UserRepository
+
+
+class TestCachingUserRepository:
+    """Test cases for CachingUserRepository."""
+    
+    @pytest.fixture
+    def profile(self):
+        """Create a sample user profile."""
+        return UserProfile(
+            user_id="user-123",
+            skill_level=SkillLevel.INTERMEDIATE,
+            learning_goals=["Python"],
+            time_constraints={"hours_per_week": 5},
+            preferences={}
+        )
+    
+    @pytest.fixture
+    def delegate(self, profile):
+        """Create a mock backing repository."""
+        delegate = AsyncMock(spec=UserRepository)
+        delegate.get_user_profile.return_value = profile
+        delegate.get_user_profile_by_email.return_value = profile
+        return delegate
+    
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_cache(self, delegate, profile):
+        """Repeated reads hit the store once; an email hit also primes the ID key."""
+        repository = CachingUserRepository(delegate)
+        
+        assert await repository.get_user_profile_by_email(" User@Example.com ") is profile
+        assert await repository.get_user_profile_by_email("user@example.com") == profile
+        assert await repository.get_user_profile("user-123") == profile
+        
+        assert delegate.get_user_profile_by_email.await_count == 1
+        delegate.get_user_profile.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_every_key(self, delegate, profile):
+        """Writes go to the store and evict both the ID and email entries."""
+        repository = CachingUserRepository(delegate)
+        await repository.get_user_profile_by_email("user@example.com")
+        
+        await repository.update_skill_level("user-123", SkillLevel.ADVANCED)
+        await repository.get_user_profile("user-123")
+        await repository.get_user_profile_by_email("user@example.com")
+        
+        delegate.update_skill_level.assert_awaited_once_with("user-123", SkillLevel.ADVANCED)
+        assert delegate.get_user_profile.await_count == 1
+        assert delegate.get_user_profile_by_email.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cached_profiles(self, delegate):
+        """Each read gets its own copy, so edits never leak into the cache."""
+        repository = CachingUserRepository(delegate)
+        
+        loaded = await repository.get_user_profile("user-123")
+        loaded.learning_goals.append("Rust")
+        first = await repository.get_user_profile("user-123")
+        first.learning_goals.append("Go")
+        second = await repository.get_user_profile("user-123")
+        
+        assert second is not first
+        assert second.learning_goals == ["Python"]
+        assert delegate.get_user_profile.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_misses_are_not_cached(self, delegate):
+        """Entries expire after the TTL and None results are never stored."""
+        now = [0.0]
+        repository = CachingUserRepository(delegate, ttl=10, clock=lambda: now[0])
+        
+        await repository.get_user_profile("user-123")
+        now[0] = 11.0
+        await repository.get_user_profile("user-123")
+        assert delegate.get_user_profile.await_count == 2
+        
+        delegate.get_user_profile.return_value = None
+        assert await repository.get_user_profile("missing") is None
+        assert await repository.get_user_profile("missing") is None
+        assert delegate.get_user_profile.await_count == 4
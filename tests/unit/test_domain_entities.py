@@ -254,4 +254,17 @@ class TestEvaluationResult:
         )
         
         assert passing_eval.is_passing() is True
-        assert failing_eval.is_passing() is False
\ No newline at end of file
+        assert failing_eval.is_passing() is False
+
+
+class TestSubmissionStatus:
+    """Test cases for SubmissionStatus storage codes."""
+    
+    def test_int_codes_round_trip(self):
+        """Every status maps to a distinct small code and back."""
+        codes = {status.to_int() for status in SubmissionStatus}
+        
+        assert SubmissionStatus.FAIL.to_int() == 0
+        assert codes == {0, 1, 2}
+        for status in SubmissionStatus:
+            assert SubmissionStatus.from_int(status.to_int()) is status